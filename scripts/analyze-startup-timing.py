@@ -1,10 +1,593 @@
 #!/usr/bin/env python3
 """
 WPF Application Startup Timing Analysis for WileyWidget
-Analyzes current startup sequence and provides optimization recommendations
+
+Measures real startup timing by launching the application (or replaying
+recorded Serilog logs), splitting the timestamped startup log lines into
+per-phase durations and comparing mean / median / p95 against a stored baseline.
+
+Usage:
+    python scripts/analyze-startup-timing.py --runs 10 --warmup 1
+    python scripts/analyze-startup-timing.py --log logs/startup-20251018.log
+    python scripts/analyze-startup-timing.py --log tests/fixtures/startup-timing.log --save-baseline
+    python scripts/analyze-startup-timing.py --trace logs/startup.json --collapsed startup.folded
+    python scripts/analyze-startup-timing.py --static   # legacy source checks
 """
 
+import argparse
+import json
+import math
+import queue
+import re
+import shlex
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
 from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+DEFAULT_BASELINE_PATH = Path(__file__).parent / "startup-timing-baseline.json"
+DEFAULT_COMMAND = "dotnet run --project WileyWidget.csproj --no-build"
+
+# Both Serilog sinks configured in Program.cs / App.xaml.cs, plus the appsettings file sinks ("zzz"):
+#   file:    2025-10-18 09:14:02.113 [INF] HOST 4120:1 Context Message
+#   file:    2025-10-18 09:14:02.113 +00:00 [INF] HOST 4120:1 Context Message
+#   console: [09:14:02.113] [INF] 4120:1 Context Message
+LOG_LINE = re.compile(
+    r"^\[?(?:(?P<date>\d{4}-\d{2}-\d{2})[ T])?(?P<time>\d{2}:\d{2}:\d{2}\.\d{3})"
+    r"(?:\s(?P<offset>[+-]\d{2}:\d{2}))?\]?\s+"
+    r"\[(?P<level>[A-Z]{3})\]\s+(?P<message>.*)$"
+)
+# Enricher columns ahead of the message: "[MachineName ]ProcessId:ThreadId SourceContext "
+# (the appsettings templates add an often empty {CorrelationId}, leaving a second space)
+ENRICHMENT_PREFIX = re.compile(r"^(?:[\w.-]+ )?\d+:\d+ (?:[\w.`+<>]+)? *")
+# App.LogStartupTiming: "{Message} completed in {Ms}ms"
+EXPLICIT_TIMING = re.compile(r"(?P<name>[\w .:-]+?) completed in (?P<ms>\d+(?:\.\d+)?)\s*ms")
+
+SESSION_START = "=== WileyWidget Application Startup"
+# Any of these ends a startup run; the first one seen wins.
+STARTUP_COMPLETE = ("Application initialization completed successfully", "Application startup completed")
+
+# (phase, start marker, end marker) in startup order, matched as substrings of the message.
+STARTUP_PHASES = (
+    ("bootstrap", SESSION_START, "Bootstrap test PASSED"),
+    ("syncfusion_license", "Registering Syncfusion license", "Syncfusion license registered"),
+    ("di_registration", "=== Starting DI Container Registration ===", "=== DI Container Registration Complete ==="),
+    ("module_catalog", "=== Configuring Prism Module Catalog", "Auto-discovery completed"),
+    ("module_initialization", "Modules initializing...", "Modules initialized."),
+    ("module_validation", "=== Validating Module Initialization", "=== Module Validation Complete ==="),
+    ("shell", "Modules initialized.", "MainWindow shell resolved successfully"),
+)
+TOTAL_PHASE = "total"
+
+# Span markers for trace reconstruction; an end marker may list alternatives for
+# branches that log differently. Nesting comes from marker order: a span opened
+# while another is open becomes its child. Stops are applied before starts, so one
+# message can close a span and open its successor.
+TRACE_SPANS = (
+    ("bootstrap", "Bootstrap logger created successfully", "Bootstrap test PASSED"),
+    ("constructor", "Starting WileyWidget application with proper STA threading model",
+     "Global exception handling configured"),
+    ("OnStartup", "Global exception handling configured", "Application startup completed"),
+    ("key_vault_license", "Checking for Syncfusion license in local key vault",
+     ("Registering Syncfusion license", "Syncfusion license key not configured")),
+    ("syncfusion_license", "Registering Syncfusion license", "Syncfusion license registered"),
+    ("di_container_build", "=== Starting DI Container Registration ===", "=== DI Container Registration Complete ==="),
+    ("key_vault_secrets", "✓ Registered core infrastructure services", "✓ Registered IMemoryCache"),
+    ("module_catalog", "=== Configuring Prism Module Catalog", "Auto-discovery completed"),
+    ("module_initialization", "Modules initializing...", "Modules initialized."),
+    ("shell", "Modules initialized.", "MainWindow shell resolved successfully"),
+    ("module_validation", "=== Validating Module Initialization", "=== Module Validation Complete ==="),
+)
+TRACE_END = "Application startup completed"
+TRACE_ROOT = "startup"
+
+# EventSource activity events as exported by PerfView ("Event Name,Time MSec,...") or
+# a plain "<msec> Provider/Task/Start ThreadID=n" text dump.
+EVENTPIPE_CSV = re.compile(
+    r"^(?P<event>[\w.-]+(?:/[\w.-]+)*)/(?P<op>Start|Stop),\s*(?P<ms>\d+(?:\.\d+)?)(?P<rest>.*)$"
+)
+EVENTPIPE_TEXT = re.compile(
+    r"^(?P<ms>\d+(?:\.\d+)?)\s+(?P<event>[\w.-]+(?:/[\w.-]+)*)/(?P<op>Start|Stop)\b(?P<rest>.*)$"
+)
+EVENTPIPE_THREAD = re.compile(r"ThreadID=\"?(?P<thread>[\d,]+)")
+TEMPLATE_HOLE = re.compile(r"\{[@$]?(?P<name>\w+)(?:[,:][^}]*)?\}")
+
+def parse_log_line(line: str) -> tuple[float, str, str] | None:
+    """Return (timestamp seconds, level, message) for a Serilog line, or None."""
+    match = LOG_LINE.match(line.strip())
+    if not match:
+        return None
+    clock = match.group("time")
+    if match.group("date") and match.group("offset"):
+        stamp = datetime.strptime(f"{match.group('date')} {clock} {match.group('offset')}",
+                                  "%Y-%m-%d %H:%M:%S.%f %z").timestamp()
+    elif match.group("date"):
+        stamp = datetime.strptime(f"{match.group('date')} {clock}", "%Y-%m-%d %H:%M:%S.%f").timestamp()
+    else:
+        hours, minutes, seconds = clock.split(":")
+        stamp = int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+    return stamp, match.group("level"), ENRICHMENT_PREFIX.sub("", match.group("message"), count=1)
+
+
+@dataclass
+class StartupRun:
+    """Per-phase durations (milliseconds) for a single application start"""
+    phases: dict[str, float] = field(default_factory=dict)
+    complete: bool = False
+
+
+class StartupLogParser:
+    """Incrementally turns startup log lines into StartupRun records.
+
+    Lines are fed one at a time so the same parser serves a live process's
+    stdout and recorded log files. A new session marker starts a new run, which
+    lets a single rolling log file hold many starts.
+    """
+
+    def __init__(self):
+        self._reset()
+        self._completed = False
+
+    def _reset(self):
+        self._run: StartupRun | None = None
+        self._first: float | None = None
+        self._last: float = 0.0
+        self._open: dict[str, float] = {}
+        self._day_offset = 0.0
+
+    def feed(self, line: str) -> StartupRun | None:
+        """Consume one line, returning a run when its completion marker is seen."""
+        parsed = parse_log_line(line)
+        if parsed is None:
+            return None
+        stamp, _, message = parsed
+
+        if SESSION_START in message or (self._run is None and not self._completed):
+            self._reset()
+            self._run = StartupRun()
+            self._first = stamp
+        elif self._run is None:
+            # Post-startup lines of a finished run; wait for the next session.
+            return None
+        # Time-only console stamps wrap at midnight.
+        stamp += self._day_offset
+        if stamp < self._last - 43200:
+            self._day_offset += 86400
+            stamp += 86400
+        self._last = stamp
+
+        run = self._run
+        for phase, start_marker, end_marker in STARTUP_PHASES:
+            if phase in self._open and end_marker in message:
+                run.phases[phase] = round((stamp - self._open.pop(phase)) * 1000, 3)
+            elif start_marker in message and phase not in run.phases:
+                self._open[phase] = stamp
+
+        explicit = EXPLICIT_TIMING.search(message)
+        if explicit:
+            run.phases[explicit.group("name").strip()] = float(explicit.group("ms"))
+
+        if any(marker in message for marker in STARTUP_COMPLETE):
+            run.phases[TOTAL_PHASE] = round((stamp - self._first) * 1000, 3)
+            run.complete = True
+            self._run = None
+            self._completed = True
+            return run
+        return None
+
+    def parse(self, lines: Iterable[str]) -> Iterator[StartupRun]:
+        """Yield every completed run found in a stream of lines."""
+        for line in lines:
+            run = self.feed(line)
+            if run is not None:
+                yield run
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Linear-interpolated percentile of a non-empty list"""
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    lower, upper = math.floor(rank), math.ceil(rank)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+@dataclass
+class PhaseStats:
+    """Aggregated duration statistics for one startup phase"""
+    phase: str
+    runs: int
+    mean_ms: float
+    median_ms: float
+    p95_ms: float
+    min_ms: float
+    max_ms: float
+
+
+@dataclass
+class StartupRegression:
+    """A phase statistic that moved past the allowed threshold versus the baseline"""
+    phase: str
+    metric: str
+    baseline: float
+    current: float
+    change_pct: float
+
+
+def summarize_runs(runs: list[StartupRun]) -> list[PhaseStats]:
+    """Compute per-phase statistics across runs, in startup order"""
+    order = [phase for phase, _, _ in STARTUP_PHASES]
+    samples: dict[str, list[float]] = {}
+    for run in runs:
+        for phase, duration in run.phases.items():
+            samples.setdefault(phase, []).append(duration)
+            if phase not in order and phase != TOTAL_PHASE:
+                order.append(phase)
+    order.append(TOTAL_PHASE)
+
+    return [
+        PhaseStats(phase, len(values), statistics.fmean(values), statistics.median(values),
+                   percentile(values, 95), min(values), max(values))
+        for phase in order if (values := samples.get(phase))
+    ]
+
+
+def save_baseline(stats: list[PhaseStats], path: Path) -> None:
+    """Persist phase statistics as the new baseline"""
+    payload = {
+        "generated": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "phases": {item.phase: asdict(item) for item in stats},
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+
+def load_baseline(path: Path) -> dict[str, dict[str, Any]]:
+    """Load a stored baseline, returning an empty mapping when none exists"""
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8")).get("phases", {})
+
+
+def compare_to_baseline(stats: list[PhaseStats], baseline: dict[str, dict[str, Any]],
+                        threshold: float = 0.20, min_delta_ms: float = 25.0) -> list[StartupRegression]:
+    """Flag phases whose median or p95 grew past the threshold"""
+    regressions = []
+    for item in stats:
+        previous = baseline.get(item.phase)
+        if not previous:
+            continue
+        for metric in ("median_ms", "p95_ms"):
+            base, current = float(previous.get(metric, 0.0)), getattr(item, metric)
+            delta = current - base
+            # Small absolute changes are scheduler noise, not regressions.
+            if base > 0 and delta > min_delta_ms and delta > base * threshold:
+                regressions.append(StartupRegression(item.phase, metric, base, current, delta / base * 100))
+    return regressions
+
+
+def _terminate(process: subprocess.Popen) -> None:
+    """Stop the launched process and any children (dotnet run spawns the app)"""
+    try:
+        import psutil
+        children = psutil.Process(process.pid).children(recursive=True)
+    except Exception:
+        children = []
+    for child in children:
+        try:
+            child.kill()
+        except Exception:
+            pass
+    if process.poll() is None:
+        process.kill()
+    process.wait()
+
+
+class StartupProfiler:
+    """Launches the application repeatedly and parses its console log output"""
+
+    def __init__(self, command: list[str], timeout: float = 120.0, cwd: Path | None = None):
+        self.command = command
+        self.timeout = timeout
+        self.cwd = cwd
+
+    def run_once(self) -> StartupRun | None:
+        """Start the app, wait for the startup-complete marker, then stop it"""
+        parser = StartupLogParser()
+        process = subprocess.Popen(self.command, cwd=self.cwd, stdout=subprocess.PIPE,
+                                   stderr=subprocess.STDOUT, text=True, encoding="utf-8", errors="replace")
+        lines: queue.Queue[str | None] = queue.Queue()
+
+        def pump():
+            for line in process.stdout:
+                lines.put(line)
+            lines.put(None)
+
+        threading.Thread(target=pump, daemon=True).start()
+        deadline = time.monotonic() + self.timeout
+        try:
+            while (remaining := deadline - time.monotonic()) > 0:
+                try:
+                    line = lines.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if line is None:
+                    break
+                run = parser.feed(line)
+                if run is not None:
+                    return run
+            return None
+        finally:
+            _terminate(process)
+
+    def measure(self, runs: int, warmup: int = 0) -> list[StartupRun]:
+        """Collect completed runs, discarding warmup starts"""
+        results = []
+        for index in range(warmup + runs):
+            label = f"warmup {index + 1}/{warmup}" if index < warmup else f"run {index - warmup + 1}/{runs}"
+            run = self.run_once()
+            if run is None:
+                print(f"⚠️  {label}: startup did not complete within {self.timeout:.0f}s")
+                continue
+            print(f"   {label}: {run.phases[TOTAL_PHASE]:.0f}ms")
+            if index >= warmup:
+                results.append(run)
+        return results
+
+
+def replay_logs(paths: list[Path]) -> list[StartupRun]:
+    """Parse recorded log files; every completed session counts as one run"""
+    runs = []
+    for path in paths:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            runs.extend(StartupLogParser().parse(f))
+    return runs
+
+
+@dataclass
+class TraceEvent:
+    """A normalized trace record: a span boundary, a known-duration span or a session marker"""
+    stamp: float
+    kind: str  # "session", "start", "stop", "duration" or "end"
+    name: str = ""
+    thread: int = 0
+    duration_ms: float = 0.0
+
+
+@dataclass
+class Span:
+    """A node of the reconstructed startup span tree"""
+    name: str
+    start: float
+    end: float | None = None
+    children: list["Span"] = field(default_factory=list)
+
+    @property
+    def duration_ms(self) -> float:
+        return max(0.0, ((self.end if self.end is not None else self.start) - self.start) * 1000)
+
+    @property
+    def self_ms(self) -> float:
+        return max(0.0, self.duration_ms - sum(child.duration_ms for child in self.children))
+
+
+def _render_template(template: str, properties: dict[str, Any]) -> str:
+    """Render a Serilog message template the way {Prop:l} would (no quoting)"""
+    return TEMPLATE_HOLE.sub(lambda m: str(properties.get(m.group("name"), m.group(0))), template)
+
+
+def _parse_json_event(line: str) -> tuple[float, str] | None:
+    """Return (timestamp, message) for a compact (CLEF) or classic Serilog JSON event"""
+    try:
+        record = json.loads(line)
+    except ValueError:
+        return None
+    if not isinstance(record, dict):
+        return None
+    stamp = record.get("@t") or record.get("Timestamp")
+    if not stamp:
+        return None
+    message = record.get("@m") or record.get("RenderedMessage")
+    if message is None:
+        properties = record.get("Properties", record)
+        message = _render_template(record.get("@mt") or record.get("MessageTemplate") or "", properties)
+    return datetime.fromisoformat(stamp).timestamp(), message
+
+
+def _message_events(stamp: float, message: str) -> Iterator[TraceEvent]:
+    """Translate one log message into trace events via the span markers"""
+    if SESSION_START in message:
+        yield TraceEvent(stamp, "session")
+        return
+    for name, _, end_marker in TRACE_SPANS:
+        if any(marker in message for marker in
+               ((end_marker,) if isinstance(end_marker, str) else end_marker)):
+            yield TraceEvent(stamp, "stop", name)
+    for name, start_marker, _ in TRACE_SPANS:
+        if start_marker in message:
+            yield TraceEvent(stamp, "start", name)
+    explicit = EXPLICIT_TIMING.search(message)
+    if explicit:
+        yield TraceEvent(stamp, "duration", explicit.group("name").strip(),
+                         duration_ms=float(explicit.group("ms")))
+    if TRACE_END in message:
+        yield TraceEvent(stamp, "end")
+
+
+def iter_trace_events(lines: Iterable[str]) -> Iterator[TraceEvent]:
+    """Stream trace events from Serilog text/JSON lines or EventPipe activity exports.
+
+    The format is sniffed per line, so nothing beyond the current line is held in
+    memory and mixed captures (console + EventPipe dump) still parse.
+    """
+    for line in lines:
+        stripped = line.strip()
+        if not stripped:
+            continue
+        if stripped.startswith("{"):
+            parsed = _parse_json_event(stripped)
+            if parsed:
+                yield from _message_events(*parsed)
+            continue
+        text = parse_log_line(stripped)
+        if text:
+            yield from _message_events(text[0], text[2])
+            continue
+        activity = EVENTPIPE_CSV.match(stripped) or EVENTPIPE_TEXT.match(stripped)
+        if activity:
+            thread = EVENTPIPE_THREAD.search(activity.group("rest"))
+            yield TraceEvent(
+                float(activity.group("ms")) / 1000,
+                "start" if activity.group("op") == "Start" else "stop",
+                activity.group("event").rsplit("/", 1)[-1],
+                int(thread.group("thread").replace(",", "")) if thread else 0,
+            )
+
+
+class SpanTreeBuilder:
+    """Reconstructs one span tree per startup session from a stream of trace events.
+
+    Every thread gets its own stack under the shared session root. Stops close any
+    spans left open above the matching start, and spans still open when a session
+    ends are closed at the last timestamp seen.
+    """
+
+    def __init__(self):
+        self._root: Span | None = None
+        self._stacks: dict[int, list[Span]] = {}
+        self._last = 0.0
+        self._ended = False
+
+    def _close(self, stamp: float) -> Span:
+        root = self._root
+        for stack in self._stacks.values():
+            for span in stack:
+                if span.end is None:
+                    span.end = stamp
+        root.end = stamp if root.end is None else root.end
+        self._root, self._stacks = None, {}
+        return root
+
+    def feed(self, event: TraceEvent) -> Span | None:
+        """Consume one event, returning a finished session tree when one completes"""
+        finished = None
+        if event.kind == "session":
+            if self._root is not None:
+                finished = self._close(self._last)
+            self._root, self._ended = Span(TRACE_ROOT, event.stamp), False
+        elif self._ended:
+            return None
+        elif self._root is None:
+            self._root = Span(TRACE_ROOT, event.stamp if event.kind != "duration"
+                              else event.stamp - event.duration_ms / 1000)
+        self._last = event.stamp
+        stack = self._stacks.setdefault(event.thread, [self._root])
+
+        if event.kind == "start":
+            span = Span(event.name, event.stamp)
+            stack[-1].children.append(span)
+            stack.append(span)
+        elif event.kind == "stop":
+            for depth in range(len(stack) - 1, 0, -1):
+                if stack[depth].name == event.name:
+                    for span in stack[depth:]:
+                        span.end = event.stamp
+                    del stack[depth:]
+                    break
+        elif event.kind == "duration":
+            stack[-1].children.append(Span(event.name, event.stamp - event.duration_ms / 1000, event.stamp))
+        elif event.kind == "end":
+            self._ended = True
+            return self._close(event.stamp)
+        return finished
+
+    def finish(self) -> Span | None:
+        """Close and return the session still in progress at end of input"""
+        return self._close(self._last) if self._root is not None else None
+
+    def build(self, events: Iterable[TraceEvent]) -> Iterator[Span]:
+        """Yield a span tree for every session in the event stream"""
+        for event in events:
+            tree = self.feed(event)
+            if tree is not None:
+                yield tree
+        tree = self.finish()
+        if tree is not None:
+            yield tree
+
+
+class CollapsedStackAggregator:
+    """Folds span trees into "root;child;leaf <microseconds>" collapsed stacks.
+
+    Weights are self time, so flame graph widths add up to each span's duration.
+    Only the folded totals are retained; trees can be discarded after add().
+    """
+
+    def __init__(self):
+        self.totals: dict[str, float] = {}
+        self.runs = 0
+
+    def add(self, root: Span) -> None:
+        self.runs += 1
+        pending = [(root, root.name.replace(";", ":"))]
+        while pending:
+            span, stack = pending.pop()
+            self.totals[stack] = self.totals.get(stack, 0.0) + span.self_ms * 1000
+            pending.extend((child, f"{stack};{child.name.replace(';', ':')}") for child in span.children)
+
+    def lines(self, average: bool = False) -> list[str]:
+        divisor = self.runs if average and self.runs else 1
+        return [f"{stack} {round(micros / divisor)}" for stack, micros in sorted(self.totals.items())
+                if round(micros / divisor) > 0]
+
+    def write(self, path: Path, average: bool = False) -> None:
+        path.write_text("\n".join(self.lines(average)) + "\n", encoding="utf-8")
+
+
+def aggregate_traces(paths: list[Path]) -> tuple[CollapsedStackAggregator, Span | None]:
+    """Stream trace files into collapsed stacks, returning the last tree for display"""
+    aggregator, last = CollapsedStackAggregator(), None
+    for path in paths:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            for tree in SpanTreeBuilder().build(iter_trace_events(f)):
+                aggregator.add(tree)
+                last = tree
+    return aggregator, last
+
+
+def format_span_tree(span: Span, depth: int = 0) -> list[str]:
+    """Render a span tree as indented lines with total and self time"""
+    lines = [f"{'  ' * depth}{span.name:<{40 - 2 * depth}} {span.duration_ms:>9.1f}ms  (self {span.self_ms:.1f}ms)"]
+    for child in span.children:
+        lines.extend(format_span_tree(child, depth + 1))
+    return lines
+
+
+def print_stats(stats: list[PhaseStats], regressions: list[StartupRegression],
+                baseline: dict[str, dict[str, Any]]) -> None:
+    """Print the per-phase timing table and any regressions"""
+    print("\n📊 STARTUP PHASE TIMING (ms):")
+    print("-" * 78)
+    print(f"{'Phase':<28}{'Runs':>5}{'Mean':>9}{'Median':>9}{'P95':>9}{'Base P50':>10}{'Δ':>8}")
+    for item in stats:
+        base = baseline.get(item.phase, {}).get("median_ms")
+        change = f"{(item.median_ms - base) / base * 100:+.0f}%" if base else "-"
+        base_text = f"{base:.0f}" if base else "-"
+        print(f"{item.phase:<28}{item.runs:>5}{item.mean_ms:>9.0f}{item.median_ms:>9.0f}"
+              f"{item.p95_ms:>9.0f}{base_text:>10}{change:>8}")
+
+    if regressions:
+        print("\n❌ REGRESSIONS:")
+        for regression in regressions:
+            print(f"   {regression.phase} {regression.metric}: {regression.baseline:.0f}ms -> "
+                  f"{regression.current:.0f}ms ({regression.change_pct:+.0f}%)")
+    elif baseline:
+        print("\n✅ No regressions against baseline")
+
 
 def analyze_startup_timing():
     """Analyze the current startup timing and identify issues"""
@@ -189,7 +772,7 @@ public partial class App : Application
 
     print(optimized_code)
 
-def main():
+def run_static_report():
     analyze_startup_timing()
     recommend_optimizations()
     generate_optimized_startup_code()
@@ -202,5 +785,79 @@ def main():
     print("🛡️  Better Error Handling: Graceful fallbacks")
     print("🔄 Improved UX: Splash screen + background loading")
 
+def run_trace_report(args) -> int:
+    """Aggregate startup traces, print the latest span tree and write collapsed stacks"""
+    aggregator, last = aggregate_traces(args.trace)
+    if last is None:
+        print("❌ No startup sessions found in trace input")
+        return 1
+    print(f"\n🌲 SPAN TREE (last of {aggregator.runs} run(s)):")
+    print("\n".join(format_span_tree(last)))
+    if args.collapsed:
+        aggregator.write(args.collapsed, average=args.average)
+        print(f"\n🔥 Collapsed stacks written to {args.collapsed} (flamegraph.pl / speedscope)")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure WileyWidget startup phases from Serilog output")
+    parser.add_argument("--command", default=DEFAULT_COMMAND,
+                        help=f"Command that launches the app (default: {DEFAULT_COMMAND!r})")
+    parser.add_argument("--runs", type=int, default=5, help="Measured application starts")
+    parser.add_argument("--warmup", type=int, default=1, help="Unmeasured starts before the runs")
+    parser.add_argument("--timeout", type=float, default=120.0,
+                        help="Seconds to wait for the startup-complete marker per run")
+    parser.add_argument("--log", action="append", type=Path,
+                        help="Replay recorded log file(s) instead of launching the app")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE_PATH,
+                        help="Baseline JSON to compare against (and write with --save-baseline)")
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.20,
+                        help="Allowed fractional growth of median/p95 before flagging a regression")
+    parser.add_argument("--json", type=Path, help="Also write the phase statistics to this JSON file")
+    parser.add_argument("--trace", action="append", type=Path,
+                        help="Build span trees from Serilog text/JSON or EventPipe export file(s)")
+    parser.add_argument("--collapsed", type=Path,
+                        help="With --trace, write collapsed stacks (self time in µs) for flame graphs")
+    parser.add_argument("--average", action="store_true",
+                        help="With --collapsed, divide stack weights by the number of runs")
+    parser.add_argument("--static", action="store_true",
+                        help="Print the legacy source-based checks and recommendations")
+    args = parser.parse_args()
+
+    if args.static:
+        run_static_report()
+        return 0
+
+    print("🔍 WPF Application Startup Timing")
+    print("=" * 50)
+    if args.trace:
+        return run_trace_report(args)
+    if args.log:
+        runs = replay_logs(args.log)
+    else:
+        print(f"Launching: {args.command} ({args.warmup} warmup, {args.runs} runs)")
+        profiler = StartupProfiler(shlex.split(args.command, posix=sys.platform != "win32"),
+                                   timeout=args.timeout, cwd=Path(__file__).parent.parent)
+        runs = profiler.measure(args.runs, args.warmup)
+
+    if not runs:
+        print("❌ No completed startup runs found")
+        return 1
+
+    stats = summarize_runs(runs)
+    baseline = load_baseline(args.baseline)
+    regressions = compare_to_baseline(stats, baseline, args.threshold)
+    print_stats(stats, regressions, baseline)
+
+    if args.json:
+        args.json.write_text(json.dumps([asdict(item) for item in stats], indent=2), encoding="utf-8")
+    if args.save_baseline:
+        save_baseline(stats, args.baseline)
+        print(f"\n💾 Baseline saved to {args.baseline}")
+        return 0
+    return 1 if regressions else 0
+
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Cobertura Coverage Parser for WileyWidget
+Streams coverage.cobertura.xml with iterparse and aggregates line and branch
+coverage per package, class and source file in a single pass.
+
+Coverlet writes every line twice (under <method><lines> and under the class's
+own <lines>), and nested/compiler-generated classes can report the same source
+line again. Only class-level lines are counted, de-duplicated by (file, line);
+a line is covered if any class covered it.
+
+Usage:
+    python scripts/cobertura.py TestResults/coverage.cobertura.xml --previous baseline.json --save baseline.json
+"""
+
+import argparse
+import json
+import re
+import sys
+import xml.etree.ElementTree as ET
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+CONDITION_COVERAGE = re.compile(r"\((\d+)/(\d+)\)")
+
+
+@dataclass
+class CoverageCounts:
+    """Line and branch counters for one scope"""
+
+    lines_valid: int = 0
+    lines_covered: int = 0
+    branches_valid: int = 0
+    branches_covered: int = 0
+
+    @property
+    def line_percent(self) -> float:
+        return self.lines_covered / self.lines_valid * 100 if self.lines_valid else 0.0
+
+    @property
+    def branch_percent(self) -> float:
+        return self.branches_covered / self.branches_valid * 100 if self.branches_valid else 0.0
+
+    def add(self, covered: bool, branches_covered: int, branches_valid: int):
+        self.lines_valid += 1
+        self.lines_covered += covered
+        self.branches_valid += branches_valid
+        self.branches_covered += branches_covered
+
+
+@dataclass
+class CoverageReport:
+    """Aggregated coverage of one Cobertura file"""
+
+    total: CoverageCounts = field(default_factory=CoverageCounts)
+    packages: dict[str, CoverageCounts] = field(default_factory=dict)
+    classes: dict[str, CoverageCounts] = field(default_factory=dict)
+    files: dict[str, CoverageCounts] = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'CoverageReport':
+        def scope(entries):
+            return {name: CoverageCounts(**counts) for name, counts in entries.items()}
+
+        return cls(CoverageCounts(**data['total']), scope(data['packages']),
+                   scope(data['classes']), scope(data['files']))
+
+    def save(self, path: Path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2), encoding='utf-8')
+
+
+@dataclass
+class CoverageDelta:
+    """Change in line coverage of one scope between two reports"""
+
+    scope: str
+    name: str
+    before: float | None
+    after: float | None
+
+    @property
+    def delta(self) -> float:
+        return (self.after or 0.0) - (self.before or 0.0)
+
+
+def parse_cobertura(xml_file: Path) -> CoverageReport:
+    """Stream a Cobertura file into per-package/class/file coverage.
+
+    Elements are cleared as soon as their class has been read, so memory grows
+    with the number of distinct source lines, not with the size of the XML.
+    """
+    # (file, line number) -> [covered, branches covered, branches valid, package, class]
+    lines = {}
+    package = cls = filename = None
+    method_depth = 0
+
+    for event, elem in ET.iterparse(str(xml_file), events=('start', 'end')):
+        tag = elem.tag
+        if event == 'start':
+            if tag == 'package':
+                package = elem.get('name', '')
+            elif tag == 'class':
+                cls, filename = elem.get('name', ''), elem.get('filename', '')
+            elif tag == 'method':
+                method_depth += 1
+            continue
+
+        if tag == 'line' and not method_depth and cls is not None:
+            key = (filename, int(elem.get('number', 0)))
+            covered = int(elem.get('hits', '0') or 0) > 0
+            branches_covered = branches_valid = 0
+            if elem.get('branch', '').lower() == 'true':
+                match = CONDITION_COVERAGE.search(elem.get('condition-coverage', ''))
+                if match:
+                    branches_covered, branches_valid = int(match.group(1)), int(match.group(2))
+            entry = lines.get(key)
+            if entry is None:
+                lines[key] = [covered, branches_covered, branches_valid, package, cls]
+            else:
+                entry[0] = entry[0] or covered
+                entry[1] = max(entry[1], branches_covered)
+                entry[2] = max(entry[2], branches_valid)
+        elif tag == 'method':
+            method_depth -= 1
+        elif tag == 'class':
+            cls = filename = None
+            elem.clear()
+        elif tag == 'package':
+            elem.clear()
+
+    report = CoverageReport()
+    for (filename, _), (covered, branches_covered, branches_valid, package, cls) in lines.items():
+        for scope, name in ((report.packages, package), (report.classes, cls), (report.files, filename)):
+            counts = scope.get(name)
+            if counts is None:
+                counts = scope[name] = CoverageCounts()
+            counts.add(covered, branches_covered, branches_valid)
+        report.total.add(covered, branches_covered, branches_valid)
+    return report
+
+
+def load_report(path: Path) -> CoverageReport:
+    """Load a saved JSON summary or parse a Cobertura XML file"""
+    path = Path(path)
+    if path.suffix == '.json':
+        return CoverageReport.from_dict(json.loads(path.read_text(encoding='utf-8')))
+    return parse_cobertura(path)
+
+
+def diff_reports(previous: CoverageReport, current: CoverageReport, threshold: float = 0.0) -> list[CoverageDelta]:
+    """Line-coverage changes larger than threshold (percentage points), worst first"""
+    deltas = []
+    if abs(current.total.line_percent - previous.total.line_percent) > threshold:
+        deltas.append(CoverageDelta('total', '', previous.total.line_percent, current.total.line_percent))
+    for scope in ('packages', 'files'):
+        before, after = getattr(previous, scope), getattr(current, scope)
+        for name in sorted(before.keys() | after.keys()):
+            old = before[name].line_percent if name in before else None
+            new = after[name].line_percent if name in after else None
+            if old is None or new is None or abs(new - old) > threshold:
+                deltas.append(CoverageDelta(scope[:-1], name, old, new))
+    return sorted(deltas, key=lambda item: item.delta)
+
+
+def format_report(report: CoverageReport, top: int = 10) -> list[str]:
+    """Summary lines: totals, then the least covered files"""
+    total = report.total
+    lines = [f"Line coverage: {total.line_percent:.1f}% ({total.lines_covered}/{total.lines_valid})",
+             f"Branch coverage: {total.branch_percent:.1f}% ({total.branches_covered}/{total.branches_valid})"]
+    worst = sorted(report.files.items(), key=lambda item: (item[1].line_percent, -item[1].lines_valid))[:top]
+    if worst:
+        lines.append(f"Least covered files (top {len(worst)}):")
+        lines.extend(f"  {counts.line_percent:5.1f}%  {counts.lines_covered:5}/{counts.lines_valid:<5}  {name}"
+                     for name, counts in worst)
+    return lines
+
+
+def format_diff(deltas: list[CoverageDelta]) -> list[str]:
+    def percent(value):
+        return 'n/a' if value is None else f"{value:.1f}%"
+
+    return [f"  {item.delta:+6.1f}  {item.scope:7} {item.name or '(all)'}: {percent(item.before)} -> {percent(item.after)}"
+            for item in deltas]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarize and diff Cobertura coverage")
+    parser.add_argument("coverage", type=Path, help="coverage.cobertura.xml")
+    parser.add_argument("--previous", type=Path, help="Previous report (.json summary or Cobertura XML)")
+    parser.add_argument("--save", type=Path, help="Write the JSON summary for later diffs")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="Ignore changes smaller than this many percentage points (default: 0.1)")
+    parser.add_argument("--top", type=int, default=10, help="Number of least covered files to list")
+    args = parser.parse_args()
+
+    if not args.coverage.exists():
+        print(f"Coverage file not found: {args.coverage}")
+        return 1
+
+    report = parse_cobertura(args.coverage)
+    for line in format_report(report, args.top):
+        print(line)
+
+    if args.previous:
+        deltas = diff_reports(load_report(args.previous), report, args.threshold)
+        print(f"\nChanges vs {args.previous}: {len(deltas)}")
+        for line in format_diff(deltas):
+            print(line)
+
+    if args.save:
+        report.save(args.save)
+        print(f"\nSummary saved to {args.save}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
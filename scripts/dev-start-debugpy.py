@@ -2,20 +2,39 @@
 """
 Wiley Widget Development Startup Script with debugpy Remote Debugging
 This version includes debugpy for advanced debugging capabilities
+
+Benchmark mode (--runs N --warmup K) repeats cleanup, build and start with
+perf_counter_ns timing, child-process CPU time and peak RSS, and writes the
+per-phase percentiles for cold and warm runs to a JSON results file.
 """
 
 import argparse
+import hashlib
+import json
 import logging
+import logging.handlers
+import math
 import os
+import platform
 import signal
+import statistics
 import subprocess
+import sys
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
 # Import debugpy for remote debugging
 import debugpy
 
+try:
+    import psutil
+except ImportError:  # Only the --runs benchmark mode needs psutil
+    psutil = None
+
 # Configure logging to file under /logs directory
 LOG_DIR = Path("logs")
 LOG_DIR.mkdir(parents=True, exist_ok=True)
@@ -34,6 +53,12 @@ logger = logging.getLogger(__name__)
 
 DEBUG_BREAKS_ENABLED = False
 
+# Log lines that mark the end of application startup (see App.xaml.cs)
+READY_MARKERS = ("Application initialization completed successfully", "Application startup completed")
+# Log lines that mark the first window becoming visible
+WINDOW_MARKERS = ("MainWindow shown", "MainWindow shell resolved successfully")
+APP_OUTPUT_LOG = LOG_DIR / "app-output.log"
+
 
 def maybe_debug_breakpoint():
     """Trigger a debugpy breakpoint only when explicitly enabled."""
@@ -167,12 +192,157 @@ def cleanup_dotnet_artifacts():
             print(f"  ℹ️  {dir_name}/ not found")
             logger.info("%s/ not found", dir_name)
 
-def build_application(incremental=True):
+class BuildFingerprint:
+    """Persisted fingerprint of the build inputs used to skip no-op builds.
+
+    Inputs are *.cs, *.xaml, *.csproj and Directory.*.props files. A check is a
+    parallel os.scandir stat walk compared against the stored (size, mtime_ns)
+    manifest; only files whose stat changed are hashed, so touched-but-unchanged
+    files do not force a build. The manifest lives under obj/, so artifact cleanup
+    invalidates it together with the build outputs.
+    """
+
+    VERSION = 1
+    INPUT_SUFFIXES = ('.cs', '.xaml', '.csproj')
+    PRUNED_DIRS = frozenset({'.git', '.vs', '.venv', 'venv', 'bin', 'obj', 'node_modules',
+                             'TestResults', '__pycache__', 'logs'})
+
+    def __init__(self, root='.', manifest_path=None, workers=8):
+        self.root = Path(root)
+        self.manifest_path = Path(manifest_path or self.root / 'obj' / 'dev-start-build-fingerprint.json')
+        self.workers = workers
+
+    @classmethod
+    def is_input(cls, name):
+        return name.endswith(cls.INPUT_SUFFIXES) or (
+            name.startswith('Directory.') and name.endswith(('.props', '.targets')))
+
+    def _walk(self, directory):
+        """Stat every build input below one directory"""
+        found = {}
+        pending = [directory]
+        while pending:
+            try:
+                entries = os.scandir(pending.pop())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in self.PRUNED_DIRS:
+                            pending.append(entry.path)
+                    elif self.is_input(entry.name):
+                        stat = entry.stat()
+                        found[os.path.relpath(entry.path, self.root).replace(os.sep, '/')] = (
+                            stat.st_size, stat.st_mtime_ns)
+        return found
+
+    def snapshot(self):
+        """Return {relative path: (size, mtime_ns)} for all build inputs"""
+        snapshot, subdirs = {}, []
+        with os.scandir(self.root) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in self.PRUNED_DIRS:
+                        subdirs.append(entry.path)
+                elif self.is_input(entry.name):
+                    stat = entry.stat()
+                    snapshot[entry.name] = (stat.st_size, stat.st_mtime_ns)
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for found in executor.map(self._walk, subdirs):
+                snapshot.update(found)
+        return snapshot
+
+    def load(self):
+        """Load stored entries {path: [size, mtime_ns, sha256]}, or {} when absent or stale"""
+        try:
+            manifest = json.loads(self.manifest_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+        return manifest.get('files', {}) if manifest.get('version') == self.VERSION else {}
+
+    def _hash(self, rel_path):
+        digest = hashlib.sha256()
+        with open(self.root / rel_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def entries(self, snapshot, stored=None):
+        """Build manifest entries, hashing only files whose stat no longer matches"""
+        stored = self.load() if stored is None else stored
+        entries = {}
+        for rel_path, (size, mtime_ns) in snapshot.items():
+            previous = stored.get(rel_path)
+            if previous and previous[0] == size and previous[1] == mtime_ns:
+                entries[rel_path] = previous
+            else:
+                entries[rel_path] = [size, mtime_ns, self._hash(rel_path)]
+        return entries
+
+    def changed_inputs(self, snapshot):
+        """Return the inputs whose content differs from the last successful build"""
+        stored = self.load()
+        if not stored:
+            return ['(no previous build fingerprint)']
+        changed = list(set(stored) ^ set(snapshot))
+        stale_stats = False
+        for rel_path in set(stored) & set(snapshot):
+            previous = stored[rel_path]
+            if tuple(previous[:2]) == snapshot[rel_path]:
+                continue
+            stale_stats = True
+            if self._hash(rel_path) != previous[2]:
+                changed.append(rel_path)
+        if not changed and stale_stats:
+            # Touched but identical: refresh stats so the next check stays stat-only.
+            self.save(self.entries(snapshot, stored))
+        return sorted(changed)
+
+    def outputs_present(self):
+        """True when restore and build outputs from a previous build still exist"""
+        return (self.root / 'obj' / 'project.assets.json').exists() and \
+            any((self.root / 'bin').glob('*/*/WileyWidget.dll'))
+
+    def save(self, entries):
+        """Record the inputs of a successful build.
+
+        Files whose stat changed since the entries were hashed (edited during
+        the build) are left out, so the next check sees them as changed.
+        """
+        current = {}
+        for rel_path, entry in entries.items():
+            try:
+                stat = os.stat(self.root / rel_path)
+            except OSError:
+                continue
+            if (stat.st_size, stat.st_mtime_ns) == tuple(entry[:2]):
+                current[rel_path] = entry
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.manifest_path.with_name(self.manifest_path.name + '.tmp')
+        temp_path.write_text(json.dumps({'version': self.VERSION, 'files': current}), encoding='utf-8')
+        os.replace(temp_path, self.manifest_path)
+
+
+def build_application(incremental=True, force=False):
     """Build the WileyWidget application with debugging"""
     print("\n=== Building Application ===")
     logger.info("Building application (incremental=%s)", incremental)
     maybe_debug_breakpoint()
 
+    fingerprint = BuildFingerprint()
+    check_start_ns = time.perf_counter_ns()
+    snapshot = fingerprint.snapshot()
+    if incremental and not force and fingerprint.outputs_present():
+        changed = fingerprint.changed_inputs(snapshot)
+        check_ms = (time.perf_counter_ns() - check_start_ns) / 1e6
+        if not changed:
+            print(f"  ⏭️  No build inputs changed ({len(snapshot)} files checked in {check_ms:.0f}ms) - skipping build")
+            logger.info("Build skipped: %s inputs unchanged (check took %.1fms)", len(snapshot), check_ms)
+            return True
+        print(f"  🔎 {len(changed)} build input(s) changed, e.g. {changed[0]}")
+        logger.info("Build inputs changed: %s", changed[:20])
+
     try:
         if not incremental:
             # Clean first (only for full rebuilds)
@@ -199,6 +369,9 @@ def build_application(incremental=True):
         # Debug breakpoint before build
         maybe_debug_breakpoint()
 
+        # Hash the inputs as they are now, before dotnet reads them
+        entries = fingerprint.entries(snapshot)
+
         # Build (incremental by default)
         build_type = "incrementally" if incremental else "from scratch"
         print(f"  🔨 Building project {build_type}...")
@@ -207,6 +380,8 @@ def build_application(incremental=True):
                                   capture_output=True, text=True, check=True)
             print("  ✅ Build successful")
             logger.info("Build successful")
+            # Fingerprint the pre-build hashes: edits made during the build trigger the next one.
+            fingerprint.save(entries)
 
             if result.stdout:
                 print(f"Build output:\n{result.stdout}")
@@ -265,14 +440,111 @@ def terminate_process(process, timeout=10):
         logger.exception("Failed to terminate process tree for PID %s", process.pid)
 
 
-def run_application(debug_mode=False, startup_timeout=30):
+def _spawn_kwargs():
+    """Popen arguments for launching the app in its own process group with piped output"""
+    spawn_kwargs = {'stdout': subprocess.PIPE, 'stderr': subprocess.PIPE, 'text': True,
+                    'encoding': 'utf-8', 'errors': 'replace', 'bufsize': 1}
+    if os.name == 'nt':
+        spawn_kwargs['creationflags'] = subprocess.CREATE_NEW_PROCESS_GROUP
+    else:
+        spawn_kwargs['preexec_fn'] = os.setsid  # type: ignore[attr-defined]
+    return spawn_kwargs
+
+
+class AppOutputStreamer:
+    """Drains a launched app's stdout and stderr as they are written.
+
+    One reader thread per pipe keeps both pipes empty, so a chatty app can never
+    block on a full pipe. (selectors cannot wait on pipes on Windows, where the app
+    runs, so threads are the portable choice.) Each line is stamped with the time
+    since launch and written to a size-rotated log; only a bounded tail is kept in
+    memory. Readiness markers are timed from launch.
+    """
+
+    MAX_LINE_CHARS = 64 * 1024
+    MARKERS = {'window': WINDOW_MARKERS, 'ready': READY_MARKERS}
+
+    def __init__(self, process, log_path=None, echo=True, max_bytes=5 * 1024 * 1024,
+                 backup_count=3, tail_lines=200, started_ns=None):
+        self.process = process
+        self.echo = echo
+        self.started_ns = started_ns or time.perf_counter_ns()
+        self.tail = deque(maxlen=tail_lines)
+        self.marker_seconds = {}
+        self._events = {name: threading.Event() for name in self.MARKERS}
+        self._lock = threading.Lock()
+        self._threads = []
+
+        self._handler = None
+        self._output_log = logging.getLogger(f"{__name__}.app_output.{id(self)}")
+        self._output_log.propagate = False
+        self._output_log.setLevel(logging.INFO)
+        if log_path is not None:
+            Path(log_path).parent.mkdir(parents=True, exist_ok=True)
+            self._handler = logging.handlers.RotatingFileHandler(
+                log_path, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8')
+            self._handler.setFormatter(logging.Formatter('%(asctime)s %(message)s'))
+            self._output_log.addHandler(self._handler)
+
+    def start(self):
+        for channel, stream in (('stdout', self.process.stdout), ('stderr', self.process.stderr)):
+            if stream is not None:
+                thread = threading.Thread(target=self._pump, args=(stream, channel), daemon=True,
+                                          name=f"app-output-{channel}")
+                thread.start()
+                self._threads.append(thread)
+        return self
+
+    def _pump(self, stream, channel):
+        for line in iter(lambda: stream.readline(self.MAX_LINE_CHARS), ''):
+            line = line.rstrip('\r\n')
+            elapsed = (time.perf_counter_ns() - self.started_ns) / 1e9
+            self._output_log.info("[+%.3fs] [%s] %s", elapsed, channel, line)
+            with self._lock:
+                self.tail.append((elapsed, channel, line))
+                for name, markers in self.MARKERS.items():
+                    if name not in self.marker_seconds and any(marker in line for marker in markers):
+                        self.marker_seconds[name] = elapsed
+                        self._events[name].set()
+            if self.echo:
+                print(f"  [{elapsed:7.2f}s] {line}", file=sys.stderr if channel == 'stderr' else sys.stdout)
+
+    def wait_for(self, name, timeout):
+        """Wait for a marker; returns False on timeout or when the app exits first"""
+        deadline = time.monotonic() + timeout
+        event = self._events[name]
+        while not event.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            if self.process.poll() is not None:
+                # Let the readers drain what the app wrote before exiting.
+                self.join(timeout=2)
+                return event.is_set()
+            event.wait(min(remaining, 0.1))
+        return True
+
+    def join(self, timeout=None):
+        for thread in self._threads:
+            thread.join(timeout)
+
+    def close(self, timeout=5):
+        """Wait for the readers to finish and release the log file"""
+        self.join(timeout)
+        if self._handler is not None:
+            self._output_log.removeHandler(self._handler)
+            self._handler.close()
+            self._handler = None
+
+
+def run_application(debug_mode=False, startup_timeout=30, cmd=None):
     """Run the WileyWidget application with debugging"""
     print("\n=== Running Application ===")
     logger.info("Running application (debug_mode=%s)", debug_mode)
     maybe_debug_breakpoint()
 
     try:
-        cmd = ['dotnet', 'run', '--project', 'WileyWidget.csproj']
+        cmd = cmd or ['dotnet', 'run', '--project', 'WileyWidget.csproj']
 
         if debug_mode:
             # Add debug configuration if needed
@@ -286,38 +558,40 @@ def run_application(debug_mode=False, startup_timeout=30):
         maybe_debug_breakpoint()
 
         # Run the application
-        spawn_kwargs = {'stdout': subprocess.PIPE, 'stderr': subprocess.PIPE, 'text': True}
-        if os.name == 'nt':
-            spawn_kwargs['creationflags'] = subprocess.CREATE_NEW_PROCESS_GROUP
-        else:
-            spawn_kwargs['preexec_fn'] = os.setsid  # type: ignore[attr-defined]
-
+        started_ns = time.perf_counter_ns()
         try:
-            process = subprocess.Popen(cmd, **spawn_kwargs)
+            process = subprocess.Popen(cmd, **_spawn_kwargs())
         except Exception:
             logger.exception("Failed to launch WileyWidget.exe")
             raise
 
         print(f"  ✅ Application started (PID: {process.pid})")
         logger.info("Application started PID %s", process.pid)
+        print(f"     Output is streamed to {APP_OUTPUT_LOG}")
         print("     Press Ctrl+C to stop")
 
-        # Monitor the process
+        streamer = AppOutputStreamer(process, log_path=APP_OUTPUT_LOG, started_ns=started_ns).start()
+
+        # Monitor the process until its first window appears
         try:
-            stdout, stderr = process.communicate(timeout=startup_timeout)
-            if stdout:
-                print(f"Application output:\n{stdout}")
-                logger.debug("Application output:\n%s", stdout)
-            if stderr:
-                print(f"Application errors:\n{stderr}")
-                logger.error("Application errors:\n%s", stderr)
-        except subprocess.TimeoutExpired:
-            print(f"  ⏳ Application is running after {startup_timeout}s...")
+            if streamer.wait_for('window', startup_timeout):
+                seconds = streamer.marker_seconds['window']
+                print(f"  🪟 MainWindow shown after {seconds:.2f}s")
+                logger.info("Time to first window: %.3fs", seconds)
+                return process
+            if process.poll() is not None:
+                streamer.close()
+                print(f"  ⚠️  Application exited with code {process.returncode} before showing a window")
+                logger.error("Application exited with code %s before showing a window; last output:\n%s",
+                             process.returncode, "\n".join(line for _, _, line in streamer.tail))
+                return None
+            print(f"  ⏳ Application is running after {startup_timeout}s (no window marker yet)...")
             logger.info("Application still running after %ss", startup_timeout)
             return process
         except KeyboardInterrupt:
             print("\n⏹️  Stopping application...")
             terminate_process(process)
+            streamer.close()
             raise
 
     except Exception as e:
@@ -368,6 +642,194 @@ def monitor_startup_timing(skip_cleanup=False):
         print(f"  {phase}: {duration:.2f}s")
     print(f"  Total: {total_time:.2f}s")
 
+class ChildProcessSampler:
+    """Samples CPU time and peak RSS of this script's child process tree.
+
+    Used as a context manager around a phase. Processes are polled on a
+    background thread; CPU time of children that were already reaped is taken
+    from os.times() so short-lived tools (dotnet restore, taskkill) still count.
+    """
+
+    def __init__(self, interval=0.05):
+        self.interval = interval
+        self.cpu_seconds = 0.0
+        self.peak_rss_bytes = 0
+        self._cpu_by_pid = {}
+        self._stop = threading.Event()
+        self._thread = None
+        self._reaped_start = 0.0
+
+    @staticmethod
+    def _reaped_cpu():
+        times = os.times()
+        return times.children_user + times.children_system
+
+    def _sample(self):
+        rss = 0
+        for child in psutil.Process().children(recursive=True):
+            try:
+                with child.oneshot():
+                    cpu = child.cpu_times()
+                    rss += child.memory_info().rss
+                self._cpu_by_pid[child.pid] = cpu.user + cpu.system
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        self.peak_rss_bytes = max(self.peak_rss_bytes, rss)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._sample()
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self._reaped_start = self._reaped_cpu()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+        reaped = self._reaped_cpu() - self._reaped_start
+        self.cpu_seconds = max(sum(self._cpu_by_pid.values()), reaped)
+        return False
+
+
+def measure_phase(func, *args, **kwargs):
+    """Run one phase and return (result, wall/cpu/rss metrics)"""
+    with ChildProcessSampler() as sampler:
+        start_ns = time.perf_counter_ns()
+        result = func(*args, **kwargs)
+        wall_ns = time.perf_counter_ns() - start_ns
+    return result, {
+        'wall_ms': wall_ns / 1e6,
+        'cpu_ms': sampler.cpu_seconds * 1000,
+        'peak_rss_mb': sampler.peak_rss_bytes / (1024 * 1024),
+    }
+
+
+def launch_until_ready(startup_timeout=30, cmd=None):
+    """Start the built app and stop it once it logs startup completion.
+
+    Returns True when a ready marker was seen before the timeout.
+    """
+    cmd = cmd or ['dotnet', 'run', '--project', 'WileyWidget.csproj', '--no-build']
+    process = subprocess.Popen(cmd, **_spawn_kwargs())
+    streamer = AppOutputStreamer(process, log_path=APP_OUTPUT_LOG, echo=False).start()
+    try:
+        return streamer.wait_for('ready', startup_timeout)
+    finally:
+        terminate_process(process)
+        streamer.close()
+
+
+def benchmark_iteration(cold, startup_timeout=30):
+    """Run cleanup (cold only), build and start once; return per-phase metrics"""
+    phases = {}
+    if cold:
+        _, phases['Process Cleanup'] = measure_phase(cleanup_dotnet_processes)
+        _, phases['Artifact Cleanup'] = measure_phase(cleanup_dotnet_artifacts)
+
+    built, phases['Build'] = measure_phase(build_application, incremental=True)
+    if not built:
+        raise RuntimeError("Build failed during startup benchmark")
+
+    ready, phases['Application Start'] = measure_phase(launch_until_ready, startup_timeout)
+    if not ready:
+        logger.warning("Application did not report startup completion within %ss", startup_timeout)
+
+    phases['Total'] = {
+        'wall_ms': sum(metrics['wall_ms'] for metrics in phases.values()),
+        'cpu_ms': sum(metrics['cpu_ms'] for metrics in phases.values()),
+        'peak_rss_mb': max(metrics['peak_rss_mb'] for metrics in phases.values()),
+    }
+    return {'ready': ready, 'phases': phases}
+
+
+def percentile(values, pct):
+    """Linear-interpolated percentile of a non-empty list"""
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    lower, upper = math.floor(rank), math.ceil(rank)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def summarize_benchmark(records):
+    """Aggregate per-run phase metrics into percentiles, split by cold/warm"""
+    summary = {}
+    for record in records:
+        for phase, metrics in record['phases'].items():
+            phase_summary = summary.setdefault(record['kind'], {}).setdefault(phase, {})
+            for metric, value in metrics.items():
+                phase_summary.setdefault(metric, []).append(value)
+
+    for phases in summary.values():
+        for metrics in phases.values():
+            for metric, values in metrics.items():
+                metrics[metric] = {
+                    'n': len(values),
+                    'mean': statistics.fmean(values),
+                    'stdev': statistics.stdev(values) if len(values) > 1 else 0.0,
+                    'min': min(values),
+                    'p50': percentile(values, 50),
+                    'p90': percentile(values, 90),
+                    'p95': percentile(values, 95),
+                    'max': max(values),
+                }
+    return summary
+
+
+def run_startup_benchmark(runs, warmup=1, skip_cleanup=False, startup_timeout=30, results_path=None):
+    """Measure N cold and N warm cleanup/build/start cycles and write JSON results.
+
+    Cold runs clean processes and build artifacts first, so they include a
+    restore and full build. Warm runs build incrementally on an up-to-date tree
+    after K unrecorded warmup iterations. --skip-cleanup measures warm runs only.
+    """
+    if psutil is None:
+        raise RuntimeError("psutil is required for --runs benchmarking (pip install psutil)")
+
+    print(f"\n=== Startup Benchmark ({runs} runs, {warmup} warmup) ===")
+    logger.info("Startup benchmark: runs=%s warmup=%s skip_cleanup=%s", runs, warmup, skip_cleanup)
+    records = []
+
+    if not skip_cleanup:
+        for index in range(runs):
+            print(f"\n--- Cold run {index + 1}/{runs} ---")
+            records.append({'kind': 'cold', 'index': index, **benchmark_iteration(True, startup_timeout)})
+
+    for index in range(warmup):
+        print(f"\n--- Warmup {index + 1}/{warmup} ---")
+        benchmark_iteration(False, startup_timeout)
+
+    for index in range(runs):
+        print(f"\n--- Warm run {index + 1}/{runs} ---")
+        records.append({'kind': 'warm', 'index': index, **benchmark_iteration(False, startup_timeout)})
+
+    summary = summarize_benchmark(records)
+    results = {
+        'generated': datetime.now().isoformat(timespec='seconds'),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'runs': runs,
+        'warmup': warmup,
+        'records': records,
+        'summary': summary,
+    }
+    results_path = Path(results_path or LOG_DIR / f"startup-benchmark-{datetime.now():%Y%m%d-%H%M%S}.json")
+    results_path.parent.mkdir(parents=True, exist_ok=True)
+    results_path.write_text(json.dumps(results, indent=2), encoding='utf-8')
+
+    print("\n=== Benchmark Report (wall ms p50 / p95, cpu ms p50, peak RSS MB max) ===")
+    for kind, phases in summary.items():
+        print(f"  [{kind}]")
+        for phase, metrics in phases.items():
+            print(f"    {phase:<18} {metrics['wall_ms']['p50']:>9.0f} / {metrics['wall_ms']['p95']:>9.0f}"
+                  f"   cpu {metrics['cpu_ms']['p50']:>9.0f}   rss {metrics['peak_rss_mb']['max']:>7.1f}")
+    print(f"\n💾 Results written to {results_path}")
+    logger.info("Startup benchmark results written to %s", results_path)
+    return results
+
 def main():
     """Main startup function with debugpy integration"""
     parser = argparse.ArgumentParser(description='Wiley Widget Startup with debugpy')
@@ -385,6 +847,14 @@ def main():
                        help='Pause at scripted debug breakpoints')
     parser.add_argument('--startup-timeout', type=int, default=30,
                        help='Seconds to wait for app output before assuming it is running')
+    parser.add_argument('--force-build', action='store_true',
+                       help='Always run dotnet build, even when no build inputs changed')
+    parser.add_argument('--runs', type=int, default=0,
+                       help='Benchmark N cold and N warm cleanup/build/start cycles, then exit')
+    parser.add_argument('--warmup', type=int, default=1,
+                       help='Unrecorded warm iterations before the measured warm runs (default: 1)')
+    parser.add_argument('--results', type=Path,
+                       help='JSON results file for --runs (default: logs/startup-benchmark-<time>.json)')
 
     args = parser.parse_args()
 
@@ -406,6 +876,11 @@ def main():
     # Main startup logic with debugging
     maybe_debug_breakpoint()
 
+    if args.runs:
+        run_startup_benchmark(args.runs, warmup=args.warmup, skip_cleanup=args.skip_cleanup,
+                              startup_timeout=args.startup_timeout, results_path=args.results)
+        return
+
     if args.timing:
         monitor_startup_timing(skip_cleanup=args.skip_cleanup)
     else:
@@ -414,7 +889,7 @@ def main():
             cleanup_dotnet_processes()
             cleanup_dotnet_artifacts()
 
-    if build_application(incremental=args.skip_cleanup):
+    if build_application(incremental=args.skip_cleanup, force=args.force_build):
         process = run_application(startup_timeout=args.startup_timeout)
         if process:
             try:
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+.env Parser for WileyWidget
+Parses .env-style files into layered profiles (.env + .env.<profile>).
+
+Syntax:
+    KEY=value #1              unquoted: the rest of the line, '#' included
+    export KEY=value          optional export prefix
+    KEY='literal ${NOT_EXPANDED}'  # a comment may follow a closing quote
+    KEY="multi
+    line \\t escaped ${OTHER} ${MISSING:-fallback} \\${literal}"
+    PASS=pa$$word             bare $ is literal; only ${VAR} expands
+
+Values are materialized lazily: parsing only tokenizes, and ${VAR} expansion
+runs when values are requested, so listing keys (status, unload) never
+expands anything. A key referring to itself extends the value it overrides
+(the previous layer's, else the environment's). A ${VAR} that is undefined
+and has no default is left as written and reported in EnvProfile.undefined.
+Parsed files are cached by (mtime, size).
+
+Differences from the old line-by-line loader in load-env:
+    - ${VAR} now expands in unquoted and double-quoted values; single-quote
+      a value to keep ${...} text literal.
+    - Keys must match [A-Za-z_][A-Za-z0-9_.-]*; other assignments
+      ("my key=1") are reported as invalid lines instead of loaded.
+Unquoted values (" #" included) and values whose quotes do not close cleanly
+(KEY='it's' -> it's) are read as before, so existing secrets keep their text.
+"""
+
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+_BLANK = re.compile(r"[ \t]*(?:#[^\r\n]*)?(?:\r?\n|\Z)")
+_ENTRY = re.compile(r"""
+    [ \t]*(?:export[ \t]+)?
+    (?P<key>[A-Za-z_][A-Za-z0-9_.-]*)[ \t]*=[ \t]*
+    (?:
+        (?:'(?P<single>[^']*)' | "(?P<double>(?:\\.|[^"\\])*)")
+        [ \t]*(?:(?<=[ \t])\#[^\r\n]*)?
+      | (?P<bare>[^\r\n]*?)[ \t]*
+    )
+    (?:\r?\n|\Z)
+""", re.VERBOSE)
+_LINE = re.compile(r"[^\r\n]*(?:\r?\n|\Z)")
+_EXPANSION = re.compile(r"""
+    \\(?P<escape>.)
+  | \$\{(?P<braced>[A-Za-z_][A-Za-z0-9_]*)(?::-(?P<default>[^}]*))?\}
+""", re.VERBOSE | re.DOTALL)
+_ESCAPES = {'n': '\n', 'r': '\r', 't': '\t'}
+
+_cache: dict[Path, tuple[tuple[int, int], 'EnvFile']] = {}
+
+
+class EnvParseError(ValueError):
+    """A value could not be materialized (e.g. a ${VAR} reference cycle)"""
+
+
+@dataclass(frozen=True)
+class EnvEntry:
+    """One KEY=value assignment, kept unexpanded"""
+
+    key: str
+    raw: str
+    quote: str
+    line: int
+
+
+@dataclass
+class EnvFile:
+    """Tokenized contents of one .env file"""
+
+    path: Path | None
+    entries: list[EnvEntry] = field(default_factory=list)
+    invalid: list[tuple[int, str]] = field(default_factory=list)
+
+
+def parse(text: str, path: Path | None = None) -> EnvFile:
+    """Tokenize .env text; lines that are not assignments are recorded as invalid"""
+    env_file = EnvFile(path)
+    position, line = 0, 1
+    while position < len(text):
+        match = _BLANK.match(text, position)
+        if not match or match.end() == position:
+            match = _ENTRY.match(text, position)
+            if match:
+                quote = "'" if match.group('single') is not None else '"' if match.group('double') is not None else ''
+                raw = match.group('single') if quote == "'" else match.group('double') if quote else match.group('bare')
+                if not quote and len(raw) >= 2 and raw[0] == raw[-1] and raw[0] in "'\"":
+                    # Quotes that do not close cleanly (KEY='it's'): strip the outer pair, like the old loader
+                    quote, raw = raw[0], raw[1:-1]
+                env_file.entries.append(EnvEntry(match.group('key'), raw, quote, line))
+            else:
+                match = _LINE.match(text, position)
+                env_file.invalid.append((line, match.group().strip()))
+            if match.end() == position:
+                break
+        line += text.count('\n', position, match.end())
+        position = match.end()
+    return env_file
+
+
+def parse_file(path: Path) -> EnvFile:
+    """Parse a file, reusing the previous result while its mtime and size are unchanged"""
+    path = Path(path).resolve()
+    stat = path.stat()
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _cache.get(path)
+    if cached and cached[0] == signature:
+        return cached[1]
+    with open(path, 'r', encoding='utf-8') as f:
+        env_file = parse(f.read(), path)
+    _cache[path] = (signature, env_file)
+    return env_file
+
+
+class EnvProfile:
+    """Layered .env files; later layers override earlier ones key by key"""
+
+    def __init__(self, layers: list[EnvFile]):
+        self.layers = layers
+        self.entries: dict[str, EnvEntry] = {}
+        # Every definition of a key in layer order, so a self-reference can reach the one it overrides
+        self.definitions: dict[str, list[EnvEntry]] = {}
+        self.undefined: list[tuple[str, str]] = []
+        for layer in layers:
+            for entry in layer.entries:
+                self.entries[entry.key] = entry
+                self.definitions.setdefault(entry.key, []).append(entry)
+
+    def keys(self) -> list[str]:
+        return list(self.entries)
+
+    @property
+    def invalid(self) -> list[tuple[Path | None, int, str]]:
+        return [(layer.path, line, text) for layer in self.layers for line, text in layer.invalid]
+
+    def materialize(self, environ=None, keys=None) -> dict[str, str]:
+        """Expand values on demand; ${VAR} sees the profile first, then environ.
+
+        A key referring to itself (PATH=${PATH}:/opt/bin) extends the definition
+        it overrides: the previous layer's entry, or else environ. (key, name)
+        pairs of references left unexpanded are stored in self.undefined.
+        """
+        environ = os.environ if environ is None else environ
+        values: dict[tuple[str, int], str] = {}
+        resolving: list[tuple[str, int]] = []
+        self.undefined = []
+
+        def resolve(name: str, index: int | None = None) -> str | None:
+            definitions = self.definitions.get(name, [])
+            index = len(definitions) - 1 if index is None else index
+            if index < 0:
+                return environ.get(name)
+            if (name, index) in values:
+                return values[name, index]
+            if (name, index) in resolving:
+                chain = [key for key, _ in resolving[resolving.index((name, index)):]] + [name]
+                raise EnvParseError(f"Variable reference cycle: {' -> '.join(chain)}")
+
+            def lookup(reference: str) -> str | None:
+                return resolve(reference, index - 1 if reference == name else None)
+
+            resolving.append((name, index))
+            try:
+                values[name, index] = expand(definitions[index], lookup, self.undefined)
+            finally:
+                resolving.pop()
+            return values[name, index]
+
+        return {key: resolve(key) for key in (keys if keys is not None else self.entries)}
+
+
+def expand(entry: EnvEntry, lookup, undefined: list[tuple[str, str]] | None = None) -> str:
+    """Materialize one entry: escapes (double quotes only) and ${VAR} expansion"""
+    if entry.quote == "'":
+        return entry.raw
+
+    def replace(match):
+        escape = match.group('escape')
+        if escape is not None:
+            if entry.quote != '"':
+                return match.group()
+            return _ESCAPES.get(escape, escape)
+        name = match.group('braced')
+        value = lookup(name)
+        if value is None or (value == '' and match.group('default') is not None):
+            default = match.group('default')
+            if default is None:
+                # Keep undefined references as written so existing values never change silently
+                if undefined is not None:
+                    undefined.append((entry.key, name))
+                return match.group()
+            return expand(EnvEntry(entry.key, default, entry.quote, entry.line), lookup, undefined)
+        return value
+
+    return _EXPANSION.sub(replace, entry.raw)
+
+
+def profile_paths(base: Path, profile: str | None = None) -> list[Path]:
+    """The base file plus its existing profile overlay (.env -> .env.Development)"""
+    paths = [base]
+    if profile:
+        overlay = base.with_name(f"{base.name}.{profile}")
+        if overlay.exists():
+            paths.append(overlay)
+    return paths
+
+
+def load_profile(base: Path, profile: str | None = None) -> EnvProfile:
+    """Parse (or reuse cached parses of) the base file and its profile overlay"""
+    return EnvProfile([parse_file(path) for path in profile_paths(base, profile)])
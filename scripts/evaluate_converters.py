@@ -24,11 +24,29 @@ Converters evaluated:
    - BoolToForegroundConverter
    - InverseBooleanConverter
    - BooleanToFontWeightConverter
+
+Usage:
+    python scripts/evaluate_converters.py                  # correctness evaluation
+    python scripts/evaluate_converters.py --benchmark      # throughput/allocation benchmark
+    python scripts/evaluate_converters.py --benchmark --save-baseline
+    python scripts/evaluate_converters.py --fuzz --fuzz-cases 50000
 """
 
+import argparse
+import inspect
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+import json
+import random
+import statistics
 import sys
-from typing import Any
-from dataclasses import dataclass
+import time
+import tracemalloc
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Callable, Iterator
+from dataclasses import asdict, dataclass
 from enum import Enum
 import re
 
@@ -40,6 +58,24 @@ def camel_to_snake(name: str) -> str:
     return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
 
 
+_INT32_PATTERN = re.compile(r"\s*[+-]?[0-9]+\s*")
+
+
+def parse_int32(text: Any) -> int | None:
+    """Mirror .NET int.TryParse: ASCII digits, optional sign, Int32 range"""
+    if not isinstance(text, str) or not _INT32_PATTERN.fullmatch(text):
+        return None
+    number = int(text)
+    return number if -2**31 <= number < 2**31 else None
+
+
+def bind_converter_call(converter_method: Callable[..., Any]) -> Callable[[Any, Any], Any]:
+    """Adapt a converter method to a uniform (value, parameter) call shape"""
+    if len(inspect.signature(converter_method).parameters) > 1:
+        return lambda value, parameter: converter_method(value, parameter or "")
+    return lambda value, parameter: converter_method(value)
+
+
 class TestResult(Enum):
     PASS = "PASS"
     FAIL = "FAIL"
@@ -70,11 +106,11 @@ class ConverterEvaluator:
     @staticmethod
     def evaluate_balance_color_converter(value: Any) -> str:
         """Python implementation of BalanceColorConverter logic"""
-        if isinstance(value, (int, float)):
-            numeric_value = float(value)
-            if numeric_value > 0:
+        # decimal, double and int are handled; a boxed bool is not an int in .NET
+        if isinstance(value, (int, float, Decimal)) and not isinstance(value, bool):
+            if value > 0:
                 return "Green"
-            elif numeric_value < 0:
+            elif value < 0:
                 return "Red"
             else:
                 return "Gray"
@@ -219,8 +255,9 @@ class ConverterEvaluator:
             if param_lower == "notempty" and isinstance(val, str):
                 return len(val.strip()) > 0
 
-            if param.isdigit() and isinstance(val, int):
-                return val == int(param)
+            target = parse_int32(param)
+            if target is not None and isinstance(val, int) and not isinstance(val, bool):
+                return val == target
 
             return base_result
 
@@ -237,8 +274,9 @@ class ConverterEvaluator:
     @staticmethod
     def evaluate_count_to_visibility_converter(value: Any, parameter: str = "") -> str:
         """Python implementation of CountToVisibilityConverter logic"""
-        if isinstance(value, int) and parameter.isdigit():
-            target_count = int(parameter)
+        is_count = isinstance(value, int) and not isinstance(value, bool)
+        target_count = parse_int32(parameter) if is_count else None
+        if target_count is not None:
             return "Visible" if value == target_count else "Collapsed"
         return "Collapsed"
 
@@ -574,8 +612,574 @@ class ConverterTestRunner:
                 print(f"⚠️  {total_failed + total_errors} ISSUES FOUND - REVIEW FAILED TESTS ABOVE")
 
 
+DEFAULT_BASELINE_PATH = Path(__file__).parent / "converter-benchmark-baseline.json"
+
+
+@dataclass
+class BenchmarkResult:
+    """Throughput and allocation figures for a single converter"""
+    converter_name: str
+    calls_per_second: float
+    ns_per_call: float
+    alloc_bytes_per_call: float
+    relative_stdev: float
+    calls_measured: int
+
+
+@dataclass
+class BenchmarkRegression:
+    """A metric that moved past the allowed threshold versus the baseline"""
+    converter_name: str
+    metric: str
+    baseline: float
+    current: float
+    change_pct: float
+
+
+class ConverterBenchmark:
+    """Measures converter throughput and allocations over generated input distributions"""
+
+    # Mirrors the value shapes a grid cell binding hands to a converter.
+    INPUT_KINDS = ("none", "string", "decimal", "float", "int", "bool")
+
+    def __init__(self, evaluator: ConverterEvaluator | None = None, sample_size: int = 2000,
+                 repeats: int = 7, min_repeat_time: float = 0.05, seed: int = 1337):
+        self.evaluator = evaluator or ConverterEvaluator()
+        self.sample_size = sample_size
+        self.repeats = repeats
+        self.min_repeat_time = min_repeat_time
+        self.seed = seed
+
+    def generate_inputs(self, suite: TestSuite) -> list[tuple[Any, Any]]:
+        """Generate a reproducible mix of (value, parameter) pairs for a converter"""
+        rng = random.Random(f"{self.seed}:{suite.converter_name}")
+        parameters = [None] + sorted({str(case.parameters) for case in suite.test_cases
+                                      if case.parameters is not None})
+        strings = ["", "   ", "test", "Inverse", "5", "Blue|Green"]
+
+        inputs = []
+        for _ in range(self.sample_size):
+            kind = rng.choice(self.INPUT_KINDS)
+            if kind == "none":
+                value = None
+            elif kind == "string":
+                value = rng.choice(strings)
+            elif kind == "decimal":
+                value = Decimal(rng.randint(-20_000_000, 20_000_000)) / 100
+            elif kind == "float":
+                value = rng.uniform(-200_000.0, 200_000.0)
+            elif kind == "int":
+                value = rng.randint(-10, 10)
+            else:
+                value = rng.random() < 0.5
+            inputs.append((value, rng.choice(parameters)))
+        return inputs
+
+    def _time_batch(self, call: Callable[[Any, Any], Any], inputs: list[tuple[Any, Any]], loops: int) -> int:
+        """Time `loops` passes over the inputs and return elapsed nanoseconds"""
+        start = time.perf_counter_ns()
+        for _ in range(loops):
+            for value, parameter in inputs:
+                call(value, parameter)
+        return time.perf_counter_ns() - start
+
+    def _measure_allocations(self, call: Callable[[Any, Any], Any], inputs: list[tuple[Any, Any]]) -> float:
+        """Return the mean peak bytes allocated by a single converter call"""
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start()
+        try:
+            total = 0
+            for value, parameter in inputs:
+                tracemalloc.reset_peak()
+                before, _ = tracemalloc.get_traced_memory()
+                call(value, parameter)
+                _, peak = tracemalloc.get_traced_memory()
+                total += max(0, peak - before)
+        finally:
+            if not was_tracing:
+                tracemalloc.stop()
+        return total / len(inputs) if inputs else 0.0
+
+    def benchmark_suite(self, suite: TestSuite) -> BenchmarkResult:
+        """Benchmark a single converter suite"""
+        method_name = f"evaluate_{camel_to_snake(suite.converter_name)}"
+        call = bind_converter_call(getattr(self.evaluator, method_name))
+        inputs = self.generate_inputs(suite)
+
+        # Calibrate the loop count so each repeat is long enough to dwarf timer noise.
+        loops = 1
+        while self._time_batch(call, inputs, loops) < self.min_repeat_time * 1e9:
+            loops *= 2
+
+        per_call_ns = []
+        for _ in range(self.repeats):
+            elapsed = self._time_batch(call, inputs, loops)
+            per_call_ns.append(elapsed / (loops * len(inputs)))
+
+        # The fastest repeat is the least disturbed by the scheduler; the spread
+        # across repeats tells the reader how much to trust it.
+        best = min(per_call_ns)
+        mean = statistics.fmean(per_call_ns)
+        stdev = statistics.stdev(per_call_ns) if len(per_call_ns) > 1 else 0.0
+
+        return BenchmarkResult(
+            converter_name=suite.converter_name,
+            calls_per_second=1e9 / best if best > 0 else float("inf"),
+            ns_per_call=best,
+            alloc_bytes_per_call=self._measure_allocations(call, inputs),
+            relative_stdev=stdev / mean if mean > 0 else 0.0,
+            calls_measured=loops * len(inputs) * self.repeats,
+        )
+
+    def run(self, test_suites: list[TestSuite]) -> list[BenchmarkResult]:
+        """Benchmark every converter suite in order"""
+        return [self.benchmark_suite(suite) for suite in test_suites]
+
+    @staticmethod
+    def save_baseline(results: list[BenchmarkResult], path: Path) -> None:
+        """Persist benchmark results as the new baseline"""
+        payload = {
+            "generated": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "python": sys.version.split()[0],
+            "converters": {result.converter_name: asdict(result) for result in results},
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+    @staticmethod
+    def load_baseline(path: Path) -> dict[str, dict[str, Any]]:
+        """Load a stored baseline, returning an empty mapping when none exists"""
+        if not path.exists():
+            return {}
+        return json.loads(path.read_text(encoding="utf-8")).get("converters", {})
+
+    @staticmethod
+    def compare_to_baseline(results: list[BenchmarkResult], baseline: dict[str, dict[str, Any]],
+                            threshold: float = 0.15, min_alloc_delta: float = 16.0) -> list[BenchmarkRegression]:
+        """Flag converters whose throughput dropped or allocations grew past the threshold"""
+        regressions = []
+        for result in results:
+            previous = baseline.get(result.converter_name)
+            if not previous:
+                continue
+
+            base_cps = float(previous.get("calls_per_second", 0.0))
+            if base_cps > 0:
+                change = (result.calls_per_second - base_cps) / base_cps
+                if change < -threshold:
+                    regressions.append(BenchmarkRegression(
+                        result.converter_name, "calls_per_second", base_cps,
+                        result.calls_per_second, change * 100))
+
+            base_alloc = float(previous.get("alloc_bytes_per_call", 0.0))
+            delta = result.alloc_bytes_per_call - base_alloc
+            # Tiny absolute changes are allocator noise, not regressions.
+            if delta > min_alloc_delta and delta > base_alloc * threshold:
+                change = delta / base_alloc if base_alloc > 0 else float("inf")
+                regressions.append(BenchmarkRegression(
+                    result.converter_name, "alloc_bytes_per_call", base_alloc,
+                    result.alloc_bytes_per_call, change * 100))
+        return regressions
+
+    @staticmethod
+    def print_results(results: list[BenchmarkResult], regressions: list[BenchmarkRegression],
+                      baseline: dict[str, dict[str, Any]]):
+        """Print a per-converter throughput table and any regressions"""
+        print("=" * 80)
+        print("WILEY WIDGET CONVERTER BENCHMARK RESULTS")
+        print("=" * 80)
+        print(f"{'Converter':<36}{'calls/s':>14}{'ns/call':>10}{'B/call':>9}{'±%':>7}{'vs base':>9}")
+        print("-" * 85)
+        for result in results:
+            previous = baseline.get(result.converter_name, {})
+            base_cps = float(previous.get("calls_per_second", 0.0))
+            change = f"{(result.calls_per_second - base_cps) / base_cps * 100:+.1f}%" if base_cps > 0 else "n/a"
+            print(f"{result.converter_name:<36}{result.calls_per_second:>14,.0f}"
+                  f"{result.ns_per_call:>10.1f}{result.alloc_bytes_per_call:>9.1f}"
+                  f"{result.relative_stdev * 100:>7.1f}{change:>9}")
+
+        if regressions:
+            print(f"\n⚠️  {len(regressions)} REGRESSION(S) AGAINST BASELINE")
+            for regression in regressions:
+                print(f"  ❌ {regression.converter_name}.{regression.metric}: "
+                      f"{regression.baseline:,.1f} -> {regression.current:,.1f} ({regression.change_pct:+.1f}%)")
+        elif baseline:
+            print("\n🎉 NO REGRESSIONS AGAINST BASELINE")
+
+
+VISIBILITY_DOMAIN = frozenset({"Visible", "Collapsed"})
+
+# Every output a converter may legally produce before parameter tokens are added.
+FUZZ_OUTPUT_DOMAINS: dict[str, frozenset[Any]] = {
+    "BalanceColorConverter": frozenset({"Green", "Red", "Gray"}),
+    "CurrencyFormatConverter": frozenset({"en-US"}),
+    "UserMessageBackgroundConverter": frozenset({"Blue (#1976D2)", "Gray (#E0E0E0)"}),
+    "MessageAlignmentConverter": frozenset({"Right", "Left", "Blue (#1976D2)", "Gray (#CFD8DC)", "You", "AI"}),
+    "MessageForegroundConverter": frozenset({"White", "Black"}),
+    "ProfitLossTextConverter": frozenset({"Monthly Profit", "Monthly Loss", "Monthly Position"}),
+    "ProfitBrushConverter": frozenset({"Light Green (#E8F5E8)", "Light Orange (#FFF3E0)", "Light Gray (#F5F5F5)"}),
+    "ProfitBorderBrushConverter": frozenset({"Dark Green (#388E3C)", "Orange (#F57C00)", "Gray (#BDBDBD)"}),
+    "ProfitTextBrushConverter": frozenset({"Dark Green (#388E3C)", "Orange (#F57C00)", "Dark Gray (#212121)"}),
+    "BoolToBackgroundConverter": frozenset({"Light Red (#FFEBEE)", "Light Green (#E8F5E8)"}),
+    "BoolToVisibilityConverter": VISIBILITY_DOMAIN,
+    "EmptyStringToVisibilityConverter": VISIBILITY_DOMAIN,
+    "CountToVisibilityConverter": VISIBILITY_DOMAIN,
+    "BoolToForegroundConverter": frozenset({"Red (#D32F2F)", "Green (#388E3C)"}),
+    "BooleanToFontWeightConverter": frozenset({"Bold", "Normal"}),
+}
+
+# Converters that accept "TrueValue|FalseValue" parameter overrides.
+PARAMETER_TOKEN_CONVERTERS = frozenset({
+    "MessageForegroundConverter",
+    "BoolToBackgroundConverter",
+    "BoolToForegroundConverter",
+    "BooleanToFontWeightConverter",
+})
+
+FUZZ_PARAMETER_TOKENS = (
+    "", " ", "Inverse", "invert", "INVERT", " Invert ", "!", "empty", "notempty", "background",
+    "Avatar", "5", "-3", " 7 ", "+0", "²", "99999999999", "Blue|Green", "|", "||", "ExtraBold|Light",
+    "#FF0000|",
+)
+FUZZ_STRING_ALPHABET = "aZ09 \t\n|!#-+.²é"
+
+
+@dataclass
+class FuzzFailure:
+    """A converter input that violated an invariant, with its shrunk form"""
+    converter_name: str
+    invariant: str
+    value: Any
+    parameter: Any
+    detail: str
+    shrunk_value: Any = None
+    shrunk_parameter: Any = None
+
+
+@dataclass
+class FuzzReport:
+    """Fuzzing outcome for a single converter"""
+    converter_name: str
+    cases: int
+    failures: list[FuzzFailure]
+
+
+def fuzz_value(rng: random.Random) -> Any:
+    """Draw a random converter input value of mixed type"""
+    kind = rng.randrange(8)
+    if kind == 0:
+        return None
+    if kind == 1:
+        return rng.random() < 0.5
+    if kind == 2:
+        # Bindings hand converters boxed Int32 values.
+        return rng.choice((0, 1, -1, 2**31 - 1, -2**31, rng.randint(-2**31, 2**31 - 1), rng.randint(-10, 10)))
+    if kind == 3:
+        return rng.choice((0.0, -0.0, math.nan, math.inf, -math.inf, 5e-324,
+                           rng.uniform(-1e6, 1e6), rng.uniform(-1e300, 1e300)))
+    if kind == 4:
+        return rng.choice((Decimal(0), Decimal("-0.00"), Decimal("79228162514264337593543950335"),
+                           Decimal(rng.randint(-10**12, 10**12)) / 100))
+    if kind == 5:
+        return rng.choice(FUZZ_PARAMETER_TOKENS)
+    if kind == 6:
+        return "".join(rng.choice(FUZZ_STRING_ALPHABET) for _ in range(rng.randrange(12)))
+    return rng.choice(([], [1], (True,), {"key": 1}))
+
+
+def fuzz_parameter(rng: random.Random) -> Any:
+    """Draw a random converter parameter, biased towards meaningful tokens"""
+    roll = rng.random()
+    if roll < 0.25:
+        return None
+    if roll < 0.75:
+        return rng.choice(FUZZ_PARAMETER_TOKENS)
+    return "".join(rng.choice(FUZZ_STRING_ALPHABET) for _ in range(rng.randrange(10)))
+
+
+def _same_output(first: Any, second: Any) -> bool:
+    """Compare outputs, treating NaN as equal to itself"""
+    if isinstance(first, float) and isinstance(second, float):
+        return first == second or (math.isnan(first) and math.isnan(second))
+    return type(first) is type(second) and first == second
+
+
+def _output_allowed(converter_name: str, output: Any, parameter: Any) -> bool:
+    """Check an output against the converter's allowed brush/visibility domain"""
+    if converter_name == "BudgetProgressConverter":
+        return isinstance(output, float) and 0.0 <= output <= 100.0
+    if converter_name == "InverseBooleanConverter":
+        return isinstance(output, bool)
+
+    allowed = FUZZ_OUTPUT_DOMAINS[converter_name]
+    if converter_name in PARAMETER_TOKEN_CONVERTERS and "|" in str(parameter):
+        allowed = allowed | set(str(parameter).split("|"))
+    return isinstance(output, str) and output in allowed
+
+
+def check_fuzz_case(evaluator: ConverterEvaluator, converter_name: str,
+                    value: Any, parameter: Any) -> tuple[str, str] | None:
+    """Return (invariant, detail) for the first invariant the input violates"""
+    call = bind_converter_call(getattr(evaluator, f"evaluate_{camel_to_snake(converter_name)}"))
+    try:
+        output = call(value, parameter)
+        repeat = call(value, parameter)
+    except Exception as e:
+        return "no-exception", f"{type(e).__name__}: {e}"
+
+    if not _output_allowed(converter_name, output, parameter):
+        return "domain", f"output {output!r} outside the allowed domain"
+    if not _same_output(output, repeat):
+        return "deterministic", f"{output!r} then {repeat!r}"
+
+    try:
+        if converter_name == "InverseBooleanConverter" and isinstance(value, bool):
+            round_trip = call(output, None)
+            if round_trip is not value:
+                return "involution", f"{value!r} -> {output!r} -> {round_trip!r}"
+        elif converter_name == "BoolToVisibilityConverter" and isinstance(parameter, str) \
+                and parameter.strip().lower() in ("invert", "!"):
+            plain = call(value, None)
+            if plain == output:
+                return "invert-symmetry", f"inverted and plain both {output!r}"
+        elif converter_name == "BudgetProgressConverter":
+            # Feeding the clamped percentage back in (as dollars) must be a fixed point.
+            again = call(output * 1000.0, None)
+            if abs(again - output) > 1e-9 * max(1.0, output):
+                return "clamp-idempotence", f"{output!r} re-scaled to {again!r}"
+    except Exception as e:
+        return "no-exception", f"{type(e).__name__} in relation check: {e}"
+    return None
+
+
+def _complexity(item: Any) -> float:
+    """Rough size of an input, used to order shrinking candidates"""
+    if item is None:
+        return 0
+    if isinstance(item, bool):
+        return 1 + int(item)
+    if isinstance(item, int):
+        return 3 + abs(item).bit_length()
+    if isinstance(item, float):
+        return 4 + (len(repr(item)) if math.isfinite(item) else 30)
+    if isinstance(item, Decimal):
+        return 4 + len(str(item))
+    if isinstance(item, str):
+        return 5 + len(item)
+    return 6 + len(item) if hasattr(item, "__len__") else 40
+
+
+def shrink_candidates(item: Any) -> Iterator[Any]:
+    """Yield simpler variants of an input, simplest first"""
+    if item is None:
+        return
+    yield None
+    if isinstance(item, bool):
+        if item:
+            yield False
+    elif isinstance(item, int):
+        yield from (0, 1, -1, item // 2, item - 1 if item > 0 else item + 1)
+    elif isinstance(item, float):
+        yield 0.0
+        if math.isfinite(item):
+            yield float(int(item))
+            yield item / 2
+        yield 1.0 if item > 0 else -1.0
+    elif isinstance(item, Decimal):
+        yield Decimal(0)
+        if item.is_finite():
+            yield Decimal(int(item))
+            yield item / 2
+    elif isinstance(item, str):
+        yield ""
+        yield item.strip()
+        yield item[: len(item) // 2]
+        yield item[len(item) // 2:]
+        for index in range(len(item)):
+            yield item[:index] + item[index + 1:]
+    elif hasattr(item, "__len__"):
+        yield type(item)()
+
+
+def shrink_failure(evaluator: ConverterEvaluator, failure: FuzzFailure, max_steps: int = 500) -> FuzzFailure:
+    """Greedily minimise a failing input while it keeps violating the same invariant"""
+    value, parameter = failure.value, failure.parameter
+    for _ in range(max_steps):
+        progressed = False
+        for position in (0, 1):
+            current = value if position == 0 else parameter
+            for candidate in shrink_candidates(current):
+                if _complexity(candidate) >= _complexity(current):
+                    continue
+                trial = (candidate, parameter) if position == 0 else (value, candidate)
+                outcome = check_fuzz_case(evaluator, failure.converter_name, *trial)
+                if outcome is not None and outcome[0] == failure.invariant:
+                    value, parameter = trial
+                    progressed = True
+                    break
+        if not progressed:
+            break
+
+    failure.shrunk_value, failure.shrunk_parameter = value, parameter
+    return failure
+
+
+def _fuzz_worker(task: tuple[str, str, int, int]) -> tuple[str, int, list[FuzzFailure]]:
+    """Process-pool entry point: fuzz one chunk of cases for one converter"""
+    converter_name, chunk_seed, count, max_failures = task
+    evaluator = ConverterEvaluator()
+    rng = random.Random(chunk_seed)
+    failures = []
+    for _ in range(count):
+        value, parameter = fuzz_value(rng), fuzz_parameter(rng)
+        outcome = check_fuzz_case(evaluator, converter_name, value, parameter)
+        if outcome is not None:
+            failures.append(FuzzFailure(converter_name, outcome[0], value, parameter, outcome[1]))
+            if len(failures) >= max_failures:
+                break
+    return converter_name, count, failures
+
+
+class ConverterFuzzer:
+    """Drives randomized invariant checks for every converter across a process pool"""
+
+    def __init__(self, cases_per_converter: int = 20000, chunk_size: int = 2500,
+                 workers: int | None = None, seed: int = 1337, max_failures: int = 5):
+        self.cases_per_converter = cases_per_converter
+        self.chunk_size = chunk_size
+        self.workers = workers or os.cpu_count() or 1
+        self.seed = seed
+        self.max_failures = max_failures
+
+    def _tasks(self, converter_names: list[str]) -> list[tuple[str, str, int, int]]:
+        """Split each converter's case budget into independently seeded chunks"""
+        tasks = []
+        for name in converter_names:
+            remaining, chunk = self.cases_per_converter, 0
+            while remaining > 0:
+                count = min(self.chunk_size, remaining)
+                tasks.append((name, f"{self.seed}:{name}:{chunk}", count, self.max_failures))
+                remaining -= count
+                chunk += 1
+        return tasks
+
+    def run(self, converter_names: list[str]) -> list[FuzzReport]:
+        """Fuzz the named converters and return shrunk, de-duplicated failures"""
+        tasks = self._tasks(converter_names)
+        if self.workers == 1:
+            outcomes = list(map(_fuzz_worker, tasks))
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                outcomes = list(executor.map(_fuzz_worker, tasks, chunksize=4))
+
+        reports = {name: FuzzReport(name, 0, []) for name in converter_names}
+        evaluator = ConverterEvaluator()
+        seen: set[tuple[str, str, str, str]] = set()
+        for converter_name, cases, failures in outcomes:
+            report = reports[converter_name]
+            report.cases += cases
+            for failure in failures:
+                if len(report.failures) >= self.max_failures:
+                    break
+                shrunk = shrink_failure(evaluator, failure)
+                key = (converter_name, shrunk.invariant, repr(shrunk.shrunk_value), repr(shrunk.shrunk_parameter))
+                if key not in seen:
+                    seen.add(key)
+                    report.failures.append(shrunk)
+        return list(reports.values())
+
+    @staticmethod
+    def print_results(reports: list[FuzzReport]):
+        """Print per-converter fuzzing results with minimal reproducers"""
+        print("=" * 80)
+        print("WILEY WIDGET CONVERTER FUZZING RESULTS")
+        print("=" * 80)
+        total_cases = sum(report.cases for report in reports)
+        total_failures = sum(len(report.failures) for report in reports)
+        for report in reports:
+            status_icon = "✅" if not report.failures else "❌"
+            print(f"{status_icon} {report.converter_name:<36}{report.cases:>10,} cases"
+                  f"{len(report.failures):>4} failure(s)")
+            for failure in report.failures:
+                print(f"      [{failure.invariant}] {failure.detail}")
+                print(f"      Minimal:  value={failure.shrunk_value!r} parameter={failure.shrunk_parameter!r}")
+                print(f"      Original: value={failure.value!r} parameter={failure.parameter!r}")
+
+        print(f"\nTotal cases: {total_cases:,}  Failures: {total_failures}")
+        if total_failures == 0:
+            print("🎉 NO INVARIANT VIOLATIONS FOUND!")
+
+
+def run_fuzz(args: argparse.Namespace) -> int:
+    """Run the fuzzing mode and return an exit code"""
+    names = [suite.converter_name for suite in ConverterTestRunner().test_suites]
+    if args.converter:
+        names = [name for name in names if name in set(args.converter)]
+
+    fuzzer = ConverterFuzzer(cases_per_converter=args.fuzz_cases, workers=args.workers, seed=args.seed)
+    reports = fuzzer.run(names)
+    fuzzer.print_results(reports)
+    return 1 if any(report.failures for report in reports) else 0
+
+
+def run_benchmark(args: argparse.Namespace) -> int:
+    """Run the benchmark mode and return an exit code"""
+    runner = ConverterTestRunner()
+    suites = runner.test_suites
+    if args.converter:
+        wanted = set(args.converter)
+        suites = [suite for suite in suites if suite.converter_name in wanted]
+
+    benchmark = ConverterBenchmark(runner.evaluator, sample_size=args.sample_size,
+                                   repeats=args.repeats, seed=args.seed)
+    results = benchmark.run(suites)
+
+    baseline_path = Path(args.baseline)
+    baseline = benchmark.load_baseline(baseline_path)
+    regressions = benchmark.compare_to_baseline(results, baseline, threshold=args.threshold)
+    benchmark.print_results(results, regressions, baseline)
+
+    if args.save_baseline:
+        benchmark.save_baseline(results, baseline_path)
+        print(f"\n💾 Baseline saved to {baseline_path}")
+        return 0
+
+    return 1 if regressions else 0
+
+
 def main():
     """Main evaluation function"""
+    parser = argparse.ArgumentParser(description="Evaluate Wiley Widget converters")
+    parser.add_argument("--benchmark", action="store_true",
+                        help="Measure calls/second and allocations per call instead of correctness")
+    parser.add_argument("--fuzz", action="store_true",
+                        help="Run randomized invariant checks across a process pool")
+    parser.add_argument("--fuzz-cases", type=int, default=20000,
+                        help="Fuzz cases per converter (default: 20000)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Fuzzing worker processes (default: CPU count)")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE_PATH),
+                        help="Baseline JSON to compare against (and write with --save-baseline)")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Store this run as the new benchmark baseline")
+    parser.add_argument("--threshold", type=float, default=0.15,
+                        help="Relative change that counts as a regression (default: 0.15)")
+    parser.add_argument("--sample-size", type=int, default=2000,
+                        help="Generated inputs per converter (default: 2000)")
+    parser.add_argument("--repeats", type=int, default=7,
+                        help="Timed repeats per converter (default: 7)")
+    parser.add_argument("--seed", type=int, default=1337,
+                        help="Seed for the input generators (default: 1337)")
+    parser.add_argument("--converter", action="append",
+                        help="Limit the benchmark or fuzzing run to a converter (repeatable)")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        return run_benchmark(args)
+    if args.fuzz:
+        return run_fuzz(args)
+
     print("Starting Wiley Widget Converter Evaluation...")
     print("This will test all C# converters with comprehensive test cases.\n")
 
@@ -12,6 +12,8 @@ The generated manifest includes:
 - Language detection
 - Repository information
 - Structured data for AI consumption
+- Optionally, a symbol index of C# types/members, XAML x:Name/x:Key values and
+  Python defs with an inverted name index (--symbol-index, --find)
 
 Best practices incorporated:
 - Clear documentation and structure
@@ -24,11 +26,188 @@ import datetime
 import hashlib
 import json
 import mimetypes
+import mmap
+import os
+import re
 import subprocess
+import textwrap
+import threading
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 
+class FileClassifier:
+    """Precomputed lookup tables for per-file language and context classification.
+
+    Built once per run. Category rules are compiled into a character trie of path
+    prefixes plus exact-name and extension maps, each tagged with a priority so a
+    single walk of the path reproduces the original ordered if/elif chain.
+    """
+
+    # (priority, kind, pattern, category, importance) - lower priority wins.
+    CATEGORY_RULES = (
+        (1, "prefix", "src/", "source_code", "high"),
+        (1, "prefix", "WileyWidget.", "source_code", "high"),
+        (2, "prefix", "tests/", "test", "medium"),
+        (2, "contains", "test", "test", "medium"),
+        (3, "exact", "README.md", "documentation", "high"),
+        (3, "exact", "CONTRIBUTING.md", "documentation", "high"),
+        (3, "exact", "LICENSE", "documentation", "high"),
+        (4, "prefix", "docs/", "documentation", "medium"),
+        (5, "prefix", "scripts/", "automation", "medium"),
+        (6, "extension", ".csproj", "configuration", "high"),
+        (6, "extension", ".sln", "configuration", "high"),
+        (6, "extension", ".json", "configuration", "high"),
+        (6, "extension", ".config", "configuration", "high"),
+    )
+    DEFAULT_CATEGORY = (99, "unknown", "normal")
+
+    # Languages for files identified by name rather than extension.
+    FILENAME_LANGUAGES = {
+        "dockerfile": "Docker",
+        "containerfile": "Docker",
+        "makefile": "Makefile",
+        "license": "Text",
+        ".gitignore": "Git Ignore",
+        ".gitattributes": "Git Attributes",
+        ".editorconfig": "EditorConfig",
+        ".env.example": "Environment",
+    }
+
+    # Interpreter names found in "#!" lines.
+    SHEBANG_LANGUAGES = {
+        "python": "Python",
+        "python3": "Python",
+        "bash": "Shell",
+        "sh": "Shell",
+        "zsh": "Shell",
+        "pwsh": "PowerShell",
+        "node": "JavaScript",
+    }
+
+    def __init__(self, language_map: dict[str, str]):
+        self.language_map = language_map
+        self._trie: dict[str, Any] = {}
+        self._exact: dict[str, tuple[int, str, str]] = {}
+        self._extensions: dict[str, tuple[int, str, str]] = {}
+        self._contains: list[tuple[str, tuple[int, str, str]]] = []
+        # Prefix results depend only on the top-level segment when no prefix rule
+        # reaches past the first "/", so the trie is walked once per directory.
+        self._segment_rules: dict[str, tuple[int, str, str]] = {}
+        self._segment_cacheable = all(
+            "/" not in pattern[:-1]
+            for _, kind, pattern, _, _ in self.CATEGORY_RULES if kind == "prefix"
+        )
+
+        for priority, kind, pattern, category, importance in self.CATEGORY_RULES:
+            rule = (priority, category, importance)
+            if kind == "prefix":
+                node = self._trie
+                for char in pattern:
+                    node = node.setdefault(char, {})
+                node[None] = min(rule, node.get(None, rule))
+            elif kind == "exact":
+                self._exact[pattern] = rule
+            elif kind == "extension":
+                self._extensions[pattern] = rule
+            else:
+                self._contains.append((pattern, rule))
+
+    def _walk_prefixes(self, text: str) -> tuple[int, str, str]:
+        """Return the highest-priority prefix rule matching the start of text."""
+        best = self.DEFAULT_CATEGORY
+        node = self._trie
+        for char in text:
+            node = node.get(char)
+            if node is None:
+                break
+            rule = node.get(None)
+            if rule is not None and rule < best:
+                best = rule
+        return best
+
+    def category(self, file_path: str) -> tuple[str, str]:
+        """Return (category, importance) for a repository-relative path."""
+        segment, slash, _ = file_path.partition("/")
+        if slash and self._segment_cacheable:
+            best = self._segment_rules.get(segment)
+            if best is None:
+                best = self._segment_rules[segment] = self._walk_prefixes(segment + slash)
+        else:
+            best = self._walk_prefixes(file_path)
+        if best[0] == 1:
+            return best[1], best[2]
+
+        name = file_path.rpartition("/")[2]
+        dot = name.rfind(".")
+        extension = name[dot:] if dot > 0 else ""
+        for rule in (self._exact.get(file_path), self._extensions.get(extension)):
+            if rule is not None and rule < best:
+                best = rule
+
+        if self._contains and best[0] > self._contains[0][1][0]:
+            lowered = file_path.lower()
+            for needle, rule in self._contains:
+                if rule < best and needle in lowered:
+                    best = rule
+        return best[1], best[2]
+
+    def language(self, file_path: str, head: bytes = b"") -> str:
+        """Classify the language from the file name, extension and leading bytes."""
+        name = file_path.rsplit("/", 1)[-1]
+        lowered = name.lower()
+        language = self.FILENAME_LANGUAGES.get(lowered)
+        if language is None and lowered.startswith(("dockerfile.", "containerfile.")):
+            language = "Docker"
+        if language is None:
+            dot = lowered.rfind(".")
+            language = self.language_map.get(lowered[dot:], "Unknown") if dot > 0 else "Unknown"
+        if language == "Unknown" and head:
+            language = self.sniff_language(head)
+        return language
+
+    def sniff_language(self, head: bytes) -> str:
+        """Guess a language from the first bytes of an extensionless file."""
+        if head.startswith(b"#!"):
+            interpreter = head[2:head.find(b"\n") if b"\n" in head else None].decode("ascii", "ignore").split()
+            if interpreter:
+                program = interpreter[-1] if interpreter[0].endswith("/env") and len(interpreter) > 1 else interpreter[0]
+                return self.SHEBANG_LANGUAGES.get(program.rsplit("/", 1)[-1], "Unknown")
+        stripped = head.lstrip(b"\xef\xbb\xbf \t\r\n")
+        if stripped.startswith(b"<?xml"):
+            return "XML"
+        return "Unknown"
+
+    @staticmethod
+    def sniff_encoding(head: bytes) -> str:
+        """Detect the text encoding from a byte-order mark, defaulting to UTF-8."""
+        if head.startswith(b"\xef\xbb\xbf"):
+            return "utf-8-sig"
+        if head.startswith((b"\xff\xfe", b"\xfe\xff")):
+            return "utf-16"
+        return "utf-8"
+
+
+class _ProgressCounter:
+    """Thread-safe completion counter that reports roughly every 10%."""
+
+    def __init__(self, total: int, steps: int = 10):
+        self.total = total
+        self.interval = max(1, total // steps)
+        self.done = 0
+        self._lock = threading.Lock()
+
+    def advance(self) -> None:
+        with self._lock:
+            self.done += 1
+            done = self.done
+        if done % self.interval == 0 or done == self.total:
+            print(f"  [{done * 100 // self.total:3d}%] {done}/{self.total} files", flush=True)
+
+
 class RepoManifestGenerator:
     """Generates AI-fetchable repository manifests with comprehensive file metadata."""
 
@@ -81,8 +260,35 @@ class RepoManifestGenerator:
         '.gitattributes': 'Git Attributes',
     }
 
-    def __init__(self, repo_path: str = "."):
+    # Bumped whenever per-file metadata changes shape or meaning, so incremental
+    # runs do not reuse entries produced by an older classifier.
+    MANIFEST_VERSION = 2
+
+    # Descriptions for well-known files
+    FILE_DESCRIPTIONS = {
+        "README.md": "Main project documentation with overview, installation, and usage instructions",
+        "CONTRIBUTING.md": "Guidelines for contributing to the project",
+        "LICENSE": "Project license information",
+        ".gitignore": "Git ignore patterns for excluding files from version control",
+        "package.json": "Node.js package configuration and dependencies",
+        "requirements.txt": "Python package dependencies",
+        "pyproject.toml": "Python project configuration",
+        "WileyWidget.csproj": "C# project file with build configuration",
+        "WileyWidget.sln": "Visual Studio solution file",
+    }
+
+    # Streaming read settings: files are hashed and line-counted in fixed-size
+    # chunks, and files at or above the mmap threshold are scanned through a
+    # read-only memory map instead of buffered reads.
+    HASH_CHUNK_SIZE = 1024 * 1024
+    MMAP_THRESHOLD = 16 * 1024 * 1024
+    BINARY_SNIFF_SIZE = 1024
+
+    def __init__(self, repo_path: str = ".", workers: int | None = None):
         self.repo_path = Path(repo_path).resolve()
+        # Metadata extraction is stat/read bound, so threads overlap the I/O well.
+        self.workers = max(1, workers or min(32, (os.cpu_count() or 1) + 4))
+        self.classifier = FileClassifier(self.LANGUAGE_MAP)
         self.repo_info = self._get_repo_info()
         self.tracked_files = self._get_tracked_files()
 
@@ -126,6 +332,7 @@ class RepoManifestGenerator:
             "branch": branch or "main",
             "commit_hash": commit_hash,
             "is_dirty": is_dirty,
+            "manifest_version": self.MANIFEST_VERSION,
             "generated_at": datetime.datetime.now().isoformat()
         }
 
@@ -134,6 +341,45 @@ class RepoManifestGenerator:
         output = self._run_git_command(["ls-files"])
         return output.split("\n") if output else []
 
+    def _get_index_oids(self) -> dict[str, str]:
+        """Map each tracked path to its staged blob OID (git ls-files -s)."""
+        oids = {}
+        for line in self._run_git_command(["ls-files", "-s"]).splitlines():
+            info, _, path = line.partition("\t")
+            fields = info.split()
+            if path and len(fields) >= 2:
+                oids[path] = fields[1]
+        return oids
+
+    def _get_modified_paths(self) -> set[str]:
+        """Get tracked paths whose working tree no longer matches the index."""
+        output = self._run_git_command(["ls-files", "-m"])
+        return set(output.split("\n")) if output else set()
+
+    @staticmethod
+    def load_previous_entries(manifest_path: str | Path) -> dict[str, dict[str, Any]]:
+        """Index the file metadata of a previously written manifest (JSON or JSON lines) by path."""
+        entries: dict[str, dict[str, Any]] = {}
+        try:
+            with open(manifest_path, encoding='utf-8') as f:
+                if str(manifest_path).endswith(".jsonl"):
+                    records = (json.loads(line) for line in f if line.strip())
+                    repository = next(records, {})
+                    file_entries = (r for r in records if r.get("type") == "file")
+                else:
+                    previous = json.load(f)
+                    repository = previous.get("repository", {})
+                    file_entries = previous.get("files", [])
+                if repository.get("manifest_version") != RepoManifestGenerator.MANIFEST_VERSION:
+                    return {}
+                for entry in file_entries:
+                    path = entry.get("metadata", {}).get("path")
+                    if path:
+                        entries[path] = entry["metadata"]
+        except (OSError, ValueError):
+            return {}
+        return entries
+
     def _get_file_metadata(self, file_path: str) -> dict[str, Any]:
         """Get comprehensive metadata for a file."""
         full_path = self.repo_path / file_path
@@ -144,7 +390,7 @@ class RepoManifestGenerator:
             "size": 0,
             "last_modified": None,
             "extension": full_path.suffix.lower(),
-            "language": self.LANGUAGE_MAP.get(full_path.suffix.lower(), "Unknown"),
+            "language": self.classifier.language(file_path),
             "mime_type": mimetypes.guess_type(str(full_path))[0],
             "line_count": 0,
             "encoding": "utf-8",  # Assume UTF-8
@@ -157,23 +403,69 @@ class RepoManifestGenerator:
             metadata["size"] = stat.st_size
             metadata["last_modified"] = datetime.datetime.fromtimestamp(stat.st_mtime).isoformat()
 
-            # Check if binary
             try:
-                with open(full_path, 'rb') as f:
-                    chunk = f.read(1024)
-                    metadata["is_binary"] = b'\x00' in chunk
-                    if not metadata["is_binary"]:
-                        # Count lines for text files
-                        content = chunk.decode('utf-8', errors='ignore')
-                        metadata["line_count"] = len(content.splitlines())
-                        # Calculate SHA256
-                        f.seek(0)
-                        metadata["sha256"] = hashlib.sha256(f.read()).hexdigest()
+                sha256, newlines, is_binary, ends_with_newline, head = self._scan_file(full_path, stat.st_size)
+                metadata["sha256"] = sha256
+                metadata["is_binary"] = is_binary
+                if not is_binary:
+                    metadata["encoding"] = self.classifier.sniff_encoding(head)
+                    if metadata["language"] == "Unknown":
+                        metadata["language"] = self.classifier.sniff_language(head)
+                if not is_binary and stat.st_size:
+                    # A final line without a trailing newline still counts as a line.
+                    metadata["line_count"] = newlines + (0 if ends_with_newline else 1)
             except Exception:
                 metadata["is_binary"] = True
 
         return metadata
 
+    def _scan_file(self, full_path: Path, size: int) -> tuple[str, int, bool, bool, bytes]:
+        """Hash, count newlines and sniff for binary content in a single streaming pass.
+
+        Returns (sha256, newline_count, is_binary, ends_with_newline, head), where
+        head is the first BINARY_SNIFF_SIZE bytes for content classification.
+        Memory use is bounded by HASH_CHUNK_SIZE regardless of the file size.
+        """
+        digest = hashlib.sha256()
+        newlines = 0
+        last_byte = b""
+
+        with open(full_path, 'rb') as f:
+            if size >= self.MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    head = mapped[:self.BINARY_SNIFF_SIZE]
+                    is_binary = self._looks_binary(head)
+                    for offset in range(0, len(mapped), self.HASH_CHUNK_SIZE):
+                        chunk = mapped[offset:offset + self.HASH_CHUNK_SIZE]
+                        digest.update(chunk)
+                        newlines += chunk.count(b'\n')
+                    last_byte = mapped[-1:]
+                return digest.hexdigest(), newlines, is_binary, last_byte == b'\n', head
+
+            buffer = bytearray(self.HASH_CHUNK_SIZE)
+            view = memoryview(buffer)
+            is_binary = False
+            head = b""
+            first = True
+            while True:
+                read = f.readinto(buffer)
+                if not read:
+                    break
+                if first:
+                    head = bytes(view[:min(read, self.BINARY_SNIFF_SIZE)])
+                    is_binary = self._looks_binary(head)
+                    first = False
+                digest.update(view[:read])
+                newlines += buffer.count(b'\n', 0, read)
+                last_byte = buffer[read - 1:read]
+
+        return digest.hexdigest(), newlines, is_binary, last_byte == b'\n', head
+
+    @staticmethod
+    def _looks_binary(head: bytes) -> bool:
+        """NUL bytes mark binary content, except in BOM-tagged UTF-16 text."""
+        return b'\x00' in head and not head.startswith((b'\xff\xfe', b'\xfe\xff'))
+
     def _generate_file_urls(self, file_path: str) -> dict[str, str]:
         """Generate URLs for the file."""
         urls = {}
@@ -196,40 +488,9 @@ class RepoManifestGenerator:
             "related_files": []
         }
 
-        # Categorize files
-        if file_path.startswith("src/") or file_path.startswith("WileyWidget."):
-            context["category"] = "source_code"
-            context["importance"] = "high"
-        elif file_path.startswith("tests/") or "test" in file_path.lower():
-            context["category"] = "test"
-            context["importance"] = "medium"
-        elif file_path in ["README.md", "CONTRIBUTING.md", "LICENSE"]:
-            context["category"] = "documentation"
-            context["importance"] = "high"
-        elif file_path.startswith("docs/"):
-            context["category"] = "documentation"
-            context["importance"] = "medium"
-        elif file_path.startswith("scripts/"):
-            context["category"] = "automation"
-            context["importance"] = "medium"
-        elif any(file_path.endswith(ext) for ext in [".csproj", ".sln", ".json", ".config"]):
-            context["category"] = "configuration"
-            context["importance"] = "high"
-
-        # Add descriptions for common files
-        descriptions = {
-            "README.md": "Main project documentation with overview, installation, and usage instructions",
-            "CONTRIBUTING.md": "Guidelines for contributing to the project",
-            "LICENSE": "Project license information",
-            ".gitignore": "Git ignore patterns for excluding files from version control",
-            "package.json": "Node.js package configuration and dependencies",
-            "requirements.txt": "Python package dependencies",
-            "pyproject.toml": "Python project configuration",
-            "WileyWidget.csproj": "C# project file with build configuration",
-            "WileyWidget.sln": "Visual Studio solution file",
-        }
-
-        context["description"] = descriptions.get(file_path, f"{metadata['language']} file containing project code/data")
+        context["category"], context["importance"] = self.classifier.category(file_path)
+        context["description"] = self.FILE_DESCRIPTIONS.get(
+            file_path, f"{metadata['language']} file containing project code/data")
 
         # Extract dependencies for certain files
         if file_path == "requirements.txt" and not metadata["is_binary"]:
@@ -242,67 +503,474 @@ class RepoManifestGenerator:
 
         return context
 
-    def generate_manifest(self) -> dict[str, Any]:
-        """Generate the complete repository manifest."""
+    def iter_file_entries(self, previous_entries: dict[str, dict[str, Any]] | None = None) -> Iterator[dict[str, Any]]:
+        """Yield manifest file entries in path order.
+
+        When previous_entries (see load_previous_entries) is given, metadata is
+        reused for every path whose staged blob OID is unchanged and whose working
+        tree is clean; only the remaining paths are stat'ed, read and hashed.
+        Entries are produced through a bounded window of thread-pool futures, so
+        memory does not grow with the number of tracked files.
+        """
         print(f"Generating manifest for {len(self.tracked_files)} tracked files...")
 
-        files_data = []
-        for file_path in self.tracked_files:
-            if not file_path.strip():
-                continue
+        oids = self._get_index_oids()
+        modified = self._get_modified_paths()
+        file_paths = sorted(file_path for file_path in self.tracked_files if file_path.strip())
+        progress = _ProgressCounter(len(file_paths))
+        reused = 0
 
-            metadata = self._get_file_metadata(file_path)
-            urls = self._generate_file_urls(file_path)
-            context = self._get_file_context(file_path, metadata)
+        def build_entry(file_path: str) -> tuple[dict[str, Any], bool]:
+            # A dirty working tree means the index OID does not describe the
+            # content we hash, so such entries are never eligible for reuse.
+            oid = "" if file_path in modified else oids.get(file_path, "")
+            previous = previous_entries.get(file_path) if previous_entries else None
+            was_reused = bool(oid and previous and previous.get("git_oid") == oid)
+            if was_reused:
+                metadata = dict(previous)
+            else:
+                metadata = self._get_file_metadata(file_path)
+                metadata["git_oid"] = oid
 
             file_entry = {
                 "metadata": metadata,
-                "urls": urls,
-                "context": context
+                "urls": self._generate_file_urls(file_path),
+                "context": self._get_file_context(file_path, metadata)
             }
+            progress.advance()
+            return file_entry, was_reused
 
-            files_data.append(file_entry)
+        def results() -> Iterator[tuple[dict[str, Any], bool]]:
+            if self.workers == 1 or len(file_paths) < 2:
+                yield from map(build_entry, file_paths)
+                return
+            # Futures are drained in submission order, so output is identical to a
+            # serial run regardless of which thread finishes first.
+            window = self.workers * 4
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="manifest") as executor:
+                pending: deque = deque()
+                for file_path in file_paths:
+                    pending.append(executor.submit(build_entry, file_path))
+                    if len(pending) >= window:
+                        yield pending.popleft().result()
+                while pending:
+                    yield pending.popleft().result()
+
+        for file_entry, was_reused in results():
+            reused += was_reused
+            yield file_entry
 
-        # Sort files by path for consistent output
-        files_data.sort(key=lambda x: x["metadata"]["path"])
+        if previous_entries is not None:
+            print(f"Reused {reused} unchanged entries, scanned {len(file_paths) - reused} changed files")
 
-        manifest = {
+    def generate_manifest(self, previous_entries: dict[str, dict[str, Any]] | None = None) -> dict[str, Any]:
+        """Generate the complete repository manifest in memory."""
+        summary = ManifestSummary()
+        files_data = []
+        for file_entry in self.iter_file_entries(previous_entries):
+            summary.add(file_entry)
+            files_data.append(file_entry)
+
+        return {
             "repository": self.repo_info,
-            "summary": {
-                "total_files": len(files_data),
-                "total_size": sum(f["metadata"]["size"] for f in files_data),
-                "categories": {},
-                "languages": {}
-            },
+            "summary": summary.as_dict(),
             "files": files_data
         }
 
-        # Calculate summary statistics
-        for file_entry in files_data:
-            cat = file_entry["context"]["category"]
-            lang = file_entry["metadata"]["language"]
+    def save_manifest(self, output_path: str | None = None, incremental: bool = False,
+                      output_format: str = "json", shard_dir: str | None = None) -> str:
+        """Generate the manifest and stream it to disk.
 
-            manifest["summary"]["categories"][cat] = manifest["summary"]["categories"].get(cat, 0) + 1
-            manifest["summary"]["languages"][lang] = manifest["summary"]["languages"].get(lang, 0) + 1
-
-        return manifest
-
-    def save_manifest(self, output_path: str | None = None) -> str:
-        """Generate and save the manifest to a file."""
+        output_format is "json" (one document) or "jsonl" (one record per line).
+        With shard_dir, a summary index plus one shard per top-level directory is
+        written alongside. With incremental=True the existing manifest at
+        output_path seeds the run so only changed blobs are re-read.
+        """
         if output_path is None:
-            output_path = str(self.repo_path / "ai-fetchable-manifest.json")
+            suffix = ".jsonl" if output_format == "jsonl" else ".json"
+            output_path = str(self.repo_path / f"ai-fetchable-manifest{suffix}")
 
-        manifest = self.generate_manifest()
+        previous_entries = self.load_previous_entries(output_path) if incremental else None
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(manifest, f, indent=2, ensure_ascii=False)
+        writers: list[ManifestWriter] = [ManifestWriter(output_path, output_format)]
+        if shard_dir:
+            writers.append(ShardedManifestWriter(shard_dir))
+
+        summary = ManifestSummary()
+        try:
+            for writer in writers:
+                writer.begin(self.repo_info)
+            for file_entry in self.iter_file_entries(previous_entries):
+                summary.add(file_entry)
+                for writer in writers:
+                    writer.write(file_entry)
+            for writer in writers:
+                writer.finish(summary.as_dict())
+        except BaseException:
+            for writer in writers:
+                writer.abort()
+            raise
 
         print(f"Manifest saved to: {output_path}")
-        print(f"Total files: {manifest['summary']['total_files']}")
-        print(f"Total size: {manifest['summary']['total_size']} bytes")
+        if shard_dir:
+            print(f"Sharded manifest saved to: {shard_dir}")
+        print(f"Total files: {summary.total_files}")
+        print(f"Total size: {summary.total_size} bytes")
 
         return output_path
 
+
+class ManifestSummary:
+    """Running summary statistics accumulated one file entry at a time."""
+
+    def __init__(self):
+        self.total_files = 0
+        self.total_size = 0
+        self.categories: dict[str, int] = {}
+        self.languages: dict[str, int] = {}
+
+    def add(self, file_entry: dict[str, Any]) -> None:
+        cat = file_entry["context"]["category"]
+        lang = file_entry["metadata"]["language"]
+        self.total_files += 1
+        self.total_size += file_entry["metadata"]["size"]
+        self.categories[cat] = self.categories.get(cat, 0) + 1
+        self.languages[lang] = self.languages.get(lang, 0) + 1
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "total_files": self.total_files,
+            "total_size": self.total_size,
+            "categories": dict(self.categories),
+            "languages": dict(self.languages)
+        }
+
+
+def _indented_json(value: Any, prefix: str) -> str:
+    """Serialize a value with indent=2, shifted right to sit inside an enclosing document."""
+    return textwrap.indent(json.dumps(value, indent=2, ensure_ascii=False), prefix).lstrip()
+
+
+class _JsonDocumentStream:
+    """Writes {"<header keys>", "files": [...], "<trailer keys>"} one entry at a time.
+
+    The document goes to a temporary sibling file that replaces the target only
+    when finished, so an interrupted run never leaves a truncated manifest.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.temp_path = path.with_name(path.name + ".tmp")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.temp_path, 'w', encoding='utf-8')
+        self._count = 0
+
+    def begin(self, header: dict[str, Any]) -> None:
+        self._file.write("{\n")
+        for key, value in header.items():
+            self._file.write(f'  {json.dumps(key)}: {_indented_json(value, "  ")},\n')
+        self._file.write('  "files": [')
+
+    def write(self, value: Any) -> None:
+        self._file.write(",\n    " if self._count else "\n    ")
+        self._file.write(_indented_json(value, "    "))
+        self._count += 1
+
+    def finish(self, trailer: dict[str, Any]) -> None:
+        self._file.write("\n  ]" if self._count else "]")
+        for key, value in trailer.items():
+            self._file.write(f',\n  {json.dumps(key)}: {_indented_json(value, "  ")}')
+        self._file.write("\n}\n")
+        self._file.close()
+        os.replace(self.temp_path, self.path)
+
+    def abort(self) -> None:
+        self._file.close()
+        self.temp_path.unlink(missing_ok=True)
+
+
+class ManifestWriter:
+    """Streams a manifest as a single JSON document or as JSON lines.
+
+    JSON output keeps the repository/files/summary keys, but summary is written
+    after files because it is only known once every entry has been seen. JSON
+    lines output is one {"type": ...} record per line: repository, files, summary.
+    """
+
+    FORMATS = ("json", "jsonl")
+
+    def __init__(self, output_path: str | Path, output_format: str = "json"):
+        if output_format not in self.FORMATS:
+            raise ValueError(f"Unsupported manifest format: {output_format}")
+        self.output_path = Path(output_path)
+        self.output_format = output_format
+        self._document: _JsonDocumentStream | None = None
+        self._lines = None
+
+    def begin(self, repository: dict[str, Any]) -> None:
+        if self.output_format == "json":
+            self._document = _JsonDocumentStream(self.output_path)
+            self._document.begin({"repository": repository})
+        else:
+            self.output_path.parent.mkdir(parents=True, exist_ok=True)
+            self._temp_path = self.output_path.with_name(self.output_path.name + ".tmp")
+            self._lines = open(self._temp_path, 'w', encoding='utf-8')
+            self._write_line({"type": "repository", **repository})
+
+    def _write_line(self, record: dict[str, Any]) -> None:
+        self._lines.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+        self._lines.write("\n")
+
+    def write(self, file_entry: dict[str, Any]) -> None:
+        if self._document:
+            self._document.write(file_entry)
+        else:
+            self._write_line({"type": "file", **file_entry})
+
+    def finish(self, summary: dict[str, Any]) -> None:
+        if self._document:
+            self._document.finish({"summary": summary})
+        else:
+            self._write_line({"type": "summary", **summary})
+            self._lines.close()
+            os.replace(self._temp_path, self.output_path)
+
+    def abort(self) -> None:
+        if self._document:
+            self._document.abort()
+        elif self._lines:
+            self._lines.close()
+            self._temp_path.unlink(missing_ok=True)
+
+
+class ShardedManifestWriter:
+    """Writes index.json plus one shard per top-level directory under shard_dir.
+
+    Consumers read the small index first and fetch only the shards they need.
+    Files at the repository root go to the "_root" shard.
+    """
+
+    ROOT_SHARD = "_root"
+
+    def __init__(self, shard_dir: str | Path):
+        self.shard_dir = Path(shard_dir)
+        self._repository: dict[str, Any] = {}
+        self._shards: dict[str, _JsonDocumentStream] = {}
+        self._shard_stats: dict[str, ManifestSummary] = {}
+
+    @classmethod
+    def shard_name(cls, file_path: str) -> str:
+        head, sep, _ = file_path.partition("/")
+        return head if sep else cls.ROOT_SHARD
+
+    @staticmethod
+    def shard_file_name(shard: str) -> str:
+        # Leading dots (".github") would make hidden files on most systems.
+        return f"dot-{shard[1:]}.json" if shard.startswith(".") else f"{shard}.json"
+
+    def begin(self, repository: dict[str, Any]) -> None:
+        self._repository = repository
+        (self.shard_dir / "shards").mkdir(parents=True, exist_ok=True)
+
+    def write(self, file_entry: dict[str, Any]) -> None:
+        shard = self.shard_name(file_entry["metadata"]["path"])
+        stream = self._shards.get(shard)
+        if stream is None:
+            stream = _JsonDocumentStream(self.shard_dir / "shards" / self.shard_file_name(shard))
+            stream.begin({"directory": shard})
+            self._shards[shard] = stream
+            self._shard_stats[shard] = ManifestSummary()
+        stream.write(file_entry)
+        self._shard_stats[shard].add(file_entry)
+
+    def finish(self, summary: dict[str, Any]) -> None:
+        shards = []
+        for shard in sorted(self._shards):
+            stats = self._shard_stats[shard]
+            self._shards[shard].finish({"summary": stats.as_dict()})
+            shards.append({
+                "directory": shard,
+                "path": f"shards/{self.shard_file_name(shard)}",
+                "total_files": stats.total_files,
+                "total_size": stats.total_size
+            })
+
+        index = {"repository": self._repository, "summary": summary, "shards": shards}
+        index_path = self.shard_dir / "index.json"
+        temp_path = index_path.with_name("index.json.tmp")
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f, indent=2, ensure_ascii=False)
+        os.replace(temp_path, index_path)
+
+    def abort(self) -> None:
+        for stream in self._shards.values():
+            stream.abort()
+
+
+# Symbol kinds are stored as indexes into this tuple to keep the index compact.
+SYMBOL_KINDS = ("class", "interface", "struct", "record", "enum", "method", "property",
+                "x:Name", "x:Key", "def")
+_KIND_CODES = {kind: code for code, kind in enumerate(SYMBOL_KINDS)}
+
+_CS_MODIFIERS = r"(?:(?:public|private|protected|internal|static|virtual|override|async|sealed|abstract|partial|new|extern|unsafe|readonly|required)\s+)"
+_CS_TYPE_DECL = re.compile(r"\b(class|interface|struct|enum|record(?:\s+(?:struct|class)\b)?)\s+([A-Za-z_]\w*)")
+# String and char literals and comments are blanked before matching, so their words are never declarations
+_CS_NON_CODE = re.compile(r"""(?:\$@|@\$?)"(?:[^"]|"")*"|\$?"(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*'|//.*|/\*.*?(?:\*/|$)""")
+_CS_METHOD_DECL = re.compile(
+    rf"^\s*{_CS_MODIFIERS}+[\w<>\[\],.?]+(?:\s*<[^>]*>)?\s+([A-Za-z_]\w*)\s*(?:<[^>()]*>)?\s*\("
+)
+_CS_PROPERTY_DECL = re.compile(rf"^\s*{_CS_MODIFIERS}+[\w<>\[\],.?]+\s+([A-Za-z_]\w*)\s*(?:\{{|=>)")
+_CS_KEYWORDS = frozenset({"if", "for", "foreach", "while", "switch", "using", "lock", "return", "new", "catch"})
+_XAML_NAME_DECL = re.compile(r"\bx:(Name|Key)\s*=\s*\"([^\"{}]+)\"")
+_PY_DECL = re.compile(r"^\s*(?:async\s+)?(def|class)\s+([A-Za-z_]\w*)")
+
+
+def extract_symbols(full_path: str, language: str) -> list[list[Any]]:
+    """Extract [name, kind_code, line] symbol records from a C#, XAML or Python file.
+
+    This is a line-oriented scan rather than a parse: it is tolerant of files that
+    do not compile and cheap enough to run over every tracked source file.
+    """
+    try:
+        with open(full_path, encoding='utf-8', errors='replace') as f:
+            lines = f.readlines()
+    except OSError:
+        return []
+
+    symbols: list[list[Any]] = []
+    for number, line in enumerate(lines, start=1):
+        if language == "C#":
+            stripped = line.lstrip()
+            if stripped.startswith(("//", "*", "/*", "using ")):
+                continue
+            line = _CS_NON_CODE.sub('""', line)
+            type_match = _CS_TYPE_DECL.search(line)
+            if type_match and not stripped.startswith(("return", "new ", "var ")):
+                # "record struct" and "record class" are indexed as records
+                symbols.append([type_match.group(2), _KIND_CODES[type_match.group(1).split()[0]], number])
+                continue
+            method_match = _CS_METHOD_DECL.match(line)
+            if method_match and method_match.group(1) not in _CS_KEYWORDS:
+                symbols.append([method_match.group(1), _KIND_CODES["method"], number])
+                continue
+            property_match = _CS_PROPERTY_DECL.match(line)
+            if property_match:
+                symbols.append([property_match.group(1), _KIND_CODES["property"], number])
+        elif language == "XAML":
+            for kind, name in _XAML_NAME_DECL.findall(line):
+                symbols.append([name, _KIND_CODES[f"x:{kind}"], number])
+        elif language == "Python":
+            py_match = _PY_DECL.match(line)
+            if py_match:
+                kind = "def" if py_match.group(1) == "def" else "class"
+                symbols.append([py_match.group(2), _KIND_CODES[kind], number])
+    return symbols
+
+
+def _extract_symbols_task(task: tuple[str, str, str]) -> tuple[str, list[list[Any]]]:
+    """Process-pool entry point: extract symbols for one (path, full_path, language) task."""
+    file_path, full_path, language = task
+    return file_path, extract_symbols(full_path, language)
+
+
+class SymbolIndexBuilder:
+    """Builds a compact, incrementally updated symbol index for a repository.
+
+    Layout (written with compact separators):
+        {"version", "commit", "kinds": [...], "paths": [...],
+         "files": {path: {"oid": blob_oid, "symbols": [[name, kind, line], ...]}},
+         "names": {name: [[path_index, kind, line], ...]}}
+
+    "names" is the inverted index, so "where is X defined" is one dict lookup.
+    Per-file symbols are keyed by blob OID and reused when the blob is unchanged.
+    """
+
+    VERSION = 1
+    LANGUAGES = frozenset({"C#", "XAML", "Python"})
+
+    def __init__(self, generator: RepoManifestGenerator, workers: int | None = None):
+        self.generator = generator
+        self.workers = max(1, workers or os.cpu_count() or 1)
+
+    @classmethod
+    def load(cls, index_path: str | Path) -> dict[str, Any]:
+        """Load an existing index, returning an empty one when missing or stale."""
+        try:
+            with open(index_path, encoding='utf-8') as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return index if index.get("version") == cls.VERSION else {}
+
+    def build(self, previous: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Build the index, re-extracting only files whose blob OID changed."""
+        oids = self.generator._get_index_oids()
+        modified = self.generator._get_modified_paths()
+        previous_files = (previous or {}).get("files", {})
+
+        files: dict[str, dict[str, Any]] = {}
+        tasks = []
+        for file_path in sorted(p for p in self.generator.tracked_files if p.strip()):
+            language = self.generator.classifier.language(file_path)
+            if language not in self.LANGUAGES:
+                continue
+            oid = "" if file_path in modified else oids.get(file_path, "")
+            cached = previous_files.get(file_path)
+            if oid and cached and cached.get("oid") == oid:
+                files[file_path] = cached
+            else:
+                files[file_path] = {"oid": oid, "symbols": []}
+                tasks.append((file_path, str(self.generator.repo_path / file_path), language))
+
+        print(f"Symbol index: reusing {len(files) - len(tasks)} files, extracting {len(tasks)}")
+        if self.workers == 1 or len(tasks) < 2:
+            extracted = map(_extract_symbols_task, tasks)
+        else:
+            executor = ProcessPoolExecutor(max_workers=self.workers)
+            extracted = executor.map(_extract_symbols_task, tasks, chunksize=16)
+        try:
+            for file_path, symbols in extracted:
+                files[file_path]["symbols"] = symbols
+        finally:
+            if self.workers != 1 and len(tasks) >= 2:
+                executor.shutdown()
+
+        paths = list(files)
+        names: dict[str, list[list[Any]]] = {}
+        for path_index, file_path in enumerate(paths):
+            for name, kind, line in files[file_path]["symbols"]:
+                names.setdefault(name, []).append([path_index, kind, line])
+
+        return {
+            "version": self.VERSION,
+            "commit": self.generator.repo_info.get("commit_hash", ""),
+            "kinds": list(SYMBOL_KINDS),
+            "paths": paths,
+            "files": files,
+            "names": names,
+        }
+
+    def save(self, index_path: str | Path, incremental: bool = False) -> dict[str, Any]:
+        """Build and atomically write the index."""
+        index = self.build(self.load(index_path) if incremental else None)
+        index_path = Path(index_path)
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = index_path.with_name(index_path.name + ".tmp")
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(temp_path, index_path)
+        print(f"Symbol index saved to: {index_path} ({len(index['names'])} names)")
+        return index
+
+
+def lookup_symbol(index: dict[str, Any], name: str) -> list[dict[str, Any]]:
+    """Return the definitions of a symbol name from a loaded index."""
+    return [
+        {"path": index["paths"][path_index], "kind": index["kinds"][kind], "line": line}
+        for path_index, kind, line in index.get("names", {}).get(name, [])
+    ]
+
+
 def main():
     """Main entry point."""
     import argparse
@@ -319,11 +987,51 @@ def main():
         default=".",
         help="Repository path (default: current directory)"
     )
+    parser.add_argument(
+        "--workers", "-j",
+        type=int,
+        default=None,
+        help="Metadata extraction threads (default: min(32, CPU count + 4))"
+    )
+    parser.add_argument(
+        "--format", "-f",
+        choices=ManifestWriter.FORMATS,
+        default="json",
+        help="Manifest format: a single JSON document or JSON lines (default: json)"
+    )
+    parser.add_argument(
+        "--shard-dir",
+        help="Also write index.json plus per-directory shards into this directory"
+    )
+    parser.add_argument(
+        "--incremental", "-i",
+        action="store_true",
+        help="Reuse entries from the existing manifest for unchanged git blobs"
+    )
+    parser.add_argument(
+        "--symbol-index",
+        help="Also write a C#/XAML/Python symbol index to this path"
+    )
+    parser.add_argument(
+        "--find",
+        metavar="NAME",
+        help="Look up NAME in the symbol index given by --symbol-index and exit"
+    )
 
     args = parser.parse_args()
 
-    generator = RepoManifestGenerator(args.repo_path)
-    output_path = generator.save_manifest(args.output)
+    if args.find:
+        if not args.symbol_index:
+            parser.error("--find requires --symbol-index")
+        for definition in lookup_symbol(SymbolIndexBuilder.load(args.symbol_index), args.find):
+            print(f"{definition['path']}:{definition['line']}  {definition['kind']}")
+        return
+
+    generator = RepoManifestGenerator(args.repo_path, workers=args.workers)
+    output_path = generator.save_manifest(args.output, incremental=args.incremental,
+                                          output_format=args.format, shard_dir=args.shard_dir)
+    if args.symbol_index:
+        SymbolIndexBuilder(generator).save(args.symbol_index, incremental=args.incremental)
 
     print("\nManifest generation complete!")
     print(f"File: {output_path}")
@@ -6,11 +6,308 @@ This script loads environment variables from .env file securely
 
 import os
 import sys
+import ssl
+import json
+import time
+import asyncio
 import argparse
+import threading
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
+from urllib.parse import urlsplit
 
-def load_environment_variables(env_file: Path | None = None):
-    """Load environment variables from a .env-style file"""
+sys.path.insert(0, str(Path(__file__).parent))
+import env_parser
+
+KEY_VAULT_PREFIX = '@AzureKeyVault('
+SECRET_CACHE_PATH = Path.home() / '.cache' / 'wiley-widget' / 'keyvault-secrets.bin'
+SECRET_CACHE_TTL = 300
+SECRET_STUB_ENV = 'WILEY_WIDGET_SECRET_STUB'
+
+
+def parse_key_vault_reference(reference: str) -> tuple[str, str, str | None]:
+    """Split a Key Vault reference into (vault_url, secret_name, version).
+
+    Accepts https://vault-name.vault.azure.net/secrets/secret-name[/version],
+    optionally written as SecretUri=... like App Service references.
+    """
+    reference = reference.strip()
+    if reference.startswith('SecretUri='):
+        reference = reference[len('SecretUri='):]
+    vault_url, separator, rest = reference.partition('/secrets/')
+    parts = [part for part in rest.split('/') if part]
+    if not separator or not vault_url.startswith('https://') or not 1 <= len(parts) <= 2:
+        raise ValueError('Invalid Key Vault reference format')
+    return vault_url.rstrip('/').lower(), parts[0], parts[1] if len(parts) == 2 else None
+
+
+def secret_url(vault_url: str, name: str, version: str | None = None) -> str:
+    return f"{vault_url}/secrets/{name}" + (f"/{version}" if version else '')
+
+
+class AzureSecretProvider:
+    """Key Vault access sharing one credential and one SecretClient per vault"""
+
+    def __init__(self):
+        import azure.identity  # type: ignore
+        import azure.keyvault.secrets  # type: ignore
+
+        self._secret_client = azure.keyvault.secrets.SecretClient
+        self._credential = azure.identity.DefaultAzureCredential()
+        self._clients = {}
+        self._lock = threading.Lock()
+
+    def client(self, vault_url: str):
+        with self._lock:
+            client = self._clients.get(vault_url)
+            if client is None:
+                client = self._secret_client(vault_url=vault_url, credential=self._credential)
+                self._clients[vault_url] = client
+            return client
+
+    def get_secret(self, vault_url: str, name: str, version: str | None = None) -> str | None:
+        secret = self.client(vault_url).get_secret(name, version)
+        return secret.value if secret else None
+
+
+class StubSecretProvider:
+    """Offline secret provider for development and tests.
+
+    Secrets are keyed by secret URL, e.g.
+    {"https://wiley.vault.azure.net/secrets/SyncfusionLicenseKey": "value"}.
+    ``latency`` simulates the round trip of a real vault.
+    """
+
+    def __init__(self, secrets: dict[str, str], latency: float = 0.0):
+        self.secrets = {key.rstrip('/').lower(): value for key, value in secrets.items()}
+        self.latency = latency
+        self.requests = []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_file(cls, path: Path, latency: float = 0.0):
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f), latency)
+
+    def client(self, vault_url: str):
+        return self
+
+    def get_secret(self, vault_url: str, name: str, version: str | None = None) -> str | None:
+        with self._lock:
+            self.requests.append(secret_url(vault_url, name, version))
+        if self.latency:
+            time.sleep(self.latency)
+        return (self.secrets.get(secret_url(vault_url, name, version).lower())
+                or self.secrets.get(secret_url(vault_url, name).lower()))
+
+
+class DpapiCipher:
+    """Windows DPAPI encryption scoped to the current user"""
+
+    def __init__(self):
+        import ctypes
+        from ctypes import wintypes
+
+        class DataBlob(ctypes.Structure):
+            _fields_ = [('cbData', wintypes.DWORD), ('pbData', ctypes.POINTER(ctypes.c_char))]
+
+        self._ctypes = ctypes
+        self._blob = DataBlob
+        self._crypt32 = ctypes.windll.crypt32
+        self._kernel32 = ctypes.windll.kernel32
+
+    def _call(self, function, data: bytes) -> bytes:
+        ctypes = self._ctypes
+        buffer = ctypes.create_string_buffer(data, len(data))
+        blob_in = self._blob(len(data), ctypes.cast(buffer, ctypes.POINTER(ctypes.c_char)))
+        blob_out = self._blob()
+        # CRYPTPROTECT_UI_FORBIDDEN: never prompt
+        if not function(ctypes.byref(blob_in), None, None, None, None, 0x01, ctypes.byref(blob_out)):
+            raise ctypes.WinError()
+        try:
+            return ctypes.string_at(blob_out.pbData, blob_out.cbData)
+        finally:
+            self._kernel32.LocalFree(blob_out.pbData)
+
+    def encrypt(self, data: bytes) -> bytes:
+        return self._call(self._crypt32.CryptProtectData, data)
+
+    def decrypt(self, data: bytes) -> bytes:
+        return self._call(self._crypt32.CryptUnprotectData, data)
+
+
+class FernetCipher:
+    """Fernet encryption with a key file readable only by the current user"""
+
+    def __init__(self, key_path: Path):
+        from cryptography.fernet import Fernet  # type: ignore
+
+        if not key_path.exists():
+            key_path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(key_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(Fernet.generate_key())
+        self._fernet = Fernet(key_path.read_bytes())
+
+    def encrypt(self, data: bytes) -> bytes:
+        return self._fernet.encrypt(data)
+
+    def decrypt(self, data: bytes) -> bytes:
+        return self._fernet.decrypt(data)
+
+
+def default_cache_cipher(cache_path: Path = SECRET_CACHE_PATH):
+    """DPAPI on Windows, Fernet when cryptography is installed, otherwise None (no cache)"""
+    try:
+        if os.name == 'nt':
+            return DpapiCipher()
+        return FernetCipher(cache_path.with_suffix('.key'))
+    except (ImportError, OSError):
+        return None
+
+
+class SecretCache:
+    """Short-TTL encrypted cache of resolved secrets, keyed by secret URL.
+
+    Secret values are never written in plain text: without a cipher the cache
+    is disabled and every secret is fetched from the vault.
+    """
+
+    def __init__(self, path: Path = SECRET_CACHE_PATH, ttl: float = SECRET_CACHE_TTL, cipher=None,
+                 clock=time.time):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.cipher = cipher
+        self.clock = clock
+        self._entries = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.cipher is not None and self.ttl > 0
+
+    def _load(self) -> dict:
+        if self._entries is None:
+            self._entries = {}
+            if self.enabled and self.path.exists():
+                try:
+                    self._entries = json.loads(self.cipher.decrypt(self.path.read_bytes()))
+                except Exception:
+                    # Unreadable (other user, rotated key, corrupt): start over
+                    self._entries = {}
+        return self._entries
+
+    def get(self, url: str) -> str | None:
+        entry = self._load().get(url)
+        if entry and self.clock() - entry[0] < self.ttl:
+            return entry[1]
+        return None
+
+    def put_many(self, values: dict[str, str]):
+        if not self.enabled or not values:
+            return
+        now = self.clock()
+        entries = {url: entry for url, entry in self._load().items() if now - entry[0] < self.ttl}
+        entries.update({url: [now, value] for url, value in values.items()})
+        self._entries = entries
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_suffix('.tmp')
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(self.cipher.encrypt(json.dumps(entries).encode('utf-8')))
+        os.replace(temp_path, self.path)
+
+
+class KeyVaultResolver:
+    """Resolves all Key Vault references of an env file in one batch.
+
+    References are de-duplicated and grouped by vault, served from the cache
+    when fresh, and otherwise fetched concurrently through a bounded pool
+    sharing one provider (one credential, one client per vault).
+    """
+
+    def __init__(self, provider_factory=AzureSecretProvider, cache: SecretCache | None = None,
+                 max_workers: int = 8):
+        self.provider_factory = provider_factory
+        self.cache = cache
+        self.max_workers = max_workers
+
+    def resolve(self, references: dict[str, str]) -> tuple[dict[str, str], dict[str, str]]:
+        """Map env keys to references; returns (values, errors), both by env key"""
+        values, errors = {}, {}
+        wanted = {}  # secret url -> (vault_url, name, version, [env keys])
+        for key, reference in references.items():
+            try:
+                vault_url, name, version = parse_key_vault_reference(reference)
+            except ValueError as e:
+                errors[key] = str(e)
+                continue
+            url = secret_url(vault_url, name, version)
+            cached = self.cache.get(url) if self.cache else None
+            if cached is not None:
+                values[key] = cached
+            else:
+                wanted.setdefault(url, (vault_url, name, version, []))[3].append(key)
+
+        if not wanted:
+            return values, errors
+
+        try:
+            provider = self.provider_factory()
+        except ImportError:
+            errors.update({key: 'Azure SDK not available for Key Vault resolution'
+                           for *_, keys in wanted.values() for key in keys})
+            return values, errors
+        except Exception as e:
+            errors.update({key: f'Key Vault resolution failed: {e}' for *_, keys in wanted.values() for key in keys})
+            return values, errors
+
+        by_vault = {}
+        for url, (vault_url, name, version, keys) in wanted.items():
+            by_vault.setdefault(vault_url, []).append((url, name, version, keys))
+        print(f"  🔑 Resolving {len(wanted)} secret(s) from {len(by_vault)} Key Vault(s)")
+
+        fetched = {}
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(wanted))),
+                                thread_name_prefix='keyvault') as pool:
+            futures = []
+            for vault_url, secrets in by_vault.items():
+                provider.client(vault_url)
+                for url, name, version, keys in secrets:
+                    futures.append((url, keys, pool.submit(provider.get_secret, vault_url, name, version)))
+            for url, keys, future in futures:
+                try:
+                    value = future.result()
+                except Exception as e:
+                    errors.update({key: f'Key Vault resolution failed: {e}' for key in keys})
+                    continue
+                if not value:
+                    errors.update({key: 'Empty secret from Key Vault' for key in keys})
+                    continue
+                fetched[url] = value
+                values.update({key: value for key in keys})
+
+        if self.cache:
+            try:
+                self.cache.put_many(fetched)
+            except OSError as e:
+                print(f"  ⚠️  Could not write secret cache: {e}")
+        return values, errors
+
+
+def default_resolver(stub_path: Path | None = None, cache_ttl: float = SECRET_CACHE_TTL) -> KeyVaultResolver:
+    """Resolver for the CLI: a stub provider when configured, otherwise Azure with the cache"""
+    stub_path = stub_path or (Path(os.environ[SECRET_STUB_ENV]) if os.environ.get(SECRET_STUB_ENV) else None)
+    if stub_path:
+        return KeyVaultResolver(lambda: StubSecretProvider.from_file(stub_path))
+    return KeyVaultResolver(cache=SecretCache(ttl=cache_ttl, cipher=default_cache_cipher()))
+
+
+def load_environment_variables(env_file: Path | None = None, resolver: KeyVaultResolver | None = None,
+                               profile: str | None = None):
+    """Load environment variables from a .env-style file and its profile overlay"""
     if env_file is None:
         env_file = Path(__file__).parent.parent / '.env'
 
@@ -19,89 +316,55 @@ def load_environment_variables(env_file: Path | None = None):
         print("Create a .env file with your configuration variables.")
         return False
 
-    print("🔐 Loading environment variables from .env file...")
+    layers = env_parser.profile_paths(env_file, profile)
+    print(f"🔐 Loading environment variables from {' + '.join(path.name for path in layers)}...")
 
     loaded_count = 0
     error_count = 0
 
     try:
-        with open(env_file, 'r', encoding='utf-8') as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-
-                # Skip comments and empty lines
-                if not line or line.startswith('#'):
-                    continue
-
-                # Parse KEY=VALUE
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-
-                    # Remove quotes if present
-                    if (value.startswith('"') and value.endswith('"')) or \
-                       (value.startswith("'") and value.endswith("'")):
-                        value = value[1:-1]
-
-                    # Handle Azure Key Vault references
-                    if value.startswith('@AzureKeyVault(') and value.endswith(')'):
-                        kv_reference = value[15:-1]  # Remove @AzureKeyVault( and )
-                        print(f"  🔑 Resolving Key Vault reference: {kv_reference}")
-                        
-                        try:
-                            import azure.identity  # type: ignore
-                            import azure.keyvault.secrets  # type: ignore
-                            
-                            # Extract vault URL and secret name from reference
-                            # Format: https://vault-name.vault.azure.net/secrets/secret-name
-                            if '/secrets/' in kv_reference:
-                                vault_url = kv_reference.split('/secrets/')[0]
-                                secret_name = kv_reference.split('/secrets/')[1]
-                                
-                                credential = azure.identity.DefaultAzureCredential()
-                                client = azure.keyvault.secrets.SecretClient(vault_url=vault_url, credential=credential)
-                                
-                                secret = client.get_secret(secret_name)
-                                if secret and secret.value:
-                                    os.environ[key] = secret.value
-                                    loaded_count += 1
-                                    print(f"  ✅ {key} (from Key Vault)")
-                                else:
-                                    error_count += 1
-                                    print(f"  ❌ {key}: Empty secret from Key Vault")
-                            else:
-                                error_count += 1
-                                print(f"  ❌ {key}: Invalid Key Vault reference format")
-                        except ImportError:
-                            error_count += 1
-                            print(f"  ❌ {key}: Azure SDK not available for Key Vault resolution")
-                        except Exception as e:
-                            error_count += 1
-                            print(f"  ❌ {key}: Key Vault resolution failed: {str(e)}")
-                    else:
-                        # Regular environment variable
-                        try:
-                            os.environ[key] = value
-                            loaded_count += 1
-                            print(f"  ✅ {key}")
-                        except Exception as e:
-                            error_count += 1
-                            print(f"  ❌ {key}: {e}")
-                else:
-                    print(f"  ⚠️  Skipping invalid line {line_num}: {line}")
-
-    except Exception as e:
+        env = env_parser.load_profile(env_file, profile)
+        for path, line_num, line in env.invalid:
+            print(f"  ⚠️  Skipping invalid line {line_num} in {path.name}: {line}")
+        values = env.materialize()
+        for key, name in env.undefined:
+            print(f"  ⚠️  {key}: ${{{name}}} is not defined; left as written")
+    except (OSError, UnicodeDecodeError, env_parser.EnvParseError) as e:
         print(f"❌ Error reading .env file: {e}")
         return False
 
+    # Resolve every Azure Key Vault reference in one batch
+    references = {key: value[len(KEY_VAULT_PREFIX):-1] for key, value in values.items()
+                  if value.startswith(KEY_VAULT_PREFIX) and value.endswith(')')}
+    secrets, secret_errors = {}, {}
+    if references:
+        secrets, secret_errors = (resolver or default_resolver()).resolve(references)
+
+    for key, value in values.items():
+        if key in secret_errors:
+            error_count += 1
+            print(f"  ❌ {key}: {secret_errors[key]}")
+        elif key in secrets:
+            os.environ[key] = secrets[key]
+            loaded_count += 1
+            print(f"  ✅ {key} (from Key Vault)")
+        else:
+            # Regular environment variable
+            try:
+                os.environ[key] = value
+                loaded_count += 1
+                print(f"  ✅ {key}")
+            except Exception as e:
+                error_count += 1
+                print(f"  ❌ {key}: {e}")
+
     print(f"Loaded {loaded_count} environment variables")
     if error_count > 0:
         print(f"Failed to load {error_count} variables")
 
     return error_count == 0
 
-def unload_environment_variables(env_file: Path | None = None):
+def unload_environment_variables(env_file: Path | None = None, profile: str | None = None):
     """Unload environment variables (reset to system defaults)"""
     if env_file is None:
         env_file = Path(__file__).parent.parent / '.env'
@@ -115,35 +378,25 @@ def unload_environment_variables(env_file: Path | None = None):
     unloaded_count = 0
 
     try:
-        with open(env_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-
-                # Skip comments and empty lines
-                if not line or line.startswith('#'):
-                    continue
-
-                # Parse KEY=VALUE
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-
-                    # Remove from environment if it exists
-                    if key in os.environ:
-                        del os.environ[key]
-                        unloaded_count += 1
-                        print(f"  ✅ {key}")
-
-    except Exception as e:
+        # Keys only: values are never expanded here, and the parse is shared with --load
+        for key in env_parser.load_profile(env_file, profile).keys():
+            # Remove from environment if it exists
+            if key in os.environ:
+                del os.environ[key]
+                unloaded_count += 1
+                print(f"  ✅ {key}")
+
+    except (OSError, UnicodeDecodeError) as e:
         print(f"❌ Error reading .env file: {e}")
         return False
 
     print(f"Unloaded {unloaded_count} environment variables")
     return True
 
-def show_status():
+def show_status(env_file: Path | None = None, profile: str | None = None):
     """Show current environment variable status"""
-    env_file = Path(__file__).parent.parent / '.env'
+    if env_file is None:
+        env_file = Path(__file__).parent.parent / '.env'
 
     print("=== Environment Variables Status ===")
 
@@ -152,6 +405,16 @@ def show_status():
         return False
 
     print(f"📄 .env file: {env_file}")
+    try:
+        env = env_parser.load_profile(env_file, profile)
+        file_keys = env.keys()
+        print(f"  Layers: {' + '.join(path.name for path in env_parser.profile_paths(env_file, profile))}")
+        print(f"  Defined: {len(file_keys)}, set in environment: {sum(key in os.environ for key in file_keys)}")
+        if env.invalid:
+            print(f"  ⚠️  Invalid lines: {len(env.invalid)}")
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"❌ Error reading .env file: {e}")
+        return False
 
     # Check key environment variables
     key_vars = [
@@ -179,59 +442,173 @@ def show_status():
     print(f"Total key variables loaded: {loaded_count}/{len(key_vars)}")
     return loaded_count > 0
 
-def test_connections():
-    """Test Azure connections"""
-    print("=== Testing Azure Connections ===")
+@dataclass
+class ProbeResult:
+    """Outcome of one connectivity probe"""
 
-    # Check if required environment variables are set
-    kv_url = os.environ.get('AZURE_KEY_VAULT_URL')
-    if not kv_url:
-        print("❌ AZURE_KEY_VAULT_URL not set")
-        return False
+    name: str
+    target: str
+    ok: bool
+    latency_ms: float
+    detail: str
 
-    print(f"🔗 Testing connection to: {kv_url}")
 
-    # This would require azure-identity and azure-keyvault-secrets packages
+@dataclass
+class Probe:
+    """A named endpoint check; ``check`` is a coroutine function returning a detail string"""
+
+    name: str
+    target: str
+    check: Callable[[], Awaitable[str]]
+
+
+async def probe_tcp(host: str, port: int) -> str:
+    """Open (and close) a TCP connection"""
+    _, writer = await asyncio.open_connection(host, port)
+    writer.close()
+    await writer.wait_closed()
+    return 'TCP connect ok'
+
+
+async def probe_http(url: str, ssl_context: ssl.SSLContext | None = None) -> str:
+    """Send a HEAD request and read the status line; any HTTP status proves reachability"""
+    parts = urlsplit(url)
+    secure = parts.scheme == 'https'
+    port = parts.port or (443 if secure else 80)
+    context = (ssl_context or ssl.create_default_context()) if secure else None
+    reader, writer = await asyncio.open_connection(parts.hostname, port, ssl=context)
     try:
-        import azure.identity  # type: ignore
-        import azure.keyvault.secrets  # type: ignore
+        writer.write((f"HEAD {parts.path or '/'} HTTP/1.1\r\nHost: {parts.netloc}\r\n"
+                      "User-Agent: wiley-widget-load-env\r\nConnection: close\r\n\r\n").encode('ascii'))
+        await writer.drain()
+        status_line = (await reader.readline()).decode('latin-1').strip()
+    finally:
+        writer.close()
+    if not status_line.startswith('HTTP/'):
+        raise ConnectionError('no HTTP response')
+    return f"HTTP {status_line.split(' ', 2)[1]}"
+
+
+def _check_key_vault_secret(vault_url: str, secret_name: str = 'SyncfusionLicenseKey') -> str:
+    """Fetch a known secret through the SDK (blocking; run in a worker thread)"""
+    try:
+        provider = AzureSecretProvider()
+    except ImportError as ie:
+        raise RuntimeError(f"Azure SDK not installed: {ie} "
+                           "(pip install azure-identity azure-keyvault-secrets)") from ie
+    try:
+        if provider.get_secret(vault_url, secret_name):
+            return f"{secret_name} found and accessible"
+        raise RuntimeError(f"{secret_name} is empty")
+    except RuntimeError:
+        raise
+    except Exception as e:
+        # Connectivity is still proven if the vault answers a lighter call
+        next(iter(provider.client(vault_url).list_properties_of_secrets()), None)
+        return f"connected, but {secret_name} not readable: {e}"
+
 
-        credential = azure.identity.DefaultAzureCredential()
-        client = azure.keyvault.secrets.SecretClient(vault_url=kv_url, credential=credential)
+async def run_blocking(func, *args):
+    """Await a blocking call on a daemon thread.
 
-        # Try to get a specific secret instead of listing all
+    Unlike asyncio.to_thread, a call that outlives its probe deadline does not
+    hold up asyncio.run() or interpreter exit.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def settle(result, error):
+        if not future.done():
+            future.set_exception(error) if error else future.set_result(result)
+
+    def target():
         try:
-            secret = client.get_secret("SyncfusionLicenseKey")
-            if secret and secret.value:
-                print("✅ Successfully connected to Key Vault")
-                print("✅ Syncfusion license key found and accessible")
-                return True
-            else:
-                print("⚠️  Syncfusion license key is empty")
-                return False
+            outcome = (func(*args), None)
         except Exception as e:
-            print(f"❌ Could not retrieve Syncfusion license: {str(e)}")
-            # Try to at least test connectivity by getting vault properties
-            try:
-                # This is a lighter operation than listing secrets
-                vault_props = client.list_properties_of_secrets()  # type: ignore
-                print("✅ Key Vault connection successful (but Syncfusion secret not found)")
-                return True
-            except Exception as e2:
-                print(f"❌ Key Vault connection failed: {str(e2)}")
-                return False
+            outcome = (None, e)
+        try:
+            loop.call_soon_threadsafe(settle, *outcome)
+        except RuntimeError:
+            pass  # loop already closed: the probe timed out long ago
 
-    except ImportError as ie:
-        print(f"❌ Azure SDK not installed: {ie}")
-        print("Install with: pip install azure-identity azure-keyvault-secrets")
-        return False
-    except Exception as e:
-        print(f"❌ Connection test failed: {str(e)}")
-        # Don't crash - just report the error
-        import traceback
-        print(f"Stack trace: {traceback.format_exc()}")
+    threading.Thread(target=target, name='probe', daemon=True).start()
+    return await future
+
+
+def _sql_endpoint(server: str) -> tuple[str, int]:
+    """'tcp:name.database.windows.net,1433', 'host,port' or a bare server name -> (host, port)"""
+    server = server.strip().removeprefix('tcp:')
+    host, _, port = server.partition(',')
+    if port and not port.strip().isdigit():
+        raise ValueError(f"invalid port {port!r} in AZURE_SQL_SERVER")
+    if '.' not in host and host != 'localhost':
+        host = f"{host}.database.windows.net"
+    return host, int(port or 1433)
+
+
+async def probe_sql(server: str) -> str:
+    """Connect to an AZURE_SQL_SERVER value; parsing here lets a malformed value fail only this probe"""
+    return await probe_tcp(*_sql_endpoint(server))
+
+
+def connectivity_probes(environ=None) -> list[Probe]:
+    """Probes for the endpoints configured in the environment"""
+    environ = os.environ if environ is None else environ
+    probes = []
+    server = environ.get('AZURE_SQL_SERVER')
+    if server:
+        try:
+            target = '{}:{}'.format(*_sql_endpoint(server))
+        except ValueError:
+            target = server
+        probes.append(Probe('Azure SQL', target, lambda: probe_sql(server)))
+    kv_url = environ.get('AZURE_KEY_VAULT_URL')
+    if kv_url:
+        probes.append(Probe('Key Vault endpoint', kv_url, lambda: probe_http(kv_url)))
+        probes.append(Probe('Key Vault secret', kv_url,
+                            lambda: run_blocking(_check_key_vault_secret, kv_url)))
+    tenant = environ.get('AZURE_TENANT_ID')
+    if tenant:
+        authority = f"https://login.microsoftonline.com/{tenant}/v2.0/.well-known/openid-configuration"
+        probes.append(Probe('Azure AD', authority, lambda: probe_http(authority)))
+    return probes
+
+
+async def run_probes(probes: list[Probe], timeout: float = 5.0) -> list[ProbeResult]:
+    """Run all probes concurrently, each under its own deadline"""
+    async def run(probe):
+        start = time.perf_counter()
+        try:
+            detail = await asyncio.wait_for(probe.check(), timeout)
+            ok = True
+        except asyncio.TimeoutError:
+            detail, ok = f"timed out after {timeout:g}s", False
+        except Exception as e:
+            detail, ok = str(e) or type(e).__name__, False
+        return ProbeResult(probe.name, probe.target, ok, (time.perf_counter() - start) * 1000, detail)
+
+    return list(await asyncio.gather(*(run(probe) for probe in probes)))
+
+
+def test_connections(timeout: float = 5.0, probes: list[Probe] | None = None):
+    """Test Azure connections concurrently; total time is bounded by the slowest probe"""
+    print("=== Testing Azure Connections ===")
+
+    probes = connectivity_probes() if probes is None else probes
+    if not probes:
+        print("❌ No endpoints configured (AZURE_KEY_VAULT_URL, AZURE_SQL_SERVER, AZURE_TENANT_ID)")
         return False
 
+    print(f"🔗 Probing {len(probes)} endpoint(s), {timeout:g}s deadline each")
+    start = time.perf_counter()
+    results = asyncio.run(run_probes(probes, timeout))
+    for result in results:
+        icon = '✅' if result.ok else '❌'
+        print(f"  {icon} {result.name} ({result.target}): {result.latency_ms:.0f} ms - {result.detail}")
+    print(f"Checked in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    return all(result.ok for result in results)
+
 def main():
     parser = argparse.ArgumentParser(description='Environment Variable Manager')
     parser.add_argument('--load', action='store_true',
@@ -246,6 +623,15 @@ def main():
                        help='Use .env.production instead of .env')
     parser.add_argument('--env-file', type=str,
                        help='Explicit path to .env-style file')
+    parser.add_argument('--probe-timeout', type=float, default=5.0,
+                       help='Deadline in seconds for each --test-connections probe')
+    parser.add_argument('--profile', type=str,
+                       help='Profile overlay applied on top of the env file (e.g. Development -> .env.Development)')
+    parser.add_argument('--secret-stub', type=str,
+                       help=f'JSON file of secret URL -> value used instead of Azure Key Vault '
+                            f'(also ${SECRET_STUB_ENV})')
+    parser.add_argument('--secret-cache-ttl', type=float, default=SECRET_CACHE_TTL,
+                       help='Seconds resolved secrets stay in the encrypted local cache (0 disables)')
 
     args = parser.parse_args()
 
@@ -270,16 +656,17 @@ def main():
         env_path = Path(__file__).parent.parent / '.env.production'
 
     if args.load:
-        success &= load_environment_variables(env_path)
+        resolver = default_resolver(Path(args.secret_stub) if args.secret_stub else None, args.secret_cache_ttl)
+        success &= load_environment_variables(env_path, resolver, args.profile)
 
     if args.unload:
-        success &= unload_environment_variables(env_path)
+        success &= unload_environment_variables(env_path, args.profile)
 
     if args.status:
-        success &= show_status()
+        success &= show_status(env_path, args.profile)
 
     if args.test_connections:
-        success &= test_connections()
+        success &= test_connections(args.probe_timeout)
 
     return 0 if success else 1
 
@@ -2,18 +2,24 @@
 """
 Monitor Test Resources Script
 
-Monitors CPU/memory during dotnet test runs and parses coverage.cobertura.xml
+Monitors CPU/memory of the whole dotnet test process tree (including testhost)
+during test runs and parses coverage.cobertura.xml
 """
 
 import subprocess
 import sys
 import os
 import time
-import psutil
-import xml.etree.ElementTree as ET
 from pathlib import Path
 import debugpy
 
+sys.path.insert(0, str(Path(__file__).parent))
+from cobertura import diff_reports, format_diff, load_report, parse_cobertura
+from process_sampler import ProcessTreeSampler, format_summary
+from resource_history import DEFAULT_HISTORY_PATH, add_gate_arguments, gate_run, thresholds_from_args
+
+E2E_TEST = "WileyWidget.UiTests.EndToEndStartupTests.E2E_01_FullApplicationStartup_WithTiming"
+
 def setup_debugpy():
     """Setup debugpy for remote debugging"""
     debugpy.listen(("localhost", 5678))
@@ -21,75 +27,67 @@ def setup_debugpy():
     print("Attach debugger to continue...")
     debugpy.wait_for_client()
 
-def monitor_resources(process, duration=60):
-    """Monitor CPU and memory usage"""
+def monitor_resources(process, duration=60, interval=0.05, series_path=None):
+    """Sample CPU and memory of the process tree until it exits or duration elapses"""
+    sampler = ProcessTreeSampler(process.pid, interval=interval)
     start_time = time.time()
-    cpu_percent = []
-    memory_mb = []
 
     try:
-        while time.time() - start_time < duration and process.poll() is None:
-            try:
-                cpu = psutil.cpu_percent(interval=1)
-                mem = psutil.virtual_memory()
-                proc_mem = process.memory_info().rss / 1024 / 1024  # MB
-
-                cpu_percent.append(cpu)
-                memory_mb.append(proc_mem)
-
-                print(".1f")
-            except psutil.NoSuchProcess:
-                break
-
+        with sampler:
+            while time.time() - start_time < duration and process.poll() is None:
+                time.sleep(min(0.5, interval * 10))
+
+        summary = sampler.summary()
+        if series_path:
+            print(f"Resource time series written to {sampler.write_series(series_path)}")
+        if not sampler.count:
+            return {}
+
+        cpu = summary['cpu_percent']
+        memory = summary['rss_mb']
         return {
-            'cpu_avg': sum(cpu_percent) / len(cpu_percent) if cpu_percent else 0,
-            'cpu_max': max(cpu_percent) if cpu_percent else 0,
-            'memory_avg': sum(memory_mb) / len(memory_mb) if memory_mb else 0,
-            'memory_max': max(memory_mb) if memory_mb else 0
+            'cpu_avg': cpu['mean'],
+            'cpu_max': cpu['max'],
+            'memory_avg': memory['mean'],
+            'memory_max': memory['max'],
+            'summary': summary,
         }
     except Exception as e:
         print(f"Error monitoring resources: {e}")
         return {}
 
-def parse_coverage_xml(xml_file):
-    """Parse coverage XML file"""
+def parse_coverage_xml(xml_file, previous_report=None):
+    """Parse coverage XML file (streamed), optionally diffing against a previous report"""
     if not xml_file.exists():
         print(f"Coverage file not found: {xml_file}")
         return {}
 
     try:
-        tree = ET.parse(xml_file)
-        root = tree.getroot()
-
-        total_lines = 0
-        covered_lines = 0
-
-        for package in root.findall('.//package'):
-            for cls in package.findall('.//class'):
-                for line in cls.findall('.//line'):
-                    total_lines += 1
-                    if line.get('hits', '0') != '0':
-                        covered_lines += 1
-
-        coverage_percent = (covered_lines / total_lines * 100) if total_lines > 0 else 0
-
-        return {
-            'total_lines': total_lines,
-            'covered_lines': covered_lines,
-            'coverage_percent': coverage_percent
+        report = parse_cobertura(xml_file)
+        total = report.total
+        result = {
+            'total_lines': total.lines_valid,
+            'covered_lines': total.lines_covered,
+            'coverage_percent': total.line_percent,
+            'branch_percent': total.branch_percent,
+            'report': report,
         }
+        if previous_report:
+            result['changes'] = diff_reports(load_report(previous_report), report, threshold=0.1)
+        return result
     except Exception as e:
         print(f"Error parsing coverage XML: {e}")
         return {}
 
-def run_dotnet_test():
-    """Run dotnet test and monitor resources"""
+def run_dotnet_test(timeout=60, interval=0.05, series_path=None, previous_coverage=None,
+                    history_path=DEFAULT_HISTORY_PATH, thresholds=None, baseline_window=10, gate=True):
+    """Run dotnet test, monitor resources and gate on the resource history; returns True when it passed"""
     workspace_folder = Path(__file__).parent.parent
 
     cmd = [
         "dotnet", "test",
         str(workspace_folder / "WileyWidget.UiTests" / "WileyWidget.UiTests.csproj"),
-        "--filter", "FullyQualifiedName=WileyWidget.UiTests.EndToEndStartupTests.E2E_01_FullApplicationStartup_WithTiming",
+        "--filter", f"FullyQualifiedName={E2E_TEST}",
         "--collect:\"XPlat Code Coverage\"",
         "--results-directory:TestResults",
         "--logger", "console;verbosity=normal"
@@ -98,34 +96,56 @@ def run_dotnet_test():
     print(f"Running: {' '.join(cmd)}")
 
     try:
+        start = time.perf_counter()
         proc = subprocess.Popen(cmd, cwd=workspace_folder)
 
-        # Monitor resources for 60 seconds
-        resources = monitor_resources(proc, 60)
+        # Monitor resources until the run ends or the timeout elapses
+        resources = monitor_resources(proc, timeout, interval, series_path)
+        sampled_to_exit = proc.poll() is not None
 
         # Wait for process to complete
         proc.wait()
+        wall_s = time.perf_counter() - start
 
         print(f"Test exit code: {proc.returncode}")
 
         # Parse coverage
         coverage_file = workspace_folder / "TestResults" / "coverage.cobertura.xml"
-        coverage = parse_coverage_xml(coverage_file)
+        coverage = parse_coverage_xml(coverage_file, previous_coverage)
 
         # Report
         print("\n=== Resource Usage Report ===")
-        print(".1f")
-        print(".1f")
-        print(".1f")
-        print(".1f")
+        print(f"CPU average: {resources.get('cpu_avg', 0):.1f}%")
+        print(f"CPU peak: {resources.get('cpu_max', 0):.1f}%")
+        print(f"Memory average: {resources.get('memory_avg', 0):.1f}MB")
+        print(f"Memory peak: {resources.get('memory_max', 0):.1f}MB")
+        for line in format_summary(resources.get('summary', {})):
+            print(line)
 
         print("\n=== Coverage Report ===")
         print(f"Total lines: {coverage.get('total_lines', 0)}")
         print(f"Covered lines: {coverage.get('covered_lines', 0)}")
-        print(".1f")
+        print(f"Coverage: {coverage.get('coverage_percent', 0):.1f}%")
+        print(f"Branch coverage: {coverage.get('branch_percent', 0):.1f}%")
+        if 'changes' in coverage:
+            print(f"Changes vs {previous_coverage}: {len(coverage['changes'])}")
+            for line in format_diff(coverage['changes']):
+                print(line)
+
+        print("\n=== Resource Baseline ===")
+        regressions = gate_run(E2E_TEST, wall_s, resources.get('summary', {}), proc.returncode,
+                               source="monitor-test-resources", history_path=history_path,
+                               thresholds=thresholds, window=baseline_window, complete=sampled_to_exit)
+        if not sampled_to_exit:
+            print(f"Raise --timeout above {timeout}s to sample the whole run")
+        if regressions and gate:
+            print(f"❌ {len(regressions)} resource regression(s) versus the rolling baseline")
+            return False
+        return proc.returncode == 0
 
     except Exception as e:
         print(f"Error running test: {e}")
+        return False
 
 def main():
     import argparse
@@ -133,6 +153,13 @@ def main():
     parser.add_argument("--report", action="store_true", help="Generate detailed report")
     parser.add_argument("--timeout", type=int, default=60, help="Monitoring timeout in seconds")
     parser.add_argument("--debug", action="store_true", help="Enable debugpy debugging")
+    parser.add_argument("--interval", type=float, default=0.05,
+                        help="Sampling interval in seconds (default: 0.05)")
+    parser.add_argument("--series", type=Path,
+                        help="Write the sampled time series to this .csv or .parquet file")
+    parser.add_argument("--previous-coverage", type=Path,
+                        help="Previous coverage report (.json summary or Cobertura XML) to diff against")
+    add_gate_arguments(parser)
 
     args = parser.parse_args()
 
@@ -140,8 +167,10 @@ def main():
         setup_debugpy()
 
     print("Monitoring test resources...")
-    run_dotnet_test()
+    success = run_dotnet_test(args.timeout, args.interval, args.series, args.previous_coverage,
+                              args.history, thresholds_from_args(args), args.baseline_window, not args.no_gate)
     print("Monitoring completed")
+    return 0 if success else 1
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
@@ -8,12 +8,18 @@ and parses coverage.cobertura.xml for test coverage.
 
 import argparse
 import logging
-import psutil
 import subprocess
+import sys
 import time
-import xml.etree.ElementTree as ET
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent))
+from cobertura import parse_cobertura
+from process_sampler import ProcessTreeSampler, format_summary
+from resource_history import DEFAULT_HISTORY_PATH, add_gate_arguments, gate_run, thresholds_from_args
+
+E2E_TEST = "WileyWidget.UiTests.EndToEndStartupTests.E2E_01_FullApplicationStartup_WithTiming"
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -26,9 +32,16 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 class TestThreadMonitor:
-    def __init__(self, timeout=90, verbose=False):
+    def __init__(self, timeout=90, verbose=False, interval=0.05, series_path=None,
+                 history_path=DEFAULT_HISTORY_PATH, thresholds=None, baseline_window=10, gate=True):
         self.timeout = timeout
         self.verbose = verbose
+        self.interval = interval
+        self.series_path = series_path
+        self.history_path = history_path
+        self.thresholds = thresholds
+        self.baseline_window = baseline_window
+        self.gate = gate
 
     def run_test_with_monitoring(self):
         """Run dotnet test while monitoring resources"""
@@ -45,7 +58,7 @@ class TestThreadMonitor:
             # Start dotnet test process
             cmd = [
                 "dotnet", "test", str(project_path),
-                "--filter", "FullyQualifiedName=WileyWidget.UiTests.EndToEndStartupTests.E2E_01_FullApplicationStartup_WithTiming",
+                "--filter", f"FullyQualifiedName={E2E_TEST}",
                 "--verbosity", "normal",
                 "--collect", "XPlat Code Coverage",
                 "--results-directory", "TestResults/Monitoring"
@@ -63,7 +76,7 @@ class TestThreadMonitor:
             )
 
             # Monitor system resources while test runs
-            self.monitor_resources(process, start_time)
+            summary = self.monitor_resources(process, start_time)
 
             # Wait for completion
             stdout, stderr = process.communicate()
@@ -80,6 +93,15 @@ class TestThreadMonitor:
             if stderr:
                 logger.error(f"Stderr: {stderr}")
 
+            regressions = gate_run(E2E_TEST, total_time, summary, process.returncode,
+                                   source="monitor-test-thread", history_path=self.history_path,
+                                   thresholds=self.thresholds, window=self.baseline_window, report=logger.info)
+            for regression in regressions:
+                logger.error(f"Resource regression: {regression.metric} {regression.baseline:.2f} -> "
+                             f"{regression.current:.2f} (+{regression.change_pct:.1f}%)")
+            if regressions and self.gate:
+                return False
+
             return process.returncode == 0
 
         except Exception as e:
@@ -87,70 +109,47 @@ class TestThreadMonitor:
             return False
 
     def monitor_resources(self, test_process, start_time):
-        """Monitor CPU, memory, and disk usage"""
+        """Monitor CPU, memory, handles, threads and disk I/O of the test process tree"""
         try:
-            test_ps_process = psutil.Process(test_process.pid)
-
-            peak_cpu = 0
-            peak_memory = 0
-            disk_reads = 0
-            disk_writes = 0
-
-            logger.info("Starting resource monitoring...")
-
-            while test_process.poll() is None:
-                elapsed = time.time() - start_time
-
-                if elapsed > self.timeout:
-                    logger.warning(f"Test timeout reached ({self.timeout}s). Terminating.")
-                    test_process.terminate()
-                    try:
-                        test_process.wait(timeout=5)
-                    except subprocess.TimeoutExpired:
-                        test_process.kill()
-                    break
-
-                try:
-                    # CPU and memory
-                    cpu_percent = test_ps_process.cpu_percent(interval=1)
-                    memory_info = test_ps_process.memory_info()
-                    memory_mb = memory_info.rss / 1024 / 1024
-
-                    # Disk I/O
-                    io_counters = test_ps_process.io_counters()
-                    if io_counters:
-                        current_reads = io_counters.read_count
-                        current_writes = io_counters.write_count
-
-                        if disk_reads > 0:
-                            read_diff = current_reads - disk_reads
-                            write_diff = current_writes - disk_writes
-                            if read_diff > 0 or write_diff > 0:
-                                logger.info(f"[{elapsed:.2f}s] Disk I/O - Reads: {read_diff}, Writes: {write_diff}")
-
-                        disk_reads = current_reads
-                        disk_writes = current_writes
-
-                    # Track peaks
-                    peak_cpu = max(peak_cpu, cpu_percent)
-                    peak_memory = max(peak_memory, memory_mb)
-
-                    # Log significant resource usage
-                    if self.verbose or cpu_percent > 10 or memory_mb > 100:
-                        logger.info(f"[{elapsed:.2f}s] CPU: {cpu_percent:.1f}%, Memory: {memory_mb:.1f}MB")
-
-                except psutil.NoSuchProcess:
-                    break
-                except Exception as e:
-                    logger.error(f"Error monitoring resources: {e}")
-
-                time.sleep(2)
-
-            logger.info(f"Peak CPU usage: {peak_cpu:.1f}%")
-            logger.info(f"Peak memory usage: {peak_memory:.1f}MB")
+            sampler = ProcessTreeSampler(test_process.pid, interval=self.interval)
+            logger.info(f"Starting resource monitoring ({self.interval * 1000:.0f} ms interval)...")
+            last_report = 0.0
+
+            with sampler:
+                while test_process.poll() is None:
+                    elapsed = time.time() - start_time
+
+                    if elapsed > self.timeout:
+                        logger.warning(f"Test timeout reached ({self.timeout}s). Terminating.")
+                        test_process.terminate()
+                        try:
+                            test_process.wait(timeout=5)
+                        except subprocess.TimeoutExpired:
+                            test_process.kill()
+                        break
+
+                    # Periodic progress line from the latest sample
+                    if sampler.count and elapsed - last_report >= 2:
+                        last_report = elapsed
+                        index = (sampler.count - 1) % sampler.capacity
+                        cpu_percent = sampler.columns['cpu_percent'][index]
+                        memory_mb = sampler.columns['rss_mb'][index]
+                        if self.verbose or cpu_percent > 10 or memory_mb > 100:
+                            logger.info(f"[{elapsed:.2f}s] CPU: {cpu_percent:.1f}%, Memory: {memory_mb:.1f}MB, "
+                                        f"Processes: {sampler.columns['processes'][index]:.0f}")
+
+                    time.sleep(0.1)
+
+            summary = sampler.summary()
+            for line in format_summary(summary):
+                logger.info(line)
+            if self.series_path:
+                logger.info(f"Resource time series written to {sampler.write_series(self.series_path)}")
+            return summary
 
         except Exception as e:
             logger.error(f"Resource monitoring failed: {e}")
+            return {}
 
     def parse_coverage_results(self):
         """Parse coverage XML results"""
@@ -161,24 +160,11 @@ class TestThreadMonitor:
                 logger.warning("Coverage file not found")
                 return
 
-            tree = ET.parse(coverage_file)
-            root = tree.getroot()
-
-            # Extract coverage summary
-            total_lines = 0
-            covered_lines = 0
-
-            for package in root.findall(".//package"):
-                for cls in package.findall(".//class"):
-                    for line in cls.findall(".//line"):
-                        if line.get('type') == 'stmt':
-                            total_lines += 1
-                            if int(line.get('hits', 0)) > 0:
-                                covered_lines += 1
+            total = parse_cobertura(coverage_file).total
 
-            if total_lines > 0:
-                coverage_percent = (covered_lines / total_lines) * 100
-                logger.info(f"Code coverage: {coverage_percent:.1f}% ({covered_lines}/{total_lines} lines)")
+            if total.lines_valid > 0:
+                logger.info(f"Code coverage: {total.line_percent:.1f}% ({total.lines_covered}/{total.lines_valid} lines), "
+                            f"branches: {total.branch_percent:.1f}% ({total.branches_covered}/{total.branches_valid})")
             else:
                 logger.warning("No coverage data found")
 
@@ -189,13 +175,19 @@ def main():
     parser = argparse.ArgumentParser(description='Monitor Test Threading for WileyWidget')
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose logging')
     parser.add_argument('--timeout', '-t', type=int, default=90, help='Timeout in seconds')
+    parser.add_argument('--interval', type=float, default=0.05, help='Sampling interval in seconds')
+    parser.add_argument('--series', type=Path, help='Write the sampled time series to a .csv or .parquet file')
+    add_gate_arguments(parser)
 
     args = parser.parse_args()
 
     # Ensure logs directory exists
     Path('logs').mkdir(exist_ok=True)
 
-    monitor = TestThreadMonitor(timeout=args.timeout, verbose=args.verbose)
+    monitor = TestThreadMonitor(timeout=args.timeout, verbose=args.verbose, interval=args.interval,
+                                series_path=args.series, history_path=args.history,
+                                thresholds=thresholds_from_args(args), baseline_window=args.baseline_window,
+                                gate=not args.no_gate)
 
     success = monitor.run_test_with_monitoring()
 
@@ -203,6 +195,7 @@ def main():
         logger.info("Test monitoring completed successfully")
     else:
         logger.error("Test monitoring failed")
+    return 0 if success else 1
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
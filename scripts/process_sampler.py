@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Process Tree Sampler for WileyWidget
+High-resolution resource sampling of a process and all of its descendants
+(e.g. `dotnet test` plus its testhost children).
+
+Each sample aggregates CPU, RSS, handles (file descriptors on POSIX), threads
+and I/O bytes across the whole tree into a preallocated ring buffer, so long
+runs at sub-100 ms intervals use constant memory. Results are summarized as
+percentiles and can be written as a CSV (or Parquet, with pyarrow) time series.
+"""
+
+import csv
+import os
+import threading
+import time
+from array import array
+from pathlib import Path
+
+import psutil
+
+FIELDS = ("elapsed_s", "cpu_percent", "rss_mb", "handles", "threads", "read_mb", "write_mb", "processes")
+SUMMARY_FIELDS = ("cpu_percent", "rss_mb", "handles", "threads", "processes")
+
+
+def percentile(values, pct):
+    """Linear-interpolated percentile of a non-empty sequence"""
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+class ProcessTreeSampler:
+    """Samples a root process and its descendants into a fixed-size ring buffer.
+
+    CPU percent is the tree's CPU seconds per wall second (100 = one core).
+    Counters of processes that exit between samples are kept, so cumulative
+    I/O never goes backwards. The descendant list is refreshed every
+    ``tree_refresh`` seconds rather than on every sample to keep overhead low.
+    """
+
+    def __init__(self, root_pid, interval=0.05, capacity=72_000, tree_refresh=0.25):
+        self.root_pid = root_pid
+        self.interval = interval
+        self.capacity = capacity
+        self.tree_refresh = tree_refresh
+        self.columns = {name: array('d', bytes(8 * capacity)) for name in FIELDS}
+        self.count = 0
+        self.cpu_seconds = 0.0
+        self._processes = {}
+        self._cpu_by_pid = {}
+        self._io_by_pid = {}
+        self._io_done = [0, 0]
+        self._last_tree = float('-inf')
+        self._last = None
+        self._started = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _refresh_tree(self, now):
+        try:
+            root = self._processes.get(self.root_pid) or psutil.Process(self.root_pid)
+            tree = [root] + root.children(recursive=True)
+        except psutil.NoSuchProcess:
+            tree = []
+        # Reuse Process objects so psutil's per-process caches survive between samples
+        self._processes = {proc.pid: self._processes.get(proc.pid, proc) for proc in tree}
+        self._last_tree = now
+
+    def _retire(self, pid):
+        """Fold an exited process's I/O into the running totals"""
+        self._processes.pop(pid, None)
+        self._cpu_by_pid.pop(pid, None)
+        read, write = self._io_by_pid.pop(pid, (0, 0))
+        self._io_done[0] += read
+        self._io_done[1] += write
+
+    def sample(self):
+        """Take one sample; returns False once the whole tree has exited"""
+        now = time.perf_counter()
+        if self._started is None:
+            self._started = now
+        if now - self._last_tree >= self.tree_refresh:
+            self._refresh_tree(now)
+
+        rss = handles = threads = 0
+        for pid, proc in list(self._processes.items()):
+            try:
+                with proc.oneshot():
+                    cpu = proc.cpu_times()
+                    rss += proc.memory_info().rss
+                    threads += proc.num_threads()
+                    handles += proc.num_handles() if os.name == 'nt' else proc.num_fds()
+                    try:
+                        io = proc.io_counters()
+                        self._io_by_pid[pid] = (io.read_bytes, io.write_bytes)
+                    except (AttributeError, psutil.AccessDenied):
+                        pass
+            except psutil.NoSuchProcess:
+                self._retire(pid)
+                continue
+            except psutil.AccessDenied:
+                continue
+            self._cpu_by_pid[pid] = cpu.user + cpu.system
+
+        if not self._processes:
+            return False
+
+        # Stamp after reading the counters; CPU times tick at ~10 ms, so short intervals stay noisy
+        now = time.perf_counter()
+        previous = self._last[1] if self._last is not None else {}
+        # Only processes alive in both samples contribute to the rate, so exits do not read as
+        # negative CPU and a newly found process's past CPU does not spike this interval
+        delta = max(0.0, sum(cpu - previous[pid] for pid, cpu in self._cpu_by_pid.items() if pid in previous))
+        self.cpu_seconds += delta + sum(cpu for pid, cpu in self._cpu_by_pid.items() if pid not in previous)
+        cpu_percent = 0.0
+        if self._last is not None and now > self._last[0]:
+            cpu_percent = delta / (now - self._last[0]) * 100
+        self._last = (now, dict(self._cpu_by_pid))
+
+        read = self._io_done[0] + sum(io[0] for io in self._io_by_pid.values())
+        write = self._io_done[1] + sum(io[1] for io in self._io_by_pid.values())
+        row = (now - self._started, cpu_percent, rss / 1024 / 1024, handles, threads,
+               read / 1024 / 1024, write / 1024 / 1024, len(self._processes))
+        index = self.count % self.capacity
+        for name, value in zip(FIELDS, row):
+            self.columns[name][index] = value
+        self.count += 1
+        return True
+
+    def _run(self):
+        deadline = time.perf_counter()
+        while not self._stop.is_set() and self.sample():
+            # Fixed-rate schedule: sampling cost does not stretch the interval
+            deadline += self.interval
+            self._stop.wait(max(0.0, deadline - time.perf_counter()))
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="process-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+        return False
+
+    @property
+    def dropped(self):
+        """Samples overwritten because the ring buffer wrapped"""
+        return max(0, self.count - self.capacity)
+
+    def series(self, name):
+        """One column in chronological order"""
+        column = self.columns[name]
+        if self.count <= self.capacity:
+            return column[:self.count]
+        start = self.count % self.capacity
+        return column[start:] + column[:start]
+
+    def rows(self):
+        return zip(*(self.series(name) for name in FIELDS))
+
+    def summary(self):
+        """Percentiles per metric plus run totals"""
+        result = {'samples': self.count, 'dropped': self.dropped}
+        if not self.count:
+            return result
+        elapsed = self.series('elapsed_s')
+        result['duration_s'] = elapsed[-1]
+        result['interval_ms'] = (elapsed[-1] - elapsed[0]) / max(1, len(elapsed) - 1) * 1000
+        for name in SUMMARY_FIELDS:
+            values = self.series(name)
+            result[name] = {
+                'mean': sum(values) / len(values),
+                'p50': percentile(values, 50),
+                'p95': percentile(values, 95),
+                'p99': percentile(values, 99),
+                'max': max(values),
+            }
+        result['cpu_seconds'] = self.cpu_seconds
+        result['read_mb'] = self.series('read_mb')[-1]
+        result['write_mb'] = self.series('write_mb')[-1]
+        return result
+
+    def write_series(self, path):
+        """Write the time series as CSV, or Parquet for a .parquet path (needs pyarrow)"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.suffix == '.parquet':
+            try:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+            except ImportError as e:
+                raise RuntimeError("Parquet output requires pyarrow (pip install pyarrow)") from e
+            table = pa.table({name: list(self.series(name)) for name in FIELDS})
+            pq.write_table(table, path)
+            return path
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(FIELDS)
+            for row in self.rows():
+                writer.writerow(f"{value:.6g}" for value in row)
+        return path
+
+
+def format_summary(summary):
+    """Human-readable lines for a sampler summary"""
+    if not summary.get('samples'):
+        return ["No samples collected"]
+    lines = [f"Samples: {summary['samples']} over {summary['duration_s']:.1f}s "
+             f"(~{summary['interval_ms']:.0f} ms interval, {summary['dropped']} dropped)"]
+    units = {'cpu_percent': '%', 'rss_mb': 'MB'}
+    for name in SUMMARY_FIELDS:
+        stats = summary[name]
+        unit = units.get(name, '')
+        lines.append(f"{name:12} p50 {stats['p50']:8.1f}{unit}  p95 {stats['p95']:8.1f}{unit}  "
+                     f"p99 {stats['p99']:8.1f}{unit}  max {stats['max']:8.1f}{unit}")
+    lines.append(f"CPU time     {summary['cpu_seconds']:.2f}s")
+    lines.append(f"I/O          read {summary['read_mb']:.1f}MB  write {summary['write_mb']:.1f}MB")
+    return lines
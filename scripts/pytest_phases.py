@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Pytest Phase Splitting for WileyWidget
+Runs several marker-filtered test categories in one pytest process and splits
+the results back per category afterwards.
+
+Loaded as a plugin (``-p pytest_phases``), it reads the categories from the
+WILEY_WIDGET_PYTEST_PHASES environment variable, deselects tests that belong
+to none of them and tags every selected test with its categories. The tags end
+up as <property name="phases"> in the JUnit XML, which split_junit() streams
+into per-category tallies.
+"""
+
+import json
+import os
+import xml.etree.ElementTree as ET
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+PHASES_ENV = "WILEY_WIDGET_PYTEST_PHASES"
+PHASES_PROPERTY = "phases"
+
+
+@dataclass(frozen=True)
+class PytestSelection:
+    """One test category: a test file narrowed by required and excluded markers."""
+
+    key: str
+    path: str
+    require: Tuple[str, ...] = ()
+    exclude: Tuple[str, ...] = ()
+
+    @property
+    def marker_expression(self) -> str | None:
+        """The equivalent ``-m`` expression for a standalone run."""
+        terms = list(self.require) + [f"not {marker}" for marker in self.exclude]
+        return " and ".join(terms) or None
+
+    def matches(self, path: str, markers: Iterable[str]) -> bool:
+        markers = set(markers)
+        return (path == self.path and markers.issuperset(self.require)
+                and markers.isdisjoint(self.exclude))
+
+
+def dump_selections(selections: List[PytestSelection]) -> str:
+    return json.dumps([asdict(selection) for selection in selections])
+
+
+def load_selections(text: str) -> List[PytestSelection]:
+    return [PytestSelection(item["key"], item["path"], tuple(item["require"]), tuple(item["exclude"]))
+            for item in json.loads(text)]
+
+
+def pytest_collection_modifyitems(session, config, items):
+    """Keep only tests in a selected category and record which categories they belong to."""
+    text = os.environ.get(PHASES_ENV)
+    if not text:
+        return
+    selections = load_selections(text)
+    selected, deselected = [], []
+    for item in items:
+        path = item.nodeid.split("::", 1)[0]
+        markers = {marker.name for marker in item.iter_markers()}
+        keys = [selection.key for selection in selections if selection.matches(path, markers)]
+        if keys:
+            item.user_properties.append((PHASES_PROPERTY, ",".join(keys)))
+            selected.append(item)
+        else:
+            deselected.append(item)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+@dataclass
+class PhaseTally:
+    """Outcome counts for one category of a split run."""
+
+    passed: int = 0
+    failed: int = 0
+    errors: int = 0
+    skipped: int = 0
+    failures: List[str] = field(default_factory=list)
+
+    @property
+    def total(self) -> int:
+        return self.passed + self.failed + self.errors + self.skipped
+
+    @property
+    def success(self) -> bool:
+        # Like a standalone `pytest -m` run, an empty selection counts as a failure
+        return self.total > 0 and not self.failed and not self.errors
+
+    def summary(self) -> str:
+        if not self.total:
+            return "No tests collected"
+        lines = [f"{self.passed} passed, {self.failed} failed, {self.errors} errors, {self.skipped} skipped"]
+        lines.extend(self.failures)
+        return "\n".join(lines)
+
+
+def split_junit(xml_file: Path, keys: Iterable[str]) -> Dict[str, PhaseTally]:
+    """Stream a JUnit XML report into per-category tallies.
+
+    Each <testcase> is cleared once counted, so memory stays flat for large runs.
+    """
+    tallies = {key: PhaseTally() for key in keys}
+    for _, elem in ET.iterparse(str(xml_file), events=("end",)):
+        if elem.tag != "testcase":
+            continue
+        phases = [prop.get("value", "") for prop in elem.iter("property") if prop.get("name") == PHASES_PROPERTY]
+        outcome, message = "passed", ""
+        for child in elem:
+            if child.tag in ("failure", "error", "skipped"):
+                outcome, message = child.tag, (child.get("message") or "").split("\n", 1)[0]
+                break
+        name = "::".join(part for part in (elem.get("classname", ""), elem.get("name", "")) if part)
+        for key in ",".join(phases).split(","):
+            tally = tallies.get(key)
+            if tally is None:
+                continue
+            if outcome == "failure":
+                tally.failed += 1
+                tally.failures.append(f"FAILED {name}: {message}")
+            elif outcome == "error":
+                tally.errors += 1
+                tally.failures.append(f"ERROR {name}: {message}")
+            elif outcome == "skipped":
+                tally.skipped += 1
+            else:
+                tally.passed += 1
+        elem.clear()
+    return tallies
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Resource History for WileyWidget
+SQLite store of per-run resource profiles for monitored test runs, with
+rolling baselines and a regression gate.
+
+Each run records wall time, CPU-seconds and peak RSS of the whole test
+process tree. The baseline of a metric is the median of the last N successful
+runs of the same test; a run regresses when it exceeds the baseline by more
+than the metric's threshold and by more than an absolute noise floor.
+
+Usage:
+    python scripts/resource_history.py --test WileyWidget.UiTests.EndToEndStartupTests.E2E_01_FullApplicationStartup_WithTiming
+"""
+
+import argparse
+import socket
+import sqlite3
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+DEFAULT_HISTORY_PATH = Path(__file__).parent.parent / "TestResults" / "resource-history.sqlite"
+GATED_METRICS = ("wall_s", "cpu_seconds", "peak_rss_mb")
+DEFAULT_THRESHOLDS = {"wall_s": 0.20, "cpu_seconds": 0.20, "peak_rss_mb": 0.15}
+# Absolute changes below these are run-to-run noise, not regressions
+MIN_DELTAS = {"wall_s": 1.0, "cpu_seconds": 1.0, "peak_rss_mb": 25.0}
+UNITS = {"wall_s": "s", "cpu_seconds": "s", "peak_rss_mb": "MB"}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    test TEXT NOT NULL,
+    source TEXT,
+    started_at TEXT NOT NULL,
+    git_commit TEXT,
+    host TEXT,
+    exit_code INTEGER,
+    wall_s REAL,
+    cpu_seconds REAL,
+    peak_rss_mb REAL,
+    p95_cpu_percent REAL,
+    samples INTEGER
+);
+CREATE INDEX IF NOT EXISTS runs_by_test ON runs (test, id);
+"""
+
+
+@dataclass
+class ResourceRegression:
+    """A resource metric that moved past the allowed threshold versus the rolling baseline"""
+    metric: str
+    baseline: float
+    current: float
+    change_pct: float
+
+
+def run_metrics(wall_s, summary, exit_code):
+    """Row values for one run from its wall time and a ProcessTreeSampler summary"""
+    return {
+        "exit_code": exit_code,
+        "wall_s": wall_s,
+        "cpu_seconds": summary.get("cpu_seconds", 0.0),
+        "peak_rss_mb": summary.get("rss_mb", {}).get("max", 0.0),
+        "p95_cpu_percent": summary.get("cpu_percent", {}).get("p95", 0.0),
+        "samples": summary.get("samples", 0),
+    }
+
+
+def _git_commit():
+    try:
+        result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                timeout=5, cwd=Path(__file__).parent)
+        return result.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+class ResourceHistory:
+    """Run history backed by a local SQLite database"""
+
+    def __init__(self, path=DEFAULT_HISTORY_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(self.path)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.executescript(SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+
+    def record(self, test, metrics, source=None):
+        """Store one run; returns its id"""
+        row = {
+            "test": test,
+            "source": source,
+            "started_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git_commit": _git_commit(),
+            "host": socket.gethostname(),
+            **metrics,
+        }
+        with self.connection:
+            cursor = self.connection.execute(
+                f"INSERT INTO runs ({', '.join(row)}) VALUES ({', '.join('?' * len(row))})", tuple(row.values()))
+        return cursor.lastrowid
+
+    def recent(self, test, window=10, before_id=None):
+        """The last successful runs of a test with every gated metric recorded, newest first"""
+        measured = " AND ".join(f"{metric} > 0" for metric in GATED_METRICS)
+        query = f"SELECT * FROM runs WHERE test = ? AND exit_code = 0 AND {measured}"
+        params = [test]
+        if before_id is not None:
+            query += " AND id < ?"
+            params.append(before_id)
+        query += " ORDER BY id DESC LIMIT ?"
+        params.append(window)
+        return self.connection.execute(query, params).fetchall()
+
+    def baseline(self, test, window=10, min_runs=3, before_id=None):
+        """Median of each gated metric over the rolling window, or {} without enough history"""
+        rows = self.recent(test, window, before_id)
+        if len(rows) < min_runs:
+            return {}
+        return {metric: statistics.median(row[metric] for row in rows) for metric in GATED_METRICS}
+
+    def check(self, test, metrics, thresholds=None, window=10, min_runs=3, before_id=None):
+        """Compare a run against the rolling baseline; returns (baseline, regressions)"""
+        thresholds = {**DEFAULT_THRESHOLDS, **(thresholds or {})}
+        baseline = self.baseline(test, window, min_runs, before_id)
+        regressions = []
+        for metric, base in baseline.items():
+            current = metrics[metric]
+            delta = current - base
+            if base > 0 and delta > MIN_DELTAS[metric] and delta > base * thresholds[metric]:
+                regressions.append(ResourceRegression(metric, base, current, delta / base * 100))
+        return baseline, regressions
+
+
+def format_comparison(baseline, metrics, regressions):
+    """Table of current values against the baseline, regressions marked"""
+    if not baseline:
+        return ["No resource baseline yet (needs more successful runs)"]
+    regressed = {item.metric for item in regressions}
+    lines = [f"{'metric':12} {'baseline':>10} {'current':>10} {'change':>8}"]
+    for metric in GATED_METRICS:
+        base, current = baseline[metric], metrics[metric]
+        change = (current - base) / base * 100 if base else 0.0
+        unit = UNITS[metric]
+        marker = "  REGRESSION" if metric in regressed else ""
+        lines.append(f"{metric:12} {base:9.2f}{unit:1} {current:9.2f}{unit:1} {change:+7.1f}%{marker}")
+    return lines
+
+
+def gate_run(test, wall_s, summary, exit_code, source=None, history_path=DEFAULT_HISTORY_PATH,
+             thresholds=None, window=10, min_runs=3, report=print, complete=True):
+    """Record a monitored run and check it against history; returns the regressions
+
+    complete is False when sampling stopped before the run ended.
+    """
+    if not summary.get("samples"):
+        # A run without samples has no CPU/RSS figures and would drag the baseline down
+        report("No resource samples collected; run not recorded or compared against the baseline")
+        return []
+    if not complete:
+        # CPU-seconds and peak RSS stop at the cutoff while wall time covers the whole run
+        report("Run outlived the sampling window; not recorded or compared against the baseline")
+        return []
+    metrics = run_metrics(wall_s, summary, exit_code)
+    with ResourceHistory(history_path) as history:
+        run_id = history.record(test, metrics, source)
+        if exit_code != 0:
+            report("Run failed; recorded but not compared against the resource baseline")
+            return []
+        baseline, regressions = history.check(test, metrics, thresholds, window, min_runs, before_id=run_id)
+    for line in format_comparison(baseline, metrics, regressions):
+        report(line)
+    return regressions
+
+
+def add_gate_arguments(parser):
+    """CLI options shared by the monitored-test scripts"""
+    parser.add_argument("--history", type=Path, default=DEFAULT_HISTORY_PATH,
+                        help="SQLite resource history file")
+    parser.add_argument("--baseline-window", type=int, default=10,
+                        help="Successful runs in the rolling baseline (default: 10)")
+    parser.add_argument("--wall-threshold", type=float, default=DEFAULT_THRESHOLDS["wall_s"],
+                        help="Allowed wall time growth as a fraction (default: 0.20)")
+    parser.add_argument("--cpu-threshold", type=float, default=DEFAULT_THRESHOLDS["cpu_seconds"],
+                        help="Allowed CPU-seconds growth as a fraction (default: 0.20)")
+    parser.add_argument("--rss-threshold", type=float, default=DEFAULT_THRESHOLDS["peak_rss_mb"],
+                        help="Allowed peak RSS growth as a fraction (default: 0.15)")
+    parser.add_argument("--no-gate", action="store_true",
+                        help="Record the run but do not fail on resource regressions")
+
+
+def thresholds_from_args(args):
+    return {"wall_s": args.wall_threshold, "cpu_seconds": args.cpu_threshold, "peak_rss_mb": args.rss_threshold}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show resource history and rolling baselines")
+    parser.add_argument("--test", required=True, help="Test name the runs were recorded under")
+    parser.add_argument("--history", type=Path, default=DEFAULT_HISTORY_PATH, help="SQLite history file")
+    parser.add_argument("--window", type=int, default=10, help="Runs in the rolling baseline (default: 10)")
+    args = parser.parse_args()
+
+    with ResourceHistory(args.history) as history:
+        rows = history.recent(args.test, args.window)
+        if not rows:
+            print(f"No successful runs recorded for {args.test}")
+            return 1
+        print(f"{'id':>5} {'started':25} {'commit':9} {'wall_s':>8} {'cpu_s':>8} {'rss_mb':>8}")
+        for row in rows:
+            print(f"{row['id']:>5} {row['started_at']:25} {row['git_commit'] or '-':9} "
+                  f"{row['wall_s']:8.2f} {row['cpu_seconds']:8.2f} {row['peak_rss_mb']:8.1f}")
+        baseline = history.baseline(args.test, args.window, min_runs=1)
+        print("Baseline (median): " + ", ".join(f"{metric}={value:.2f}" for metric, value in baseline.items()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
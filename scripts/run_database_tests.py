@@ -4,6 +4,14 @@ Enterprise Database Test Runner
 
 Comprehensive test runner for enterprise database connections and features.
 Executes all database tests with detailed reporting and environment validation.
+
+Test phases form a dependency graph: only the .NET build is a prerequisite of
+the test phases, so independent phases run concurrently (bounded by --jobs)
+and each phase's output is streamed with a [phase] prefix.
+
+By default the pytest categories share a single pytest process: the
+pytest_phases plugin selects and tags their tests, and the JUnit XML report is
+split back per category, so interpreter start-up and collection are paid once.
 """
 
 import sys
@@ -11,14 +19,161 @@ import os
 import argparse
 import subprocess
 import json
+import tempfile
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Tuple, List
+from typing import Callable, Dict, Any, Tuple, List
 import time
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from pytest_phases import PHASES_ENV, PhaseTally, PytestSelection, dump_selections, split_junit
+
+SCRIPTS_DIR = Path(__file__).parent
+
+
+@dataclass
+class Phase:
+    """A test phase in the pipeline graph.
+
+    Attributes:
+        name: Display name, also used as the output prefix.
+        func: Callable returning True when the phase passes.
+        depends_on: Names of phases that must pass before this one starts.
+        result_key: Key the phase writes into the report results, if any.
+    """
+
+    name: str
+    func: Callable[[], bool]
+    depends_on: Tuple[str, ...] = ()
+    result_key: str | None = None
+
+
+@dataclass
+class PhaseOutcome:
+    """Result of one scheduled phase."""
+
+    status: str  # "passed", "failed", "error" or "skipped"
+    started: float | None = None
+    finished: float | None = None
+    error: str | None = None
+
+    @property
+    def duration(self) -> float:
+        if self.started is None or self.finished is None:
+            return 0.0
+        return self.finished - self.started
+
+
+@dataclass
+class PhaseScheduler:
+    """Runs phases as soon as their dependencies pass, at most max_workers at a time.
+
+    Phases whose dependency failed are skipped. A phase that raises stops any
+    further phases from starting; phases already running are allowed to finish.
+    """
+
+    phases: List[Phase]
+    max_workers: int = 4
+    log: Callable[..., None] = print
+    outcomes: Dict[str, PhaseOutcome] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        names = {phase.name for phase in self.phases}
+        for phase in self.phases:
+            missing = set(phase.depends_on) - names
+            if missing:
+                raise ValueError(f"Phase '{phase.name}' depends on unknown phases: {sorted(missing)}")
+        self._check_acyclic()
+
+    def _check_acyclic(self) -> None:
+        depends = {phase.name: phase.depends_on for phase in self.phases}
+        state: Dict[str, int] = {}
+
+        def visit(name: str, path: List[str]) -> None:
+            if state.get(name) == 2:
+                return
+            if state.get(name) == 1:
+                raise ValueError(f"Phase dependency cycle: {' -> '.join(path + [name])}")
+            state[name] = 1
+            for dependency in depends[name]:
+                visit(dependency, path + [name])
+            state[name] = 2
+
+        for phase in self.phases:
+            visit(phase.name, [])
+
+    def _run_phase(self, phase: Phase) -> bool:
+        self.outcomes[phase.name].started = time.perf_counter()
+        try:
+            return phase.func()
+        finally:
+            self.outcomes[phase.name].finished = time.perf_counter()
+
+    def run(self) -> bool:
+        """Run the graph; returns True if every phase passed."""
+        pending = {phase.name: phase for phase in self.phases}
+        running = {}
+        aborted = False
+
+        with ThreadPoolExecutor(max_workers=max(1, self.max_workers), thread_name_prefix="phase") as executor:
+            while pending or running:
+                for name, phase in list(pending.items()):
+                    statuses = [self.outcomes[dep].status if dep in self.outcomes else None
+                                for dep in phase.depends_on]
+                    if aborted or any(status not in (None, "running", "passed") for status in statuses):
+                        del pending[name]
+                        self.outcomes[name] = PhaseOutcome("skipped")
+                        self.log(f"⏭️ Phase '{name}' skipped")
+                    elif all(status == "passed" for status in statuses):
+                        del pending[name]
+                        self.outcomes[name] = PhaseOutcome("running")
+                        self.log(f"📋 Phase: {name}")
+                        running[executor.submit(self._run_phase, phase)] = phase
+                if not running:
+                    continue
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    phase = running.pop(future)
+                    outcome = self.outcomes[phase.name]
+                    try:
+                        passed = future.result()
+                    except Exception as e:
+                        outcome.status, outcome.error = "error", str(e)
+                        self.log(f"❌ Phase '{phase.name}' failed with exception: {e}", "ERROR")
+                        aborted = True
+                        continue
+                    outcome.status = "passed" if passed else "failed"
+                    if passed:
+                        self.log(f"✅ Phase '{phase.name}' completed successfully ({outcome.duration:.1f}s)")
+                    elif any(phase.name in other.depends_on for other in self.phases):
+                        self.log(f"❌ Critical phase '{phase.name}' failed. Skipping dependent phases.", "ERROR")
+                    else:
+                        self.log(f"❌ Phase '{phase.name}' failed ({outcome.duration:.1f}s)", "ERROR")
+
+        return all(outcome.status == "passed" for outcome in self.outcomes.values())
+
+    def critical_path(self) -> Tuple[float, List[str]]:
+        """Longest chain of executed phases by duration: the lower bound on pipeline time."""
+        by_name = {phase.name: phase for phase in self.phases}
+        best: Dict[str, Tuple[float, List[str]]] = {}
+
+        def longest(name: str) -> Tuple[float, List[str]]:
+            if name not in best:
+                chains = [longest(dep) for dep in by_name[name].depends_on]
+                length, chain = max(chains, default=(0.0, []))
+                best[name] = (length + self.outcomes[name].duration, chain + [name])
+            return best[name]
+
+        return max((longest(name) for name, outcome in self.outcomes.items() if outcome.started is not None),
+                   default=(0.0, []))
 
 
 class DatabaseTestRunner:
@@ -32,19 +187,28 @@ class DatabaseTestRunner:
         start_time: Timestamp when testing started.
     """
 
-    def __init__(self, environment: str = "Development", verbose: bool = False, azure_test: bool = False) -> None:
+    def __init__(self, environment: str = "Development", verbose: bool = False, azure_test: bool = False,
+                 jobs: int = 4, separate_runs: bool = False) -> None:
         """Initialize the database test runner.
 
         Args:
             environment: Target environment for testing.
             verbose: Whether to enable verbose output.
             azure_test: Whether to enable Azure SQL Database tests.
+            jobs: Maximum number of test phases running concurrently.
+            separate_runs: Run each pytest category in its own process instead
+                of one shared run split afterwards.
         """
         self.environment = environment
         self.verbose = verbose
         self.azure_test = azure_test
+        self.jobs = jobs
+        self.separate_runs = separate_runs
+        self.split_results: Dict[str, PhaseTally] = {}
         self.test_results: Dict[str, Dict[str, Any]] = {}
         self.start_time: float | None = None
+        self._output_lock = threading.Lock()
+        self._phase = threading.local()
 
     def log(self, message: str, level: str = "INFO") -> None:
         """Log a message with timestamp.
@@ -54,15 +218,57 @@ class DatabaseTestRunner:
             level: The log level (e.g., "INFO", "ERROR").
         """
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        print(f"[{timestamp}] [{level}] {message}")
+        with self._output_lock:
+            print(f"[{timestamp}] [{level}] {message}", flush=True)
+
+    def _stream_command(self, cmd: List[str] | str, prefix: str, timeout: int,
+                        env: Dict[str, str] | None = None) -> Tuple[int | None, str]:
+        """Run a command, echoing each output line with a [prefix] as it arrives.
 
-    def run_command(self, cmd: List[str] | str, description: str, timeout: int = 300) -> Tuple[bool, str]:
+        Returns:
+            A tuple of (return code or None on timeout, combined output).
+        """
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            errors="replace",
+            cwd=project_root,
+            env=env
+        )
+        timed_out = threading.Event()
+
+        def expire() -> None:
+            timed_out.set()
+            process.kill()
+
+        timer = threading.Timer(timeout, expire)
+        timer.start()
+        lines = []
+        try:
+            for line in process.stdout:
+                lines.append(line)
+                with self._output_lock:
+                    print(f"[{prefix}] {line.rstrip()}", flush=True)
+            process.wait()
+        finally:
+            timer.cancel()
+            process.stdout.close()
+        return (None if timed_out.is_set() else process.returncode), "".join(lines)
+
+    def run_command(self, cmd: List[str] | str, description: str, timeout: int = 300,
+                    env: Dict[str, str] | None = None) -> Tuple[bool, str]:
         """Run a command and capture output.
 
+        Inside a scheduled phase the output is streamed live, prefixed with
+        the phase name; otherwise it is captured and logged on failure.
+
         Args:
             cmd: The command to run (list or string).
             description: Description of the command for logging.
             timeout: Timeout in seconds for the command.
+            env: Environment for the command; inherits the current one if None.
 
         Returns:
             A tuple of (success: bool, output: str).
@@ -71,13 +277,22 @@ class DatabaseTestRunner:
         if self.verbose:
             self.log(f"Command: {' '.join(cmd) if isinstance(cmd, list) else cmd}")
 
+        prefix = getattr(self._phase, "name", None)
         try:
+            if prefix is not None:
+                returncode, output = self._stream_command(cmd, prefix, timeout, env)
+                if returncode is None:
+                    self.log(f"Command timed out after {timeout} seconds", "ERROR")
+                    return False, output + f"\nTimeout after {timeout} seconds"
+                return returncode == 0, output
+
             result = subprocess.run(
                 cmd,
                 capture_output=True,
                 text=True,
                 timeout=timeout,
-                cwd=project_root
+                cwd=project_root,
+                env=env
             )
 
             success = result.returncode == 0
@@ -181,6 +396,31 @@ class DatabaseTestRunner:
 
         self.log(f"Environment set to: {self.environment}")
 
+    def pytest_selections(self) -> Dict[str, PytestSelection]:
+        """The pytest test categories, keyed by their report result key.
+
+        Returns:
+            A dictionary of result key to test selection.
+        """
+        database_tests = "tests/test_enterprise_database_connections.py"
+        selections = [
+            PytestSelection("unit_tests", database_tests, ("unit",)),
+            PytestSelection("smoke_tests", database_tests, ("smoke",)),
+            PytestSelection("integration_tests", database_tests, ("integration", "database"),
+                            () if self.azure_test else ("azure",)),
+            PytestSelection("enterprise_tests", database_tests, ("enterprise",)),
+            PytestSelection("health_check_tests", "tests/test_health_checks.py"),
+        ]
+        return {selection.key: selection for selection in selections}
+
+    def _pytest_command(self, key: str, *extra: str) -> List[str]:
+        """Build the standalone pytest command for one test category."""
+        selection = self.pytest_selections()[key]
+        cmd = [sys.executable, "-m", "pytest", selection.path, "-v"]
+        if selection.marker_expression:
+            cmd += ["-m", selection.marker_expression]
+        return cmd + ["--tb=short", *extra]
+
     def run_unit_tests(self) -> bool:
         """Run unit tests for database configuration.
 
@@ -189,14 +429,7 @@ class DatabaseTestRunner:
         """
         self.log("Running database unit tests...")
 
-        cmd = [
-            sys.executable, "-m", "pytest",
-            "tests/test_enterprise_database_connections.py",
-            "-v",
-            "-m", "unit",
-            "--tb=short",
-            "--maxfail=5"
-        ]
+        cmd = self._pytest_command("unit_tests", "--maxfail=5")
 
         success, output = self.run_command(cmd, "Database unit tests")
         self.test_results["unit_tests"] = {"success": success, "output": output}
@@ -211,18 +444,7 @@ class DatabaseTestRunner:
         """
         self.log("Running database integration tests...")
 
-        markers = ["integration", "database"]
-        if not self.azure_test:
-            markers.append("not azure")
-
-        cmd = [
-            sys.executable, "-m", "pytest",
-            "tests/test_enterprise_database_connections.py",
-            "-v",
-            "-m", " and ".join(markers),
-            "--tb=short",
-            "--maxfail=3"
-        ]
+        cmd = self._pytest_command("integration_tests", "--maxfail=3")
 
         success, output = self.run_command(cmd, "Database integration tests")
         self.test_results["integration_tests"] = {"success": success, "output": output}
@@ -237,13 +459,7 @@ class DatabaseTestRunner:
         """
         self.log("Running enterprise feature tests...")
 
-        cmd = [
-            sys.executable, "-m", "pytest",
-            "tests/test_enterprise_database_connections.py",
-            "-v",
-            "-m", "enterprise",
-            "--tb=short"
-        ]
+        cmd = self._pytest_command("enterprise_tests")
 
         success, output = self.run_command(cmd, "Enterprise feature tests")
         self.test_results["enterprise_tests"] = {"success": success, "output": output}
@@ -258,12 +474,7 @@ class DatabaseTestRunner:
         """
         self.log("Running health check tests...")
 
-        cmd = [
-            sys.executable, "-m", "pytest",
-            "tests/test_health_checks.py",
-            "-v",
-            "--tb=short"
-        ]
+        cmd = self._pytest_command("health_check_tests")
 
         success, output = self.run_command(cmd, "Health check tests")
         self.test_results["health_check_tests"] = {"success": success, "output": output}
@@ -278,19 +489,66 @@ class DatabaseTestRunner:
         """
         self.log("Running database smoke tests...")
 
-        cmd = [
-            sys.executable, "-m", "pytest",
-            "tests/test_enterprise_database_connections.py",
-            "-v",
-            "-m", "smoke",
-            "--tb=short"
-        ]
+        cmd = self._pytest_command("smoke_tests")
 
         success, output = self.run_command(cmd, "Database smoke tests")
         self.test_results["smoke_tests"] = {"success": success, "output": output}
 
         return success
 
+    def run_split_tests(self, keys: List[str]) -> bool:
+        """Run several pytest categories in one process and split the results.
+
+        No per-category --maxfail applies here, since stopping early would cut
+        off the other categories. If the run fails without reporting any
+        test (usage error, crash, timeout) every category is recorded as
+        failed with the run's output.
+
+        Args:
+            keys: Result keys of the categories to run.
+
+        Returns:
+            True if the run produced a report, False otherwise.
+        """
+        self.log("Running database test categories in one pytest run...")
+
+        selections = [self.pytest_selections()[key] for key in keys]
+        paths = list(dict.fromkeys(selection.path for selection in selections))
+        env = dict(os.environ)
+        env[PHASES_ENV] = dump_selections(selections)
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SCRIPTS_DIR), env.get("PYTHONPATH")]))
+
+        with tempfile.TemporaryDirectory(prefix="database-tests-") as tmp:
+            junit = Path(tmp) / "junit.xml"
+            cmd = [sys.executable, "-m", "pytest", *paths, "-p", "pytest_phases", "-v", "--tb=short",
+                   f"--junitxml={junit}"]
+            success, output = self.run_command(cmd, f"Database tests ({', '.join(keys)})", timeout=900, env=env)
+            try:
+                self.split_results = split_junit(junit, keys)
+            except (OSError, SyntaxError) as e:
+                self.log(f"No usable test report: {e}", "ERROR")
+                self.split_results = {}
+
+        # A failed run that reported no tests at all never got to run them (bad path, crash)
+        if not success and not any(tally.total for tally in self.split_results.values()):
+            for key in keys:
+                self.test_results[key] = {"success": False, "output": output}
+            return False
+        return True
+
+    def record_split_result(self, key: str) -> bool:
+        """Record one category of a split run in the test results.
+
+        Args:
+            key: Result key of the category.
+
+        Returns:
+            True if the category passed, False otherwise.
+        """
+        tally = self.split_results.get(key, PhaseTally())
+        self.test_results[key] = {"success": tally.success, "output": tally.summary()}
+        return tally.success
+
     def test_dotnet_build(self) -> bool:
         """Test that the .NET application builds successfully.
 
@@ -404,34 +662,7 @@ class DatabaseTestRunner:
         # Setup
         self.setup_test_environment()
 
-        # Run test phases
-        test_phases = [
-            ("Environment Setup", lambda: True),  # Already done
-            (".NET Build", self.test_dotnet_build),
-            ("Unit Tests", self.run_unit_tests),
-            ("Smoke Tests", self.run_smoke_tests),
-            ("Integration Tests", self.run_integration_tests),
-            ("Enterprise Features", self.run_enterprise_feature_tests),
-            ("Health Checks", self.run_health_check_tests),
-            ("Migration Readiness", self.test_database_migration)
-        ]
-
-        all_passed = True
-        for phase_name, phase_func in test_phases:
-            self.log(f"📋 Phase: {phase_name}")
-            try:
-                phase_success = phase_func()
-                if not phase_success:
-                    all_passed = False
-                    if phase_name in ["Environment Setup", ".NET Build"]:
-                        self.log(f"❌ Critical phase '{phase_name}' failed. Aborting.", "ERROR")
-                        break
-                else:
-                    self.log(f"✅ Phase '{phase_name}' completed successfully")
-            except Exception as e:
-                self.log(f"❌ Phase '{phase_name}' failed with exception: {e}", "ERROR")
-                all_passed = False
-                break
+        all_passed = self.run_phases(self.test_phases())
 
         # Generate and display report
         report = self.generate_report()
@@ -448,6 +679,77 @@ class DatabaseTestRunner:
 
         return all_passed
 
+    def test_phases(self) -> List[Phase]:
+        """The phase graph for a full run.
+
+        Everything after the build is independent. In the default mode the
+        pytest categories depend on one shared pytest run and only split its
+        results; with separate_runs each category runs its own process.
+
+        Returns:
+            The phases in report order.
+        """
+        build = (".NET Build",)
+        categories = [
+            ("Unit Tests", self.run_unit_tests, "unit_tests"),
+            ("Smoke Tests", self.run_smoke_tests, "smoke_tests"),
+            ("Integration Tests", self.run_integration_tests, "integration_tests"),
+            ("Enterprise Features", self.run_enterprise_feature_tests, "enterprise_tests"),
+            ("Health Checks", self.run_health_check_tests, "health_check_tests"),
+        ]
+
+        phases = [
+            Phase("Environment Setup", lambda: True),  # Already done
+            Phase(".NET Build", self.test_dotnet_build, ("Environment Setup",), "dotnet_build"),
+        ]
+        if self.separate_runs:
+            phases += [Phase(name, func, build, key) for name, func, key in categories]
+        else:
+            keys = [key for _, _, key in categories]
+            phases.append(Phase("Python Tests", lambda: self.run_split_tests(keys), build))
+            phases += [Phase(name, lambda key=key: self.record_split_result(key), ("Python Tests",), key)
+                       for name, _, key in categories]
+        phases.append(Phase("Migration Readiness", self.test_database_migration, build, "migration_test"))
+        return phases
+
+    def run_phases(self, phases: List[Phase]) -> bool:
+        """Run phases through the dependency scheduler.
+
+        Results are reordered to the declared phase order afterwards, so the
+        report does not depend on which phase happened to finish first.
+
+        Args:
+            phases: The phase graph to run.
+
+        Returns:
+            True if every phase passed, False otherwise.
+        """
+        scheduled = [Phase(phase.name, self._in_phase(phase), phase.depends_on, phase.result_key)
+                     for phase in phases]
+        scheduler = PhaseScheduler(scheduled, max_workers=self.jobs, log=self.log)
+        all_passed = scheduler.run()
+
+        order = [phase.result_key for phase in phases if phase.result_key]
+        self.test_results = {
+            **{key: self.test_results[key] for key in order if key in self.test_results},
+            **{key: value for key, value in self.test_results.items() if key not in order}
+        }
+
+        elapsed = sum(outcome.duration for outcome in scheduler.outcomes.values())
+        length, chain = scheduler.critical_path()
+        self.log(f"⏱️ Phase time {elapsed:.1f}s, critical path {length:.1f}s ({' -> '.join(chain)})")
+        return all_passed
+
+    def _in_phase(self, phase: Phase) -> Callable[[], bool]:
+        """Wrap a phase function so its commands stream under the phase's prefix."""
+        def run() -> bool:
+            self._phase.name = phase.name
+            try:
+                return phase.func()
+            finally:
+                self._phase.name = None
+        return run
+
 
 def main() -> None:
     """Main entry point."""
@@ -468,6 +770,17 @@ def main() -> None:
         action="store_true",
         help="Enable Azure SQL Database tests (requires Azure resources)"
     )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=4,
+        help="Maximum number of test phases to run concurrently (default: 4, 1 runs them in sequence)"
+    )
+    parser.add_argument(
+        "--separate-runs",
+        action="store_true",
+        help="Run each pytest category in its own process instead of one shared run"
+    )
     parser.add_argument(
         "--unit-only",
         action="store_true",
@@ -484,7 +797,9 @@ def main() -> None:
     runner = DatabaseTestRunner(
         environment=args.environment,
         verbose=args.verbose,
-        azure_test=args.azure_test
+        azure_test=args.azure_test,
+        jobs=args.jobs,
+        separate_runs=args.separate_runs
     )
 
     # Run specific test types if requested
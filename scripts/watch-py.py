@@ -2,26 +2,46 @@
 """
 Python Watch Mode Script for Wiley Widget
 Watches Python files for changes and auto-restarts the specified command.
+
+Changes come from watchfiles (inotify / FSEvents / ReadDirectoryChangesW).
+Bursts of changes are coalesced over a quiet-period debounce window, so saving
+many files at once triggers a single restart.
+
+With --test-impact, a pytest command is re-run only for the test files that
+transitively import the changed modules:
+    python scripts/watch-py.py --test-impact python -m pytest -q tests tools/python/clr_tests
+
+With --warm (POSIX only), Python commands are not started as new interpreters:
+a warm worker pre-imports heavy shared modules (pytest, psutil, lxml) once and
+forks a fresh child per run, so each iteration only imports the project code.
+Non-Python commands, other interpreters and Windows use a plain subprocess.
 """
 
+import ast
+import importlib
+import json
 import sys
 import os
+import queue
+import re
+import runpy
+import select
+import shutil
 import subprocess
 import signal
-import time
+import threading
+import traceback
+from fnmatch import translate
 from pathlib import Path
 import argparse
 import logging
 
 try:
-    from watchgod import watch
+    import watchfiles
 except ImportError:
-    print("watchgod not found. Installing...")
-    subprocess.run([sys.executable, "-m", "pip", "install", "watchgod"], check=True)
-    from watchgod import watch
-
-# Import DefaultWatcher
-from watchgod.watcher import DefaultWatcher
+    print("watchfiles not found. Installing...")
+    subprocess.run([sys.executable, "-m", "pip", "install", "watchfiles"], check=True)
+    import watchfiles
 
 # Configure logging
 logging.basicConfig(
@@ -29,143 +49,729 @@ logging.basicConfig(
     format='[%(levelname)s] %(message)s'
 )
 
+
+class IgnoreMatcher:
+    """Glob ignore patterns compiled into two regexes.
+
+    Patterns without a slash ("__pycache__", "*.pyc", "logs/") match any single
+    path component; patterns with a slash ("docs/build", "tools/*/out") match the
+    path relative to a watch root, or any of its parent directories.
+    """
+
+    def __init__(self, patterns, roots=()):
+        self.roots = [Path(root).resolve() for root in roots]
+        name_patterns, path_patterns = [], []
+        for pattern in patterns:
+            pattern = pattern.replace("\\", "/").rstrip("/")
+            if not pattern:
+                continue
+            (path_patterns if "/" in pattern else name_patterns).append(translate(pattern))
+        self._name_regex = re.compile("|".join(name_patterns)) if name_patterns else None
+        self._path_regex = re.compile("|".join(path_patterns)) if path_patterns else None
+
+    def _relative_parts(self, path):
+        for root in self.roots:
+            try:
+                return path.relative_to(root).parts
+            except ValueError:
+                continue
+        return path.parts
+
+    def matches(self, path):
+        parts = self._relative_parts(Path(path))
+        if self._name_regex and any(self._name_regex.match(part) for part in parts):
+            return True
+        if self._path_regex:
+            for end in range(1, len(parts) + 1):
+                if self._path_regex.match("/".join(parts[:end])):
+                    return True
+        return False
+
+
+# Options (pytest's and python's own -m/-W/-X) whose next argument is a value, not a test path
+VALUE_OPTIONS = frozenset({
+    "-c", "--rootdir", "--confcutdir", "--basetemp", "-p", "-k", "-m", "-o", "--override-ini",
+    "--ignore", "--ignore-glob", "--deselect", "--junitxml", "--junit-xml", "--log-file",
+    "--cov", "--cov-config", "--cov-report", "--maxfail", "--tb", "--durations", "--import-mode",
+    "-n", "--dist", "-W", "-X", "-r",
+})
+
+
+class TestImpactMap:
+    """Import-dependency graph of the Python tests, used to select impacted tests.
+
+    Edges come from import statements (absolute and relative, resolved against
+    the importing file's directory and its parents, which covers the sys.path
+    inserts the tests use) and from string literals naming a .py file (tests
+    load hyphenated scripts via importlib.util.spec_from_file_location). Parsed
+    dependencies are cached with each file's (size, mtime_ns), so a refresh
+    only re-parses edited files.
+    """
+
+    TEST_DIRS = ("tests", "tools/python/tests", "tools/python/clr_tests")
+    PRUNED_DIRS = frozenset({'.git', '.venv', 'venv', 'bin', 'obj', 'node_modules', '__pycache__',
+                             'TestResults', 'logs', '.pytest_cache'})
+    # Changing these affects every test collected beneath them
+    FULL_RUN_NAMES = frozenset({'conftest.py', '__init__.py', 'setup.py'})
+    CACHE_VERSION = 1
+
+    def __init__(self, project_root=".", test_dirs=TEST_DIRS, cache_path=None):
+        self.project_root = Path(project_root).resolve()
+        self.test_dirs = [self.project_root / test_dir for test_dir in test_dirs]
+        self.cache_path = Path(cache_path or self.project_root / ".pytest_cache" / "watch-py-impact.json")
+        self.files = {}
+        self._load_cache()
+
+    def _load_cache(self):
+        try:
+            cache = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if cache.get("version") == self.CACHE_VERSION:
+            self.files = cache.get("files", {})
+
+    def _save_cache(self, files):
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self.cache_path.write_text(json.dumps({"version": self.CACHE_VERSION, "files": files}),
+                                       encoding="utf-8")
+        except OSError as e:
+            logging.warning(f"Could not write test impact cache {self.cache_path}: {e}")
+
+    def _python_files(self):
+        pending = [self.project_root]
+        while pending:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in self.PRUNED_DIRS:
+                            pending.append(entry.path)
+                    elif entry.name.endswith(".py"):
+                        stat = entry.stat()
+                        yield Path(entry.path), [stat.st_size, stat.st_mtime_ns]
+
+    def _rel(self, path):
+        return path.relative_to(self.project_root).as_posix()
+
+    def is_ignored(self, path):
+        """True for the cache file and anything under a pruned directory"""
+        path = Path(path).resolve()
+        if path == self.cache_path.resolve():
+            return True
+        try:
+            parts = path.relative_to(self.project_root).parts
+        except ValueError:
+            return False
+        return any(part in self.PRUNED_DIRS for part in parts[:-1])
+
+    def is_test_file(self, rel_path):
+        name = rel_path.rsplit("/", 1)[-1]
+        return name.startswith("test_") and any(
+            (self.project_root / rel_path).is_relative_to(test_dir) for test_dir in self.test_dirs)
+
+    def _resolve_module(self, module, search_dirs, known):
+        """Map a dotted module name to a known file under the first matching search directory"""
+        relative = module.replace(".", "/")
+        for directory in search_dirs:
+            for candidate in (directory / f"{relative}.py", directory / relative / "__init__.py"):
+                if candidate.as_posix() in known:
+                    return candidate
+        return None
+
+    def _search_dirs(self, path):
+        directory = path.parent
+        while directory != self.project_root and self.project_root in directory.parents:
+            yield directory
+            directory = directory.parent
+        yield self.project_root
+
+    def _parse_dependencies(self, path, known, by_name):
+        try:
+            tree = ast.parse(path.read_bytes(), filename=str(path))
+        except (SyntaxError, ValueError, OSError):
+            return []
+
+        dependencies = set()
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                search_dirs = list(self._search_dirs(path))
+                modules = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom):
+                if node.level:
+                    base = path.parent
+                    for _ in range(node.level - 1):
+                        base = base.parent
+                    search_dirs = [base]
+                else:
+                    search_dirs = list(self._search_dirs(path))
+                package = node.module or ""
+                modules = [package] + [f"{package}.{alias.name}".lstrip(".") for alias in node.names]
+            elif isinstance(node, ast.Constant) and isinstance(node.value, str) and node.value.endswith(".py"):
+                name = node.value.replace("\\", "/").rsplit("/", 1)[-1]
+                if name not in self.FULL_RUN_NAMES:
+                    dependencies.update(by_name.get(name, ()))
+                continue
+            else:
+                continue
+
+            for module in filter(None, modules):
+                resolved = self._resolve_module(module, search_dirs, known)
+                if resolved is not None and resolved != path:
+                    dependencies.add(self._rel(resolved))
+        return sorted(dependencies)
+
+    def refresh(self):
+        """Re-scan the tree, re-parsing only files whose stat changed"""
+        current = dict(self._python_files())
+        known = {path.as_posix() for path in current}
+        by_name = {}
+        for path in current:
+            by_name.setdefault(path.name, []).append(self._rel(path))
+
+        # Imports resolve against the set of files, so adding or removing one re-parses everything
+        cached_files = self.files if set(self.files) == {self._rel(path) for path in current} else {}
+        files = {}
+        for path, stat in current.items():
+            rel_path = self._rel(path)
+            cached = cached_files.get(rel_path)
+            if cached and cached["stat"] == stat:
+                files[rel_path] = cached
+            else:
+                files[rel_path] = {"stat": stat, "deps": self._parse_dependencies(path, known, by_name)}
+
+        if files != self.files:
+            self._save_cache(files)
+        self.files = files
+        return self
+
+    def dependents(self):
+        """Reverse graph: file -> files that import it (directly)"""
+        reverse = {}
+        for rel_path, entry in self.files.items():
+            for dependency in entry["deps"]:
+                reverse.setdefault(dependency, set()).add(rel_path)
+        return reverse
+
+    def impacted_tests(self, changed_paths):
+        """Return sorted impacted test files, or None when the whole suite must run.
+
+        Non-Python changes (fixtures, configuration), deletions and
+        conftest/package changes cannot be narrowed through imports, so they
+        fall back to the full command. The map's own cache and files in pruned
+        directories (written by the test run itself) are skipped.
+        """
+        changed = []
+        for path in changed_paths:
+            path = Path(path).resolve()
+            if self.is_ignored(path):
+                continue
+            if path.suffix != ".py" or path.name in self.FULL_RUN_NAMES or not path.exists():
+                return None
+            try:
+                changed.append(self._rel(path))
+            except ValueError:
+                return None
+
+        reverse = self.dependents()
+        seen, pending = set(changed), list(changed)
+        while pending:
+            for dependent in reverse.get(pending.pop(), ()):
+                if dependent not in seen:
+                    seen.add(dependent)
+                    pending.append(dependent)
+        return sorted(rel_path for rel_path in seen if self.is_test_file(rel_path)
+                      and (self.project_root / rel_path).exists())
+
+WARM_WORKER_FLAG = "--serve-warm-worker"
+DEFAULT_PRELOAD = ("pytest", "_pytest.python", "psutil", "lxml.etree")
+PYTHON_FLAGS = {"-u", "-B", "-E", "-s", "-O", "-OO"}
+
+
+def python_invocation(command):
+    """Split a command for the warm worker's interpreter into a run request, or None.
+
+    Only this interpreter can run in the worker, since the pre-imported modules
+    come from its environment; ``python -m mod``, ``python script.py`` and
+    ``python -c code`` are supported.
+    """
+    if not command:
+        return None
+    executable = shutil.which(command[0]) or command[0]
+    if os.path.realpath(executable) != os.path.realpath(sys.executable):
+        return None
+
+    args = list(command[1:])
+    while args and args[0] in PYTHON_FLAGS:
+        args.pop(0)
+    if len(args) >= 2 and args[0] in ("-m", "-c"):
+        kind = "module" if args[0] == "-m" else "code"
+        return {"kind": kind, "target": args[1], "args": args[2:]}
+    if args and not args[0].startswith("-"):
+        return {"kind": "path", "target": args[0], "args": args[1:]}
+    return None
+
+
+def _run_forked(request):
+    """Body of a forked child: run one request like a fresh interpreter, then exit"""
+    os.setpgid(0, 0)
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    devnull = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(devnull, sys.stdin.fileno())
+    os.close(devnull)
+
+    code = 0
+    try:
+        os.chdir(request["cwd"])
+        kind, target = request["kind"], request["target"]
+        if kind == "module":
+            sys.argv = [target] + request["args"]
+            sys.path[0] = request["cwd"]
+            runpy.run_module(target, run_name="__main__", alter_sys=True)
+        elif kind == "path":
+            sys.argv = [target] + request["args"]
+            sys.path[0] = os.path.dirname(os.path.abspath(target))
+            runpy.run_path(target, run_name="__main__")
+        else:
+            sys.argv = ["-c"] + request["args"]
+            sys.path[0] = ""
+            exec(compile(target, "<string>", "exec"), {"__name__": "__main__"})
+    except SystemExit as e:
+        if e.code is None:
+            code = 0
+        elif isinstance(e.code, int):
+            code = e.code
+        else:
+            print(e.code, file=sys.stderr)
+            code = 1
+    except BaseException:
+        traceback.print_exc()
+        code = 1
+    finally:
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+        finally:
+            os._exit(code)
+
+
+def serve_warm_worker(preload):
+    """Warm worker loop: pre-import modules, then fork one child per request.
+
+    Requests arrive as JSON lines on stdin and control replies leave as JSON
+    lines on stdout; children write their output to the worker's stderr. The
+    loop is single-threaded (fork and threads do not mix), polling stdin and
+    reaping children in turn. EOF on stdin stops the worker.
+    """
+    loaded = []
+    for name in preload:
+        try:
+            importlib.import_module(name)
+            loaded.append(name)
+        except Exception:
+            pass
+
+    def send(message):
+        sys.stdout.write(json.dumps(message) + "\n")
+        sys.stdout.flush()
+
+    send({"ready": loaded})
+    stdin_fd = sys.stdin.fileno()
+    children, buffer = set(), b""
+    while True:
+        readable, _, _ = select.select([stdin_fd], [], [], 0.05)
+        if readable:
+            chunk = os.read(stdin_fd, 65536)
+            if not chunk:
+                break
+            buffer += chunk
+            while b"\n" in buffer:
+                line, buffer = buffer.split(b"\n", 1)
+                sys.stderr.flush()
+                pid = os.fork()
+                if pid == 0:
+                    _run_forked(json.loads(line))
+                # Also set the group here, so killpg works before the child gets to run
+                try:
+                    os.setpgid(pid, pid)
+                except OSError:
+                    pass
+                children.add(pid)
+                send({"pid": pid})
+
+        while children:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+            if pid == 0:
+                break
+            children.discard(pid)
+            send({"exit": pid, "returncode": os.waitstatus_to_exitcode(status)})
+
+    for pid in children:
+        try:
+            os.killpg(pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+
+
+class WarmWorkerError(RuntimeError):
+    """The warm worker could not start or run a request"""
+
+
+class WarmRun:
+    """Popen-like handle for a child forked by the warm worker"""
+
+    def __init__(self, pid):
+        self.pid = pid
+        self.returncode = None
+        self._exited = threading.Event()
+
+    def _set_exit(self, returncode):
+        self.returncode = returncode
+        self._exited.set()
+
+    def poll(self):
+        return self.returncode
+
+    def wait(self, timeout=None):
+        if not self._exited.wait(timeout):
+            raise subprocess.TimeoutExpired(f"warm worker child {self.pid}", timeout)
+        return self.returncode
+
+
+class WarmWorker:
+    """Forkserver-style pool of one pre-imported interpreter for Python commands"""
+
+    def __init__(self, preload=DEFAULT_PRELOAD, output=None, start_timeout=60):
+        self.preload = list(preload)
+        self.output = output or (lambda line: print(f"[PROCESS] {line}", flush=True))
+        self.start_timeout = start_timeout
+        self.process = None
+        self.loaded = []
+        self._runs = {}
+        self._started = queue.Queue()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def available():
+        return hasattr(os, "fork")
+
+    def start(self):
+        """Start the worker and wait until its modules are imported"""
+        script = os.path.abspath(__file__)
+        self.process = subprocess.Popen(
+            [sys.executable, script, WARM_WORKER_FLAG, *self.preload],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            text=True, bufsize=1, errors='replace', start_new_session=True,
+        )
+        ready = queue.Queue()
+        threading.Thread(target=lambda: ready.put(self.process.stdout.readline()),
+                         name="warm-worker-ready", daemon=True).start()
+        try:
+            message = json.loads(ready.get(timeout=self.start_timeout) or "{}")
+        except (queue.Empty, ValueError):
+            message = {}
+        if "ready" not in message:
+            self.close()
+            raise WarmWorkerError("warm worker did not become ready")
+
+        self.loaded = message["ready"]
+        threading.Thread(target=self._read_control, name="warm-worker-control", daemon=True).start()
+        threading.Thread(target=self._pump_output, name="warm-worker-output", daemon=True).start()
+        logging.info(f"Warm worker {self.process.pid} pre-imported: {', '.join(self.loaded) or 'nothing'}")
+        return self
+
+    def _read_control(self):
+        for line in iter(self.process.stdout.readline, ''):
+            message = json.loads(line)
+            if "pid" in message:
+                run = WarmRun(message["pid"])
+                with self._lock:
+                    self._runs[run.pid] = run
+                self._started.put(run)
+            elif "exit" in message:
+                with self._lock:
+                    run = self._runs.pop(message["exit"], None)
+                if run:
+                    run._set_exit(message["returncode"])
+        # Worker gone: nothing will reap its children any more
+        with self._lock:
+            runs, self._runs = list(self._runs.values()), {}
+        for run in runs:
+            run._set_exit(-signal.SIGKILL)
+
+    def _pump_output(self):
+        for line in iter(self.process.stderr.readline, ''):
+            stripped_line = line.strip()
+            if stripped_line:
+                self.output(stripped_line)
+
+    def can_run(self, command):
+        return python_invocation(command) is not None
+
+    def run(self, command, cwd=None):
+        """Fork a child running command; returns a WarmRun"""
+        request = python_invocation(command)
+        if request is None:
+            raise WarmWorkerError(f"not a command for this interpreter: {command[0]}")
+        if self.process is None or self.process.poll() is not None:
+            logging.warning("Warm worker not running, starting it")
+            self.start()
+
+        request["cwd"] = os.path.abspath(cwd or os.getcwd())
+        try:
+            self.process.stdin.write(json.dumps(request) + "\n")
+            self.process.stdin.flush()
+            return self._started.get(timeout=10)
+        except (OSError, queue.Empty) as e:
+            raise WarmWorkerError(f"warm worker did not fork: {e}") from e
+
+    def close(self, timeout=5):
+        process = self.process
+        if process is None or process.poll() is not None:
+            return
+        try:
+            process.stdin.close()
+            process.wait(timeout=timeout)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+            process.wait()
+
+
 class PythonWatcher:
-    def __init__(self, command, watch_paths=None, ignore_patterns=None):
+    def __init__(self, command, watch_paths=None, ignore_patterns=None, debounce_ms=300, test_impact=None,
+                 warm_worker=None):
         self.command = command
+        self.test_impact = test_impact
+        self.warm_worker = warm_worker
         self.watch_paths = watch_paths or ["."]
         self.ignore_patterns = ignore_patterns or ["__pycache__", "*.pyc", ".git"]
+        # A custom watch_filter replaces watchfiles' DefaultFilter (node_modules, .venv, tool caches,
+        # editor swap and backup files), so it is applied alongside the patterns and pruned directories
+        self.default_filter = watchfiles.DefaultFilter()
+        self.ignore_matcher = IgnoreMatcher([*self.ignore_patterns, *sorted(TestImpactMap.PRUNED_DIRS)],
+                                            self.watch_paths)
+        self.debounce_ms = debounce_ms
         self.process = None
-        self.should_restart = False
+        self.restart_count = 0
+        self.stop_event = threading.Event()
+        self._processes = queue.Queue()
+        self._pump_thread = None
 
     def should_ignore(self, path):
         """Check if path should be ignored"""
-        path_str = str(path)
-        for pattern in self.ignore_patterns:
-            if pattern in path_str:
-                return True
-        return False
+        return self.ignore_matcher.matches(path)
+
+    def watch_filter(self, change, path):
+        """watchfiles filter: keep changes to paths that are not ignored"""
+        if self.test_impact is not None and self.test_impact.is_ignored(path):
+            return False
+        return self.default_filter(change, path) and not self.should_ignore(path)
 
-    def start_process(self):
+    def stop_process(self, timeout=5):
+        """Stop the current process (and its children) and wait until it has fully exited"""
+        process = self.process
+        if not process or process.poll() is not None:
+            return
+
+        logging.info("Terminating existing process...")
+        try:
+            if os.name == 'nt':
+                process.terminate()
+            else:
+                os.killpg(process.pid, signal.SIGTERM)
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            logging.warning("Force killing process...")
+            if os.name == 'nt':
+                process.kill()
+            else:
+                os.killpg(process.pid, signal.SIGKILL)
+            process.wait()
+        except ProcessLookupError:
+            process.wait()
+
+    def start_process(self, command=None):
         """Start the subprocess"""
-        if self.process and self.process.poll() is None:
-            logging.info("Terminating existing process...")
-            self.process.terminate()
-            try:
-                self.process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                logging.warning("Force killing process...")
-                self.process.kill()
-                self.process.wait()
+        self.stop_process()
 
-        logging.info(f"Starting: {' '.join(self.command)}")
+        command = command or self.command
+        logging.info(f"Starting: {' '.join(command)}")
+        if self.warm_worker and self.warm_worker.can_run(command):
+            try:
+                self.process = self.warm_worker.run(command)
+                logging.info(f"Forked from warm worker with PID: {self.process.pid}")
+                return True
+            except WarmWorkerError as e:
+                logging.warning(f"{e}; falling back to a new process")
+        spawn_kwargs = {
+            'stdout': subprocess.PIPE,
+            'stderr': subprocess.STDOUT,
+            'text': True,
+            'bufsize': 1,
+            'errors': 'replace',
+        }
+        if os.name == 'nt':
+            spawn_kwargs['creationflags'] = subprocess.CREATE_NEW_PROCESS_GROUP
+        else:
+            spawn_kwargs['start_new_session'] = True
         try:
             # On Windows, use shell for builtin commands
-            use_shell = os.name == 'nt' and self.command[0] in ['echo', 'dir', 'type', 'copy', 'move', 'del', 'mkdir', 'rmdir']
+            use_shell = os.name == 'nt' and command[0] in ['echo', 'dir', 'type', 'copy', 'move', 'del', 'mkdir', 'rmdir']
             if use_shell:
-                self.process = subprocess.Popen(
-                    ' '.join(self.command),
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    text=True,
-                    bufsize=1,
-                    universal_newlines=True,
-                    shell=True
-                )
+                self.process = subprocess.Popen(' '.join(command), shell=True, **spawn_kwargs)
             else:
-                self.process = subprocess.Popen(
-                    self.command,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    text=True,
-                    bufsize=1,
-                    universal_newlines=True
-                )
+                self.process = subprocess.Popen(command, **spawn_kwargs)
             logging.info(f"Process started with PID: {self.process.pid}")
         except Exception as e:
             logging.error(f"Failed to start process: {e}")
             return False
+        self._processes.put(self.process)
         return True
 
     def monitor_output(self):
-        """Monitor process output in real-time"""
-        if not self.process or not self.process.stdout:
+        """Single long-lived output pump: drains each started process in turn"""
+        while True:
+            process = self._processes.get()
+            if process is None:
+                return
+            try:
+                for line in iter(process.stdout.readline, ''):
+                    stripped_line = line.strip()
+                    if stripped_line:
+                        print(f"[PROCESS] {stripped_line}", flush=True)
+            except Exception as e:
+                logging.error(f"Error monitoring output: {e}")
+            finally:
+                process.stdout.close()
+
+    def restart(self, changes):
+        """Restart the process once for a coalesced batch of changes"""
+        changes = {(change_type, path) for change_type, path in changes if self.watch_filter(change_type, path)}
+        if not changes:
             return
+        logging.info(f"Detected changes: {len(changes)} files")
+        for change_type, path in sorted(changes, key=lambda change: change[1])[:20]:
+            logging.info(f"  {change_type.name}: {path}")
+        if len(changes) > 20:
+            logging.info(f"  ... and {len(changes) - 20} more")
 
-        try:
-            for line in iter(self.process.stdout.readline, ''):
-                stripped_line = line.strip()
-                if stripped_line:
-                    logging.info(stripped_line)
-                    print(f"[PROCESS] {stripped_line}")
-                if self.should_restart:
-                    break
-        except Exception as e:
-            logging.error(f"Error monitoring output: {e}")
-            print(f"Error monitoring output: {e}")
+        command = self.command
+        if self.test_impact is not None:
+            selected = self.test_impact.refresh().impacted_tests(path for _, path in changes)
+            if selected is None:
+                logging.info("Test impact: change not traceable through imports, running the full command")
+            elif not selected:
+                logging.info("Test impact: no tests import the changed files, nothing to run")
+                return
+            else:
+                logging.info(f"Test impact: running {len(selected)} impacted test file(s)")
+                command = self.impact_command(selected)
+
+        self.restart_count += 1
+        if not self.start_process(command):
+            logging.error("Failed to restart process")
+            print("Failed to restart process")
+
+    def impact_command(self, selected_tests):
+        """The pytest command with its positional test paths replaced by the selected files"""
+        root = self.test_impact.project_root
+        executable, *args = self.command
+        base = [executable]
+        takes_value = False
+        for arg in args:
+            if takes_value:
+                # --cov takes an optional value, so an option after it is not swallowed
+                takes_value = False
+                if not arg.startswith("-"):
+                    base.append(arg)
+                    continue
+            if arg.startswith("-"):
+                takes_value = arg in VALUE_OPTIONS
+                base.append(arg)
+            elif not (root / arg.split("::")[0]).exists():
+                base.append(arg)
+        return base + [str(root / test) for test in selected_tests]
+
+    def iter_changes(self):
+        """Yield coalesced change batches until stop_event is set.
+
+        A batch is yielded once no new change has arrived for debounce_ms (and at
+        most every 10 debounce windows during a continuous stream of changes).
+        """
+        yield from watchfiles.watch(
+            *self.watch_paths,
+            watch_filter=self.watch_filter,
+            step=self.debounce_ms,
+            debounce=max(self.debounce_ms * 10, 1600),
+            stop_event=self.stop_event,
+        )
 
     def run(self):
         logging.info(f"Watching paths: {self.watch_paths}")
         logging.info(f"Ignoring patterns: {self.ignore_patterns}")
+        logging.info(f"Debounce window: {self.debounce_ms}ms")
         logging.info("Press Ctrl+C to stop watching")
         print("Press Ctrl+C to stop watching")
 
+        self._pump_thread = threading.Thread(target=self.monitor_output, name="watch-output", daemon=True)
+        self._pump_thread.start()
+
         # Start initial process
         if not self.start_process():
+            self._processes.put(None)
             return
 
-        # Start output monitoring in background
-        import threading
-        output_thread = threading.Thread(target=self.monitor_output, daemon=True)
-        output_thread.start()
-
         try:
-            # Create ignore function for watchgod
-            def ignore_func(path):
-                return self.should_ignore(path)
-
-            for changes in watch(*self.watch_paths, watcher_cls=DefaultWatcher):
-                    logging.info(f"\nDetected changes: {len(changes)} files")
-                    for change_type, path in changes:
-                        logging.info(f"  {change_type.name}: {path}")
-
-                    self.should_restart = True
-                    if self.start_process():
-                        self.should_restart = False
-                        # Restart output monitoring
-                        output_thread = threading.Thread(target=self.monitor_output, daemon=True)
-                        output_thread.start()
-                    else:
-                        logging.error("Failed to restart process")
-                        print("Failed to restart process")
+            for changes in self.iter_changes():
+                self.restart(changes)
         except KeyboardInterrupt:
             logging.info("Stopping watch mode...")
         finally:
-            if self.process and self.process.poll() is None:
-                logging.info("Terminating process...")
-                self.process.terminate()
-                try:
-                    self.process.wait(timeout=5)
-                except subprocess.TimeoutExpired:
-                    self.process.kill()
+            self.stop_process()
+            if self.warm_worker:
+                self.warm_worker.close()
+            self._processes.put(None)
+            self._pump_thread.join(timeout=5)
             logging.info("Watch mode stopped")
             print("Watch mode stopped")
 
 def main():
+    if sys.argv[1:2] == [WARM_WORKER_FLAG]:
+        serve_warm_worker(sys.argv[2:])
+        return
+
     parser = argparse.ArgumentParser(description="Python Watch Mode for Wiley Widget")
     parser.add_argument("command", nargs="+", help="Command to run and watch")
     parser.add_argument("--watch", "-w", nargs="+", default=["."],
                        help="Paths to watch (default: current directory)")
     parser.add_argument("--ignore", "-i", nargs="+",
                        default=["__pycache__", "*.pyc", ".git", "*.log", "logs/"],
-                       help="Patterns to ignore")
+                       help="Glob patterns to ignore")
+    parser.add_argument("--debounce", type=int, default=300,
+                       help="Quiet period in ms that ends a burst of changes (default: 300)")
+    parser.add_argument("--test-impact", action="store_true",
+                       help="Re-run only the pytest files that import the changed modules")
+    parser.add_argument("--project-root", default=".",
+                       help="Root for resolving imports in --test-impact mode (default: .)")
+    parser.add_argument("--warm", action="store_true",
+                       help="Fork Python commands from a warm worker with heavy modules pre-imported")
+    parser.add_argument("--preload", nargs="+", default=list(DEFAULT_PRELOAD),
+                       help="Modules the warm worker imports once (default: %(default)s)")
 
     args = parser.parse_args()
 
     # Convert watch paths to absolute
     watch_paths = [os.path.abspath(p) for p in args.watch]
 
-    watcher = PythonWatcher(args.command, watch_paths, args.ignore)
+    test_impact = TestImpactMap(args.project_root).refresh() if args.test_impact else None
+    warm_worker = None
+    if args.warm:
+        if WarmWorker.available():
+            warm_worker = WarmWorker(args.preload).start()
+        else:
+            logging.warning("--warm needs os.fork; using a new process per run")
+    watcher = PythonWatcher(args.command, watch_paths, args.ignore, debounce_ms=args.debounce,
+                            test_impact=test_impact, warm_worker=warm_worker)
     watcher.run()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -342,9 +342,8 @@ public class CountToVisibilityConverter : IValueConverter
 {
     public object Convert(object value, Type targetType, object parameter, CultureInfo culture)
     {
-        if (value is int count && parameter is string param)
+        if (value is int count && parameter is string param && int.TryParse(param, out var targetCount))
         {
-            int targetCount = int.Parse(param);
             return count == targetCount ? Visibility.Visible : Visibility.Collapsed;
         }
         return Visibility.Collapsed;
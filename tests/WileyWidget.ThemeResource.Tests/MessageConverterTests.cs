@@ -180,6 +180,8 @@ public sealed class MessageConverterTests
     [InlineData(5, "5", Visibility.Visible)]
     [InlineData(3, "5", Visibility.Collapsed)]
     [InlineData(null, "5", Visibility.Collapsed)]
+    [InlineData(5, "abc", Visibility.Collapsed)]
+    [InlineData(5, "99999999999", Visibility.Collapsed)]
     public void Count_to_visibility_converter_requires_matching_target(object? value, string parameter, Visibility expected)
     {
         var converter = new CountToVisibilityConverter();
@@ -0,0 +1,222 @@
+"""
+Startup Timing Analysis Tests
+
+Tests for scripts/analyze-startup-timing.py including:
+- Serilog log line parsing for the file and console sinks
+- Per-phase duration extraction from a recorded startup log
+- Mean / median / p95 aggregation and baseline regression flagging
+- Launch mode against a fake application process
+- Span tree reconstruction and collapsed-stack aggregation from traces
+"""
+
+import importlib.util
+import itertools
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+FIXTURE_LOG = Path(__file__).parent / "fixtures" / "startup-timing.log"
+
+
+def _load_script():
+    """Import scripts/analyze-startup-timing.py as a module"""
+    script_path = project_root / "scripts" / "analyze-startup-timing.py"
+    spec = importlib.util.spec_from_file_location("analyze_startup_timing", script_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+startup = _load_script()
+
+
+@pytest.fixture
+def fixture_runs():
+    """Fixture providing the runs recorded in the startup log fixture"""
+    return startup.replay_logs([FIXTURE_LOG])
+
+
+class TestStartupLogParsing:
+    """Tests for turning Serilog output into phase durations"""
+
+    def test_parses_file_and_console_formats(self):
+        """Both sink templates yield the same message with enrichers stripped"""
+        file_line = "2025-10-18 09:14:02.113 [INF] HOST 4120:1 WileyWidget.App Modules initializing..."
+        console_line = "[09:14:02.113] [INF] 4120:1 WileyWidget.App Modules initializing..."
+        offset_line = "2025-10-18 09:14:02.113 +02:00 [INF] HOST 4120:1 WileyWidget.App  Modules initializing..."
+
+        assert startup.parse_log_line(file_line)[1:] == ("INF", "Modules initializing...")
+        assert startup.parse_log_line(console_line) == (33242.113, "INF", "Modules initializing...")
+        assert startup.parse_log_line(offset_line) == (1760771642.113, "INF", "Modules initializing...")
+        assert startup.parse_log_line("   at WileyWidget.App.OnStartup()") is None
+
+    def test_fixture_sessions_become_runs(self, fixture_runs):
+        """Every session in the rolling log is one run with all phases"""
+        assert len(fixture_runs) == 3
+        first = fixture_runs[0].phases
+
+        assert first["bootstrap"] == pytest.approx(48)
+        assert first["di_registration"] == pytest.approx(577)
+        assert first["module_initialization"] == pytest.approx(534)
+        assert first["Theme resources loaded"] == 41
+        assert first["total"] == pytest.approx(1794)
+
+    def test_console_clock_wraps_at_midnight(self):
+        """Time-only stamps crossing midnight still give positive durations"""
+        lines = [
+            "[23:59:59.900] [INF] === WileyWidget Application Startup - Session: x ===",
+            "[00:00:00.150] [INF] Application startup completed",
+        ]
+        runs = list(startup.StartupLogParser().parse(lines))
+        assert runs[0].phases["total"] == pytest.approx(250)
+
+
+class TestStartupStatistics:
+    """Tests for aggregation and baseline comparison"""
+
+    def test_summary_statistics(self, fixture_runs):
+        """Mean, median and p95 are computed per phase in startup order"""
+        stats = startup.summarize_runs(fixture_runs)
+        by_phase = {item.phase: item for item in stats}
+
+        assert stats[0].phase == "bootstrap"
+        assert stats[-1].phase == "total"
+        total = by_phase["total"]
+        assert total.runs == 3
+        assert total.median_ms == pytest.approx(1794)
+        assert total.min_ms <= total.mean_ms <= total.p95_ms <= total.max_ms
+
+    def test_percentile_interpolates(self):
+        """Percentiles interpolate between neighbouring samples"""
+        assert startup.percentile([10, 20, 30, 40], 50) == 25
+        assert startup.percentile([10, 20, 30, 40], 95) == pytest.approx(38.5)
+
+    def test_baseline_roundtrip_and_regression(self, fixture_runs, tmp_path):
+        """A slower median than the stored baseline is flagged"""
+        stats = startup.summarize_runs(fixture_runs)
+        baseline_path = tmp_path / "baseline.json"
+        startup.save_baseline(stats, baseline_path)
+        baseline = startup.load_baseline(baseline_path)
+
+        assert startup.compare_to_baseline(stats, baseline) == []
+
+        slower = [item if item.phase != "di_registration" else
+                  startup.PhaseStats(**{**baseline["di_registration"], "median_ms": item.median_ms * 1.5})
+                  for item in stats]
+        regressions = startup.compare_to_baseline(slower, baseline, threshold=0.2)
+        assert [(r.phase, r.metric) for r in regressions] == [("di_registration", "median_ms")]
+
+    def test_missing_baseline_is_empty(self, tmp_path):
+        """No baseline file means nothing to compare"""
+        assert startup.load_baseline(tmp_path / "absent.json") == {}
+
+
+class TestStartupProfiler:
+    """Tests for launch mode"""
+
+    def test_launch_mode_stops_at_completion_marker(self):
+        """The profiler reads stdout and stops the process once startup completes"""
+        fake_app = (
+            "import sys, time\n"
+            f"for line in open({str(FIXTURE_LOG)!r}, encoding='utf-8'):\n"
+            "    print(line, end='', flush=True)\n"
+            "    if 'initialization completed' in line:\n"
+            "        time.sleep(60)\n"
+        )
+        profiler = startup.StartupProfiler([sys.executable, "-c", fake_app], timeout=30)
+
+        runs = profiler.measure(runs=2, warmup=1)
+
+        assert len(runs) == 2
+        assert all(run.phases["total"] == pytest.approx(1794) for run in runs)
+
+    def test_timeout_yields_no_run(self):
+        """A process that never logs completion is reported as incomplete"""
+        profiler = startup.StartupProfiler([sys.executable, "-c", "import time; time.sleep(60)"], timeout=0.5)
+        assert profiler.run_once() is None
+
+
+def _names(span):
+    return [child.name for child in span.children]
+
+
+class TestStartupTrace:
+    """Tests for span tree reconstruction and flame graph output"""
+
+    def test_log_markers_build_nested_tree(self):
+        """Marker order nests DI, Key Vault and module spans under OnStartup"""
+        with open(FIXTURE_LOG, encoding="utf-8") as f:
+            trees = list(startup.SpanTreeBuilder().build(startup.iter_trace_events(f)))
+
+        assert len(trees) == 3
+        root = trees[0]
+        assert _names(root) == ["bootstrap", "constructor", "OnStartup"]
+        on_startup = root.children[2]
+        assert "module_initialization" in _names(on_startup)
+        di_build = next(child for child in on_startup.children if child.name == "di_container_build")
+        assert _names(di_build) == ["key_vault_secrets"]
+        assert root.duration_ms == pytest.approx(1797)
+        assert di_build.self_ms == pytest.approx(di_build.duration_ms - 170)
+
+    def test_serilog_json_events(self):
+        """Compact and classic Serilog JSON render templates into markers"""
+        lines = [
+            json.dumps({"@t": "2025-10-18T09:14:02.0000000Z",
+                        "@mt": "=== WileyWidget Application Startup - Session: {StartupId} ===",
+                        "StartupId": "abc"}),
+            json.dumps({"@t": "2025-10-18T09:14:02.1000000Z", "@mt": "Global exception handling configured"}),
+            json.dumps({"Timestamp": "2025-10-18T09:14:02.2000000+00:00",
+                        "MessageTemplate": "{Message} completed in {Ms}ms",
+                        "Properties": {"Message": "Theme load", "Ms": 50}}),
+            json.dumps({"@t": "2025-10-18T09:14:02.5000000Z", "@m": "Application startup completed"}),
+        ]
+        tree = next(startup.SpanTreeBuilder().build(startup.iter_trace_events(lines)))
+
+        on_startup = tree.children[0]
+        assert on_startup.name == "OnStartup"
+        assert on_startup.duration_ms == pytest.approx(400)
+        assert on_startup.children[0].name == "Theme load"
+        assert on_startup.children[0].duration_ms == pytest.approx(50)
+
+    def test_eventpipe_activities_nest_per_thread(self):
+        """Start/Stop pairs nest on their own thread stack"""
+        lines = [
+            "Event Name,Time MSec,Process Name,Rest",
+            'WileyWidget-Startup/OnStartup/Start,100.0,WileyWidget (4120),ThreadID="1"',
+            'WileyWidget-Startup/KeyVault/Start,110.0,WileyWidget (4120),ThreadID="7"',
+            'WileyWidget-Startup/ContainerBuild/Start,120.0,WileyWidget (4120),ThreadID="1"',
+            'WileyWidget-Startup/ContainerBuild/Stop,300.0,WileyWidget (4120),ThreadID="1"',
+            'WileyWidget-Startup/KeyVault/Stop,350.0,WileyWidget (4120),ThreadID="7"',
+            'WileyWidget-Startup/OnStartup/Stop,400.0,WileyWidget (4120),ThreadID="1"',
+        ]
+        tree = next(startup.SpanTreeBuilder().build(startup.iter_trace_events(lines)))
+
+        assert _names(tree) == ["OnStartup", "KeyVault"]
+        assert _names(tree.children[0]) == ["ContainerBuild"]
+        assert tree.children[1].duration_ms == pytest.approx(240)
+
+    def test_collapsed_stacks_average_self_time(self):
+        """Folded weights are self time in microseconds, averaged across runs"""
+        aggregator = startup.CollapsedStackAggregator()
+        for scale in (1, 3):
+            root = startup.Span("startup", 0.0, 0.1 * scale)
+            root.children.append(startup.Span("di", 0.0, 0.04 * scale))
+            aggregator.add(root)
+
+        assert aggregator.lines(average=True) == ["startup 120000", "startup;di 80000"]
+        assert aggregator.lines()[1] == "startup;di 160000"
+
+    def test_parsing_streams_input(self):
+        """The first session is produced without reading the rest of the input"""
+        session = FIXTURE_LOG.read_text(encoding="utf-8").splitlines()[:29]
+        endless = itertools.chain(session, itertools.repeat("noise that never parses"))
+
+        tree = next(startup.SpanTreeBuilder().build(startup.iter_trace_events(endless)))
+        assert tree.name == "startup"
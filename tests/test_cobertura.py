@@ -0,0 +1,147 @@
+"""
+Cobertura Parser Tests
+
+Tests for scripts/cobertura.py including:
+- Class-level line counting with method duplicates and nested classes merged
+- Branch coverage from condition-coverage attributes
+- Per-package, per-class and per-file aggregation
+- Diffing against a saved previous report
+- Streaming memory use on large reports
+"""
+
+import importlib.util
+import sys
+import tracemalloc
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+
+def _load_script():
+    """Import scripts/cobertura.py as a module"""
+    script_path = project_root / "scripts" / "cobertura.py"
+    spec = importlib.util.spec_from_file_location("cobertura", script_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+cobertura = _load_script()
+
+# Coverlet layout: lines appear under <method> and again under the class; the
+# async state machine class repeats line 12 of the same file.
+COVERAGE_XML = """<?xml version="1.0" encoding="utf-8"?>
+<coverage line-rate="0.5" branch-rate="0.5" version="1.9">
+  <sources><source>C:\\src\\</source></sources>
+  <packages>
+    <package name="WileyWidget" line-rate="0.5">
+      <classes>
+        <class name="WileyWidget.App" filename="App.xaml.cs" line-rate="0.5">
+          <methods>
+            <method name="OnStartup" signature="()">
+              <lines>
+                <line number="10" hits="1" branch="False" />
+                <line number="11" hits="0" branch="False" />
+              </lines>
+            </method>
+          </methods>
+          <lines>
+            <line number="10" hits="1" branch="False" />
+            <line number="11" hits="0" branch="False" />
+            <line number="12" hits="0" branch="True" condition-coverage="50% (1/2)" />
+          </lines>
+        </class>
+        <class name="WileyWidget.App/&lt;OnStartup&gt;d__3" filename="App.xaml.cs" line-rate="1">
+          <methods />
+          <lines>
+            <line number="12" hits="4" branch="True" condition-coverage="100% (2/2)" />
+          </lines>
+        </class>
+      </classes>
+    </package>
+    <package name="WileyWidget.Data" line-rate="0">
+      <classes>
+        <class name="WileyWidget.Data.Repository" filename="Data/Repository.cs" line-rate="0">
+          <methods />
+          <lines>
+            <line number="5" hits="0" branch="False" />
+            <line number="6" hits="0" branch="False" />
+          </lines>
+        </class>
+      </classes>
+    </package>
+  </packages>
+</coverage>
+"""
+
+
+@pytest.fixture
+def coverage_file(tmp_path):
+    """Fixture providing a small coverlet-style Cobertura file"""
+    path = tmp_path / "coverage.cobertura.xml"
+    path.write_text(COVERAGE_XML, encoding="utf-8")
+    return path
+
+
+class TestCoberturaParsing:
+    """Tests for single-pass aggregation"""
+
+    def test_lines_are_deduplicated_and_aggregated(self, coverage_file):
+        """Method duplicates are ignored and a line covered by any class counts as covered"""
+        report = cobertura.parse_cobertura(coverage_file)
+
+        assert (report.total.lines_valid, report.total.lines_covered) == (5, 2)
+        assert (report.total.branches_valid, report.total.branches_covered) == (2, 2)
+        assert report.files["App.xaml.cs"].line_percent == pytest.approx(200 / 3)
+        assert report.packages["WileyWidget.Data"].lines_covered == 0
+        assert report.classes["WileyWidget.App"].lines_valid == 3
+
+    def test_diff_against_saved_report(self, coverage_file, tmp_path):
+        """Changed, added and removed files are reported worst first"""
+        previous = cobertura.parse_cobertura(coverage_file)
+        previous.save(tmp_path / "previous.json")
+
+        improved = COVERAGE_XML.replace('number="5" hits="0"', 'number="5" hits="3"').replace(
+            'filename="App.xaml.cs" line-rate="0.5"', 'filename="Shell.cs" line-rate="0.5"')
+        current_path = tmp_path / "current.xml"
+        current_path.write_text(improved, encoding="utf-8")
+
+        deltas = cobertura.diff_reports(cobertura.load_report(tmp_path / "previous.json"),
+                                        cobertura.parse_cobertura(current_path))
+        changes = {(item.scope, item.name): (item.before, item.after) for item in deltas}
+
+        assert changes[("file", "Data/Repository.cs")] == (0.0, 50.0)
+        assert changes[("file", "Shell.cs")][0] is None
+        assert (deltas[0].scope, deltas[0].name) == ("package", "WileyWidget")
+        assert deltas[0].delta == pytest.approx(-100 / 6)
+
+    def test_streaming_uses_less_memory_than_full_parse(self, tmp_path):
+        """Peak memory stays well below loading the whole tree"""
+        classes = "".join(
+            f'<class name="C{index}" filename="F{index}.cs"><methods><method name="M"><lines>'
+            + "".join(f'<line number="{line}" hits="{line % 2}" />' for line in range(20))
+            + "</lines></method></methods><lines>"
+            + "".join(f'<line number="{line}" hits="{line % 2}" />' for line in range(20))
+            + "</lines></class>"
+            for index in range(1500))
+        path = tmp_path / "large.xml"
+        path.write_text(f'<coverage><packages><package name="P"><classes>{classes}</classes></package>'
+                        "</packages></coverage>", encoding="utf-8")
+
+        def peak(func):
+            tracemalloc.start()
+            func(path)
+            result = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            return result
+
+        report_peak = peak(cobertura.parse_cobertura)
+        tree_peak = peak(ET.parse)
+        assert cobertura.parse_cobertura(path).total.lines_valid == 30_000
+        assert report_peak < tree_peak / 2
@@ -0,0 +1,254 @@
+"""
+Development Startup Benchmark Tests
+
+Tests for scripts/dev-start-debugpy.py including:
+- Child-process CPU time and peak RSS sampling
+- Readiness detection when launching the application
+- Cold/warm benchmark orchestration and JSON percentile results
+- Build-input fingerprinting used to skip no-op builds
+- Streamed, timestamped capture of the launched application's output
+"""
+
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("debugpy")
+pytest.importorskip("psutil")
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+
+def _load_script(tmp_path_factory):
+    """Import scripts/dev-start-debugpy.py as a module (its log directory goes to a temp dir)"""
+    script_path = project_root / "scripts" / "dev-start-debugpy.py"
+    spec = importlib.util.spec_from_file_location("dev_start_debugpy", script_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    cwd = os.getcwd()
+    os.chdir(tmp_path_factory.mktemp("dev-start"))
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        os.chdir(cwd)
+    return module
+
+
+@pytest.fixture(scope="module")
+def dev_start(tmp_path_factory):
+    """Fixture providing the loaded dev-start-debugpy module"""
+    module = _load_script(tmp_path_factory)
+    module.APP_OUTPUT_LOG = tmp_path_factory.mktemp("app-output") / "app-output.log"
+    return module
+
+
+class TestPhaseMeasurement:
+    """Tests for per-phase wall, CPU and memory measurement"""
+
+    def test_sampler_captures_child_cpu_and_rss(self, dev_start):
+        """A child that allocates and spins shows up in CPU time and peak RSS"""
+        child = ("import time\n"
+                 "block = bytearray(64 * 1024 * 1024)\n"
+                 "end = time.process_time() + 0.3\n"
+                 "while time.process_time() < end: pass\n"
+                 "time.sleep(0.2)\n")
+
+        _, metrics = dev_start.measure_phase(subprocess.run, [sys.executable, "-c", child], check=True)
+
+        assert metrics["wall_ms"] >= 500
+        assert metrics["cpu_ms"] >= 250
+        assert metrics["peak_rss_mb"] >= 64
+
+    def test_launch_stops_at_ready_marker(self, dev_start):
+        """The app is stopped as soon as it logs startup completion"""
+        ready_app = ("import time\n"
+                     "print('[09:00:00.000] [INF] Application startup completed', flush=True)\n"
+                     "time.sleep(60)\n")
+        assert dev_start.launch_until_ready(30, cmd=[sys.executable, "-c", ready_app]) is True
+
+    def test_launch_times_out_without_marker(self, dev_start):
+        """An app that never becomes ready is reported after the timeout"""
+        silent_app = [sys.executable, "-c", "import time; time.sleep(60)"]
+        assert dev_start.launch_until_ready(0.5, cmd=silent_app) is False
+
+
+class TestStartupBenchmark:
+    """Tests for multi-run benchmark orchestration"""
+
+    def test_cold_and_warm_runs_are_separated(self, dev_start, monkeypatch, tmp_path):
+        """Cold runs include cleanup, warmups are not recorded and results hold percentiles"""
+        calls = []
+        monkeypatch.setattr(dev_start, "cleanup_dotnet_processes", lambda: calls.append("processes"))
+        monkeypatch.setattr(dev_start, "cleanup_dotnet_artifacts", lambda: calls.append("artifacts"))
+        monkeypatch.setattr(dev_start, "build_application",
+                            lambda incremental=True: calls.append("build") or True)
+        monkeypatch.setattr(dev_start, "launch_until_ready", lambda timeout: calls.append("start") or True)
+
+        results_path = tmp_path / "results.json"
+        dev_start.run_startup_benchmark(runs=3, warmup=2, results_path=results_path)
+
+        results = json.loads(results_path.read_text(encoding="utf-8"))
+        assert [(r["kind"], r["index"]) for r in results["records"]] == [
+            ("cold", 0), ("cold", 1), ("cold", 2), ("warm", 0), ("warm", 1), ("warm", 2)]
+        assert calls.count("artifacts") == 3
+        assert calls.count("build") == 3 + 2 + 3
+
+        cold, warm = results["summary"]["cold"], results["summary"]["warm"]
+        assert "Artifact Cleanup" in cold and "Artifact Cleanup" not in warm
+        build = warm["Build"]["wall_ms"]
+        assert build["n"] == 3
+        assert build["min"] <= build["p50"] <= build["p95"] <= build["max"]
+
+    def test_skip_cleanup_measures_warm_runs_only(self, dev_start, monkeypatch, tmp_path):
+        """--skip-cleanup produces no cold records"""
+        monkeypatch.setattr(dev_start, "build_application", lambda incremental=True: True)
+        monkeypatch.setattr(dev_start, "launch_until_ready", lambda timeout: True)
+
+        results = dev_start.run_startup_benchmark(runs=2, warmup=0, skip_cleanup=True,
+                                                  results_path=tmp_path / "results.json")
+
+        assert set(results["summary"]) == {"warm"}
+
+    def test_percentile_interpolates(self, dev_start):
+        """Percentiles interpolate between neighbouring samples"""
+        assert dev_start.percentile([10, 20, 30, 40], 50) == 25
+        assert dev_start.percentile([5], 95) == 5
+
+
+@pytest.fixture
+def source_tree(tmp_path):
+    """Fixture providing a minimal project tree with build outputs present"""
+    (tmp_path / "WileyWidget.csproj").write_text("<Project />", encoding="utf-8")
+    (tmp_path / "Directory.Build.props").write_text("<Project />", encoding="utf-8")
+    (tmp_path / "Directory.Build.targets").write_text("<Project />", encoding="utf-8")
+    (tmp_path / "src" / "Views").mkdir(parents=True)
+    (tmp_path / "src" / "App.cs").write_text("class App {}", encoding="utf-8")
+    (tmp_path / "src" / "Views" / "Main.xaml").write_text("<Window />", encoding="utf-8")
+    (tmp_path / "src" / "notes.md").write_text("not an input", encoding="utf-8")
+    (tmp_path / "obj").mkdir()
+    (tmp_path / "obj" / "project.assets.json").write_text("{}", encoding="utf-8")
+    (tmp_path / "obj" / "Generated.cs").write_text("// generated", encoding="utf-8")
+    (tmp_path / "bin" / "Debug" / "net9.0-windows").mkdir(parents=True)
+    (tmp_path / "bin" / "Debug" / "net9.0-windows" / "WileyWidget.dll").write_bytes(b"MZ")
+    return tmp_path
+
+
+class TestBuildFingerprint:
+    """Tests for skipping builds when no inputs changed"""
+
+    def test_snapshot_selects_inputs_and_prunes_outputs(self, dev_start, source_tree):
+        """Only build inputs outside bin/obj are fingerprinted"""
+        snapshot = dev_start.BuildFingerprint(source_tree).snapshot()
+        assert sorted(snapshot) == ["Directory.Build.props", "Directory.Build.targets", "WileyWidget.csproj",
+                                    "src/App.cs", "src/Views/Main.xaml"]
+
+    def test_unchanged_touched_and_edited_inputs(self, dev_start, source_tree):
+        """Touching keeps the fingerprint current, editing content does not"""
+        fingerprint = dev_start.BuildFingerprint(source_tree)
+        assert fingerprint.changed_inputs(fingerprint.snapshot())
+
+        fingerprint.save(fingerprint.entries(fingerprint.snapshot()))
+        assert fingerprint.changed_inputs(fingerprint.snapshot()) == []
+
+        app = source_tree / "src" / "App.cs"
+        os.utime(app, ns=(app.stat().st_atime_ns, app.stat().st_mtime_ns + 5_000_000_000))
+        assert fingerprint.changed_inputs(fingerprint.snapshot()) == []
+        assert fingerprint.load()["src/App.cs"][1] == app.stat().st_mtime_ns
+
+        app.write_text("class App { int x; }", encoding="utf-8")
+        (source_tree / "src" / "New.cs").write_text("class New {}", encoding="utf-8")
+        assert fingerprint.changed_inputs(fingerprint.snapshot()) == ["src/App.cs", "src/New.cs"]
+
+    def test_build_is_skipped_when_fingerprint_is_current(self, dev_start, source_tree, monkeypatch):
+        """build_application does not invoke dotnet when nothing changed"""
+        monkeypatch.chdir(source_tree)
+        fingerprint = dev_start.BuildFingerprint()
+        fingerprint.save(fingerprint.entries(fingerprint.snapshot()))
+
+        def fail_run(*args, **kwargs):
+            raise AssertionError(f"unexpected subprocess call: {args}")
+
+        monkeypatch.setattr(dev_start.subprocess, "run", fail_run)
+        assert dev_start.build_application(incremental=True) is True
+
+    def test_successful_build_records_fingerprint(self, dev_start, source_tree, monkeypatch):
+        """A forced build runs dotnet and then stores the input fingerprint"""
+        monkeypatch.chdir(source_tree)
+        commands = []
+
+        def fake_run(cmd, **kwargs):
+            commands.append(cmd[:2])
+            return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+
+        monkeypatch.setattr(dev_start.subprocess, "run", fake_run)
+        assert dev_start.build_application(incremental=True, force=True) is True
+
+        assert commands == [["dotnet", "build"]]
+        assert dev_start.BuildFingerprint().changed_inputs(dev_start.BuildFingerprint().snapshot()) == []
+
+    def test_edit_during_build_triggers_next_build(self, dev_start, source_tree, monkeypatch):
+        """A file edited while dotnet builds is not recorded as built"""
+        monkeypatch.chdir(source_tree)
+        app = source_tree / "src" / "App.cs"
+        app.write_text("class App { int before; }", encoding="utf-8")
+
+        def edit_during_build(cmd, **kwargs):
+            app.write_text("class App { int during_build; }", encoding="utf-8")
+            return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+
+        monkeypatch.setattr(dev_start.subprocess, "run", edit_during_build)
+        assert dev_start.build_application(incremental=True, force=True) is True
+
+        fingerprint = dev_start.BuildFingerprint()
+        assert fingerprint.changed_inputs(fingerprint.snapshot()) == ["src/App.cs"]
+
+
+class TestAppOutputStreaming:
+    """Tests for non-blocking capture of application output"""
+
+    def test_chatty_app_does_not_block_and_window_is_timed(self, dev_start):
+        """Megabytes of stderr are drained while the window marker is detected"""
+        chatty_app = ("import sys, time\n"
+                      "for i in range(2000): sys.stderr.write('x' * 200 + '\\n')\n"
+                      "print('[INF] MainWindow shell resolved successfully', flush=True)\n"
+                      "time.sleep(60)\n")
+        process = dev_start.run_application(startup_timeout=30, cmd=[sys.executable, "-c", chatty_app])
+        assert process is not None
+        dev_start.terminate_process(process)
+        for thread in threading.enumerate():
+            if thread.name.startswith("app-output-"):
+                thread.join(5)
+
+    def test_streamer_rotates_log_and_bounds_tail(self, dev_start, tmp_path):
+        """Lines are timestamped into a size-rotated log and only a bounded tail is kept"""
+        app = ("import sys\n"
+               "for i in range(3000): print(f'line {i}')\n"
+               "print('[INF] Application startup completed')\n")
+        process = subprocess.Popen([sys.executable, "-c", app], **dev_start._spawn_kwargs())
+        log_path = tmp_path / "out.log"
+        streamer = dev_start.AppOutputStreamer(process, log_path=log_path, echo=False,
+                                               max_bytes=20_000, backup_count=2, tail_lines=50).start()
+
+        assert streamer.wait_for("ready", 30) is True
+        process.wait()
+        streamer.close()
+
+        assert len(streamer.tail) == 50
+        assert streamer.tail[-1][1:] == ("stdout", "[INF] Application startup completed")
+        assert streamer.marker_seconds["ready"] >= 0
+        assert (tmp_path / "out.log.1").exists() and not (tmp_path / "out.log.3").exists()
+        assert log_path.stat().st_size <= 20_000
+        assert "[+" in log_path.read_text(encoding="utf-8").splitlines()[-1]
+
+    def test_early_exit_is_reported(self, dev_start):
+        """An app that exits before showing a window returns no process"""
+        crashing_app = [sys.executable, "-c", "import sys; print('boom', file=sys.stderr); sys.exit(3)"]
+        assert dev_start.run_application(startup_timeout=30, cmd=crashing_app) is None
@@ -0,0 +1,150 @@
+"""
+.env Parser Tests
+
+Tests for scripts/env_parser.py including:
+- Quoting, comments, export prefixes and multiline values
+- Unquoted values read like the old load-env loop
+- Lazy ${VAR} expansion with defaults, self-references and cycle detection
+- Layered profiles (.env + .env.<profile>)
+- Parse caching keyed by file mtime and size
+"""
+
+import importlib.util
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+
+def _load_script():
+    """Import scripts/env_parser.py as a module"""
+    script_path = project_root / "scripts" / "env_parser.py"
+    spec = importlib.util.spec_from_file_location("env_parser", script_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+env_parser = _load_script()
+
+SAMPLE = """# Azure settings
+export AZURE_SQL_SERVER="wiley.database.windows.net"   # trailing comment
+AZURE_SQL_DATABASE = WileyWidgetDb
+CONNECTION="Server=${AZURE_SQL_SERVER};Database=${AZURE_SQL_DATABASE}"
+LITERAL='${AZURE_SQL_SERVER} stays #as-is'
+CERT="-----BEGIN-----
+line\\tone
+-----END-----"
+URL=https://example.com/#anchor
+RETRIES=${AZURE_SQL_RETRY_ATTEMPTS:-3}
+ESCAPED="\\${NOT_EXPANDED}"
+this is not an assignment
+"""
+
+
+class TestParsing:
+    """Tests for tokenizing .env text"""
+
+    def test_entries_and_invalid_lines(self):
+        """Assignments keep their raw text, quote style and line number"""
+        env_file = env_parser.parse(SAMPLE)
+        entries = {entry.key: entry for entry in env_file.entries}
+
+        assert list(entries) == ["AZURE_SQL_SERVER", "AZURE_SQL_DATABASE", "CONNECTION", "LITERAL",
+                                 "CERT", "URL", "RETRIES", "ESCAPED"]
+        assert entries["AZURE_SQL_SERVER"].raw == "wiley.database.windows.net"
+        assert entries["LITERAL"].quote == "'"
+        assert entries["URL"].raw == "https://example.com/#anchor"
+        assert entries["CERT"].line == 6 and entries["URL"].line == 9
+        assert env_file.invalid == [(12, "this is not an assignment")]
+
+    def test_unquoted_values_read_like_the_old_loader(self):
+        """Unquoted text and unbalanced quotes are kept; only invalid key names are rejected"""
+        env_file = env_parser.parse("PASSWORD=pa ss #word\nQUOTE='it's'\nMIXED=\"a\"b\"\nmy key=1\n")
+        values = env_parser.EnvProfile([env_file]).materialize(environ={})
+
+        assert values == {"PASSWORD": "pa ss #word", "QUOTE": "it's", "MIXED": 'a"b'}
+        assert env_file.invalid == [(4, "my key=1")]
+
+    def test_only_single_quotes_keep_references_literal(self):
+        """${VAR} in unquoted and double-quoted values expands; single quotes keep it as text"""
+        env_file = env_parser.parse("BARE=x${HOME}\nDOUBLE=\"x${HOME}\"\nSINGLE='x${HOME}'\n")
+        values = env_parser.EnvProfile([env_file]).materialize(environ={"HOME": "/root"})
+
+        assert values == {"BARE": "x/root", "DOUBLE": "x/root", "SINGLE": "x${HOME}"}
+
+    def test_values_materialize_lazily(self):
+        """Expansion, defaults and escapes apply only when values are requested"""
+        values = env_parser.EnvProfile([env_parser.parse(SAMPLE)]).materialize(environ={})
+
+        assert values["CONNECTION"] == "Server=wiley.database.windows.net;Database=WileyWidgetDb"
+        assert values["LITERAL"] == "${AZURE_SQL_SERVER} stays #as-is"
+        assert values["CERT"] == "-----BEGIN-----\nline\tone\n-----END-----"
+        assert values["RETRIES"] == "3"
+        assert values["ESCAPED"] == "${NOT_EXPANDED}"
+
+    def test_environment_fallback_and_cycles(self):
+        """Unknown names fall back to the environment; reference cycles are errors"""
+        profile = env_parser.EnvProfile([env_parser.parse("HOME_DIR=${USERPROFILE}\\wiley\n")])
+        assert profile.materialize(environ={"USERPROFILE": "C:\\Users\\me"}) == {"HOME_DIR": "C:\\Users\\me\\wiley"}
+
+        literal = env_parser.EnvProfile([env_parser.parse("PASS=pa$$word\nTOKEN=a$HOME\nURL=${HOST}/x\n")])
+        assert literal.materialize(environ={"HOME": "/root"}) == {
+            "PASS": "pa$$word", "TOKEN": "a$HOME", "URL": "${HOST}/x"}
+        assert literal.undefined == [("URL", "HOST")]
+
+        cyclic = env_parser.EnvProfile([env_parser.parse("A=${B}\nB=${A}\n")])
+        with pytest.raises(env_parser.EnvParseError, match="A -> B -> A"):
+            cyclic.materialize(environ={})
+
+    def test_self_reference_extends_the_environment(self):
+        """A key referring to itself sees the environment value it replaces, not a cycle"""
+        profile = env_parser.EnvProfile([env_parser.parse("PATH=${PATH}:/opt/bin\nEXTRA=${EXTRA}\n")])
+
+        assert profile.materialize(environ={"PATH": "/usr/bin"}) == {"PATH": "/usr/bin:/opt/bin", "EXTRA": "${EXTRA}"}
+        assert profile.undefined == [("EXTRA", "EXTRA")]
+
+
+class TestProfiles:
+    """Tests for layered profiles and the parse cache"""
+
+    def test_overlay_overrides_base(self, tmp_path):
+        """The profile overlay wins key by key and can reference base values"""
+        base = tmp_path / ".env"
+        base.write_text("DB=WileyWidgetDb\nHOST=prod.example.com\n", encoding="utf-8")
+        (tmp_path / ".env.Development").write_text("HOST=localhost\nDSN=${HOST}/${DB}\n", encoding="utf-8")
+
+        development = env_parser.load_profile(base, "Development")
+        assert development.materialize(environ={}) == {
+            "DB": "WileyWidgetDb", "HOST": "localhost", "DSN": "localhost/WileyWidgetDb"}
+        assert env_parser.load_profile(base, "Staging").keys() == ["DB", "HOST"]
+
+    def test_overlay_extends_base_value(self, tmp_path):
+        """An overlay value referring to its own key builds on the base layer's value"""
+        base = tmp_path / ".env"
+        base.write_text("CONN=Server=${HOST}\nPATH=${PATH}:/opt/base\nHOST=prod\n", encoding="utf-8")
+        (tmp_path / ".env.Development").write_text(
+            "CONN=${CONN};Encrypt=True\nPATH=${PATH}:/opt/dev\nHOST=localhost\n", encoding="utf-8")
+
+        values = env_parser.load_profile(base, "Development").materialize(environ={"PATH": "/usr/bin"})
+        assert values == {"CONN": "Server=localhost;Encrypt=True", "PATH": "/usr/bin:/opt/base:/opt/dev",
+                          "HOST": "localhost"}
+
+    def test_parse_is_cached_until_the_file_changes(self, tmp_path):
+        """Unchanged files reuse the previous parse; edits are picked up"""
+        path = tmp_path / ".env"
+        path.write_text("A=1\n", encoding="utf-8")
+
+        first = env_parser.parse_file(path)
+        assert env_parser.parse_file(path) is first
+
+        path.write_text("A=1\nB=2\n", encoding="utf-8")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert [entry.key for entry in env_parser.parse_file(path).entries] == ["A", "B"]
@@ -0,0 +1,138 @@
+"""
+Converter Evaluation Script Tests
+
+Tests for scripts/evaluate_converters.py including:
+- Benchmark input generation
+- Throughput and allocation measurement
+- Baseline comparison and regression flagging
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+
+def _load_script():
+    """Import scripts/evaluate_converters.py as a module"""
+    script_path = project_root / "scripts" / "evaluate_converters.py"
+    spec = importlib.util.spec_from_file_location("evaluate_converters", script_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+converters = _load_script()
+
+
+@pytest.fixture
+def runner():
+    """Fixture providing a ConverterTestRunner instance"""
+    return converters.ConverterTestRunner()
+
+
+@pytest.fixture
+def benchmark(runner):
+    """Fixture providing a small, fast ConverterBenchmark"""
+    return converters.ConverterBenchmark(runner.evaluator, sample_size=50, repeats=2,
+                                         min_repeat_time=0.001)
+
+
+def _suite(runner, name):
+    return next(suite for suite in runner.test_suites if suite.converter_name == name)
+
+
+class TestConverterBenchmark:
+    """Tests for the converter benchmark mode"""
+
+    def test_inputs_are_reproducible_and_mixed(self, runner, benchmark):
+        """Generated inputs cover every value kind and repeat for the same seed"""
+        suite = _suite(runner, "BoolToVisibilityConverter")
+        first = benchmark.generate_inputs(suite)
+        second = benchmark.generate_inputs(suite)
+
+        assert first == second
+        kinds = {type(value).__name__ for value, _ in first}
+        assert {"NoneType", "str", "Decimal", "float", "int", "bool"} <= kinds
+        assert {parameter for _, parameter in first} & {"invert", "5"}
+
+    def test_benchmark_suite_reports_positive_throughput(self, runner, benchmark):
+        """Every converter produces a throughput figure"""
+        results = benchmark.run(runner.test_suites[:3])
+
+        assert [r.converter_name for r in results] == [s.converter_name for s in runner.test_suites[:3]]
+        for result in results:
+            assert result.calls_per_second > 0
+            assert result.alloc_bytes_per_call >= 0
+            assert result.calls_measured >= 100
+
+    def test_baseline_roundtrip_and_regression(self, runner, benchmark, tmp_path):
+        """A slower run than the stored baseline is flagged"""
+        results = benchmark.run([_suite(runner, "InverseBooleanConverter")])
+        baseline_path = tmp_path / "baseline.json"
+        benchmark.save_baseline(results, baseline_path)
+        baseline = benchmark.load_baseline(baseline_path)
+
+        assert benchmark.compare_to_baseline(results, baseline) == []
+
+        slower = converters.BenchmarkResult(**{**baseline["InverseBooleanConverter"],
+                                               "calls_per_second": results[0].calls_per_second / 2})
+        regressions = benchmark.compare_to_baseline([slower], baseline, threshold=0.15)
+        assert [r.metric for r in regressions] == ["calls_per_second"]
+
+    def test_missing_baseline_is_empty(self, tmp_path):
+        """No baseline file means nothing to compare"""
+        assert converters.ConverterBenchmark.load_baseline(tmp_path / "absent.json") == {}
+
+
+class TestConverterFuzzer:
+    """Tests for the converter fuzzing mode"""
+
+    def test_current_models_satisfy_invariants(self):
+        """A short in-process fuzz run finds no violations"""
+        fuzzer = converters.ConverterFuzzer(cases_per_converter=300, chunk_size=100, workers=1)
+        reports = fuzzer.run(["BoolToVisibilityConverter", "CountToVisibilityConverter",
+                              "InverseBooleanConverter", "BudgetProgressConverter"])
+
+        assert [report.cases for report in reports] == [300] * 4
+        assert all(not report.failures for report in reports)
+
+    def test_process_pool_matches_inline_run(self):
+        """Chunked pool execution covers the same cases as the inline path"""
+        names = ["BalanceColorConverter", "MessageForegroundConverter"]
+        inline = converters.ConverterFuzzer(cases_per_converter=250, chunk_size=100, workers=1).run(names)
+        pooled = converters.ConverterFuzzer(cases_per_converter=250, chunk_size=100, workers=2).run(names)
+
+        assert [(r.converter_name, r.cases) for r in inline] == [(r.converter_name, r.cases) for r in pooled]
+
+    def test_domain_allows_parameter_tokens(self):
+        """Custom "true|false" parameter tokens extend the allowed output domain"""
+        evaluator = converters.ConverterEvaluator()
+        assert converters.check_fuzz_case(evaluator, "BoolToForegroundConverter", True, "Blue|Green") is None
+        assert converters.check_fuzz_case(evaluator, "BoolToVisibilityConverter", 5, "²") is None
+
+    def test_failures_shrink_to_minimal_input(self):
+        """A violating input is reduced while it keeps failing the same invariant"""
+
+        class BrokenEvaluator(converters.ConverterEvaluator):
+            @staticmethod
+            def evaluate_count_to_visibility_converter(value, parameter=""):
+                if isinstance(value, int) and parameter.isdigit():
+                    return "Visible" if value == int(parameter) else "Collapsed"
+                return "Collapsed"
+
+        evaluator = BrokenEvaluator()
+        failure = converters.FuzzFailure("CountToVisibilityConverter", "no-exception",
+                                         -2147483648, "²", "ValueError")
+        assert converters.check_fuzz_case(evaluator, failure.converter_name, failure.value,
+                                          failure.parameter)[0] == "no-exception"
+
+        shrunk = converters.shrink_failure(evaluator, failure)
+        assert shrunk.shrunk_value == 0
+        assert shrunk.shrunk_parameter == "²"
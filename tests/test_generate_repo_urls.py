@@ -0,0 +1,342 @@
+"""
+Repository Manifest Generator Tests
+
+Tests for scripts/generate_repo_urls.py including:
+- Streaming hashing and line counting
+- Memory-mapped scanning of large files
+- Binary detection
+- Incremental regeneration and streamed/sharded output
+- Symbol index extraction and lookup
+"""
+
+import hashlib
+import importlib.util
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+
+def _load_script():
+    """Import scripts/generate_repo_urls.py as a module"""
+    script_path = project_root / "scripts" / "generate_repo_urls.py"
+    spec = importlib.util.spec_from_file_location("generate_repo_urls", script_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+repo_urls = _load_script()
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(["git", *args], cwd=repo, capture_output=True, text=True, check=True).stdout
+
+
+@pytest.fixture
+def git_repo(tmp_path):
+    """Fixture providing a small committed git repository"""
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "config", "user.email", "tests@example.com")
+    _git(tmp_path, "config", "user.name", "tests")
+    (tmp_path / "README.md").write_text("# Sample\n\nText\n", encoding="utf-8")
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "App.cs").write_text("class App\n{\n}", encoding="utf-8")
+    (tmp_path / "data.bin").write_bytes(b"\x00\x01\x02" * 100)
+    _git(tmp_path, "add", "-A")
+    _git(tmp_path, "commit", "-q", "-m", "initial")
+    return tmp_path
+
+
+@pytest.fixture
+def generator(git_repo):
+    """Fixture providing a generator over the sample repository"""
+    return repo_urls.RepoManifestGenerator(str(git_repo))
+
+
+class TestStreamingMetadata:
+    """Tests for single-pass hashing and line counting"""
+
+    def test_line_count_covers_whole_file(self, generator, git_repo):
+        """Line counts are exact beyond the first chunk and without a trailing newline"""
+        content = "".join(f"line {i}\n" for i in range(5000)) + "last"
+        (git_repo / "big.txt").write_text(content, encoding="utf-8")
+        generator.HASH_CHUNK_SIZE = 4096
+
+        metadata = generator._get_file_metadata("big.txt")
+
+        assert metadata["line_count"] == 5001
+        assert metadata["sha256"] == hashlib.sha256(content.encode()).hexdigest()
+        assert metadata["is_binary"] is False
+
+    def test_mmap_path_matches_buffered_path(self, generator, git_repo):
+        """Large files scanned through mmap produce the same metadata"""
+        content = b"abc\n" * 50_000
+        (git_repo / "large.log").write_bytes(content)
+
+        buffered = generator._get_file_metadata("large.log")
+        generator.MMAP_THRESHOLD = 1024
+        generator.HASH_CHUNK_SIZE = 8192
+        mapped = generator._get_file_metadata("large.log")
+
+        assert mapped["sha256"] == buffered["sha256"] == hashlib.sha256(content).hexdigest()
+        assert mapped["line_count"] == buffered["line_count"] == 50_000
+
+    def test_binary_files_are_hashed_without_lines(self, generator, git_repo):
+        """Binary files keep a hash but report no lines"""
+        metadata = generator._get_file_metadata("data.bin")
+
+        assert metadata["is_binary"] is True
+        assert metadata["line_count"] == 0
+        assert metadata["sha256"] == hashlib.sha256((git_repo / "data.bin").read_bytes()).hexdigest()
+
+    def test_empty_file(self, generator, git_repo):
+        """Empty files have zero lines and the empty-string digest"""
+        (git_repo / "empty.txt").write_bytes(b"")
+        metadata = generator._get_file_metadata("empty.txt")
+
+        assert metadata["line_count"] == 0
+        assert metadata["sha256"] == hashlib.sha256(b"").hexdigest()
+
+
+class TestIncrementalManifest:
+    """Tests for reuse of entries keyed by git blob OIDs"""
+
+    def _scanned_paths(self, generator, monkeypatch):
+        scanned = []
+        original = generator._get_file_metadata
+
+        def tracking(file_path):
+            scanned.append(file_path)
+            return original(file_path)
+
+        monkeypatch.setattr(generator, "_get_file_metadata", tracking)
+        return scanned
+
+    def test_full_run_records_blob_oids(self, generator, git_repo):
+        """Every entry carries the staged blob OID"""
+        manifest = generator.generate_manifest()
+        oids = {e["metadata"]["path"]: e["metadata"]["git_oid"] for e in manifest["files"]}
+
+        assert oids["README.md"] == _git(git_repo, "rev-parse", "HEAD:README.md").strip()
+
+    def test_only_changed_blobs_are_rescanned(self, git_repo, monkeypatch, tmp_path_factory):
+        """Unchanged files reuse the previous manifest; committed changes are rescanned"""
+        output = tmp_path_factory.mktemp("out") / "manifest.json"
+        repo_urls.RepoManifestGenerator(str(git_repo)).save_manifest(str(output))
+
+        (git_repo / "src" / "App.cs").write_text("class App\n{\n    int x;\n}\n", encoding="utf-8")
+        _git(git_repo, "commit", "-q", "-am", "change")
+
+        generator = repo_urls.RepoManifestGenerator(str(git_repo))
+        scanned = self._scanned_paths(generator, monkeypatch)
+        manifest = generator.generate_manifest(generator.load_previous_entries(output))
+
+        assert scanned == ["src/App.cs"]
+        entry = next(e for e in manifest["files"] if e["metadata"]["path"] == "src/App.cs")
+        assert entry["metadata"]["line_count"] == 4
+
+    def test_dirty_working_tree_is_rescanned(self, git_repo, monkeypatch, tmp_path_factory):
+        """Uncommitted edits are never served from the previous manifest"""
+        output = tmp_path_factory.mktemp("out") / "manifest.json"
+        repo_urls.RepoManifestGenerator(str(git_repo)).save_manifest(str(output))
+        (git_repo / "README.md").write_text("# Edited\n", encoding="utf-8")
+
+        generator = repo_urls.RepoManifestGenerator(str(git_repo))
+        scanned = self._scanned_paths(generator, monkeypatch)
+        manifest = generator.generate_manifest(generator.load_previous_entries(output))
+
+        assert scanned == ["README.md"]
+        entry = next(e for e in manifest["files"] if e["metadata"]["path"] == "README.md")
+        assert entry["metadata"]["git_oid"] == ""
+
+    def test_missing_previous_manifest_means_full_scan(self, tmp_path):
+        """A missing or unreadable manifest yields no reusable entries"""
+        assert repo_urls.RepoManifestGenerator.load_previous_entries(tmp_path / "absent.json") == {}
+
+
+class TestParallelExtraction:
+    """Tests for the threaded metadata extraction pool"""
+
+    def test_parallel_matches_serial(self, git_repo):
+        """Thread-pool extraction merges to the same entries as a serial run"""
+        for i in range(40):
+            (git_repo / f"file_{i:02d}.txt").write_text("x\n" * i, encoding="utf-8")
+        _git(git_repo, "add", "-A")
+        _git(git_repo, "commit", "-q", "-m", "more files")
+
+        serial = repo_urls.RepoManifestGenerator(str(git_repo), workers=1).generate_manifest()
+        parallel = repo_urls.RepoManifestGenerator(str(git_repo), workers=8).generate_manifest()
+
+        assert parallel["files"] == serial["files"]
+        assert parallel["summary"] == serial["summary"]
+
+    def test_progress_reports_completion(self, generator, capsys):
+        """The progress counter reaches 100%"""
+        generator.generate_manifest()
+        assert "[100%]" in capsys.readouterr().out
+
+
+class TestStreamingWriters:
+    """Tests for streamed JSON, JSON lines and sharded output"""
+
+    def test_streamed_json_matches_in_memory_manifest(self, generator, tmp_path):
+        """The streamed document parses to the same content as generate_manifest"""
+        in_memory = generator.generate_manifest()
+        output = tmp_path / "manifest.json"
+        generator.save_manifest(str(output))
+
+        streamed = json.loads(output.read_text(encoding="utf-8"))
+        assert streamed["files"] == in_memory["files"]
+        assert streamed["summary"] == in_memory["summary"]
+        assert not (tmp_path / "manifest.json.tmp").exists()
+
+    def test_jsonl_records_and_incremental_reload(self, generator, tmp_path):
+        """JSON lines output has typed records and seeds incremental runs"""
+        output = tmp_path / "manifest.jsonl"
+        generator.save_manifest(str(output), output_format="jsonl")
+
+        records = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+        assert records[0]["type"] == "repository"
+        assert records[-1]["type"] == "summary"
+        assert {r["metadata"]["path"] for r in records if r["type"] == "file"} == {
+            "README.md", "data.bin", "src/App.cs"}
+        assert set(generator.load_previous_entries(output)) == {"README.md", "data.bin", "src/App.cs"}
+
+    def test_sharded_layout(self, generator, tmp_path):
+        """The index lists one shard per top-level directory with matching totals"""
+        shard_dir = tmp_path / "shards"
+        generator.save_manifest(str(tmp_path / "manifest.json"), shard_dir=str(shard_dir))
+
+        index = json.loads((shard_dir / "index.json").read_text(encoding="utf-8"))
+        assert [s["directory"] for s in index["shards"]] == ["_root", "src"]
+        assert sum(s["total_files"] for s in index["shards"]) == index["summary"]["total_files"]
+
+        src = json.loads((shard_dir / index["shards"][1]["path"]).read_text(encoding="utf-8"))
+        assert [f["metadata"]["path"] for f in src["files"]] == ["src/App.cs"]
+
+    def test_shard_file_names_avoid_hidden_files(self):
+        """Dot-directories map to visible shard file names"""
+        writer = repo_urls.ShardedManifestWriter
+        assert writer.shard_name(".github/workflows/ci.yml") == ".github"
+        assert writer.shard_name("README.md") == "_root"
+        assert writer.shard_file_name(".github") == "dot-github.json"
+
+    def test_unknown_format_rejected(self, tmp_path):
+        """Only json and jsonl formats are accepted"""
+        with pytest.raises(ValueError):
+            repo_urls.ManifestWriter(tmp_path / "manifest.xml", "xml")
+
+
+class TestFileClassifier:
+    """Tests for the precomputed classification tables"""
+
+    @pytest.fixture
+    def classifier(self):
+        return repo_urls.FileClassifier(repo_urls.RepoManifestGenerator.LANGUAGE_MAP)
+
+    @pytest.mark.parametrize("path, expected", [
+        ("src/Views/MainWindow.xaml", ("source_code", "high")),
+        ("WileyWidget.Data/AppDbContext.cs", ("source_code", "high")),
+        ("WileyWidget.csproj", ("source_code", "high")),
+        ("tests/conftest.py", ("test", "medium")),
+        ("scripts/test-debugpy.py", ("test", "medium")),
+        ("README.md", ("documentation", "high")),
+        ("docs/README.md", ("documentation", "medium")),
+        ("scripts/load-env.py", ("automation", "medium")),
+        ("config/appsettings.json", ("configuration", "high")),
+        ("data/WileyWidgetDev.db", ("unknown", "normal")),
+    ])
+    def test_category_rule_precedence(self, classifier, path, expected):
+        """Rules resolve with the same precedence as the ordered checks they replace"""
+        assert classifier.category(path) == expected
+
+    def test_languages_by_name_and_content(self, classifier):
+        """Extensionless files are classified by name or shebang"""
+        assert classifier.language("docker/Dockerfile.test") == "Docker"
+        assert classifier.language("Dockerfile") == "Docker"
+        assert classifier.language(".gitignore") == "Git Ignore"
+        assert classifier.language("scripts/pre-push", b"#!/bin/sh\nexit 0\n") == "Shell"
+        assert classifier.language("tools/run", b"#!/usr/bin/env python3\n") == "Python"
+        assert classifier.language("scripts/Program.CS") == "C#"
+
+    def test_utf16_text_is_not_binary(self, generator, git_repo):
+        """BOM-tagged UTF-16 text keeps its line count and encoding"""
+        (git_repo / "notes.txt").write_bytes("one\ntwo\n".encode("utf-16"))
+        metadata = generator._get_file_metadata("notes.txt")
+
+        assert metadata["is_binary"] is False
+        assert metadata["encoding"] == "utf-16"
+
+    def test_stale_manifest_version_disables_reuse(self, generator, tmp_path):
+        """Entries written by an older classifier are not reused"""
+        output = tmp_path / "manifest.json"
+        generator.save_manifest(str(output))
+        manifest = json.loads(output.read_text(encoding="utf-8"))
+        manifest["repository"]["manifest_version"] = 1
+        output.write_text(json.dumps(manifest), encoding="utf-8")
+
+        assert generator.load_previous_entries(output) == {}
+
+
+class TestSymbolIndex:
+    """Tests for the symbol index built alongside the manifest"""
+
+    def test_extracts_csharp_xaml_and_python_symbols(self, tmp_path):
+        """Declarations are recorded with their kind and 1-based line"""
+        source = tmp_path / "Account.cs"
+        source.write_text(
+            "namespace Demo\n{\n    public partial class Account : Base\n    {\n"
+            "        public decimal Balance { get; set; }\n"
+            "        public async Task<bool> LoadAsync(int id)\n        {\n"
+            "            if (id > 0) return true;\n        }\n    }\n"
+            "    internal enum AccountType { Asset }\n"
+            "    private readonly record struct Snapshot(double Progress, string Message);\n"
+            '    Assert.True(ok, "should show at least one record when data exists."); // class Hidden\n'
+            "    var path = @\"C:\\struct Verbatim\"; /* interface Commented */\n}\n",
+            encoding="utf-8",
+        )
+        kinds = repo_urls.SYMBOL_KINDS
+        symbols = [(name, kinds[kind], line)
+                   for name, kind, line in repo_urls.extract_symbols(str(source), "C#")]
+        assert symbols == [("Account", "class", 3), ("Balance", "property", 5),
+                           ("LoadAsync", "method", 6), ("AccountType", "enum", 11),
+                           ("Snapshot", "record", 12)]
+
+        view = tmp_path / "View.xaml"
+        view.write_text('<Grid x:Name="Root">\n  <Style x:Key="Header" />\n</Grid>\n', encoding="utf-8")
+        assert [(n, kinds[k]) for n, k, _ in repo_urls.extract_symbols(str(view), "XAML")] == [
+            ("Root", "x:Name"), ("Header", "x:Key")]
+
+        script = tmp_path / "tool.py"
+        script.write_text("class Tool:\n    async def run(self):\n        pass\n", encoding="utf-8")
+        assert [(n, kinds[k]) for n, k, _ in repo_urls.extract_symbols(str(script), "Python")] == [
+            ("Tool", "class"), ("run", "def")]
+
+    def test_lookup_and_incremental_reuse(self, generator, git_repo, tmp_path):
+        """Unchanged blobs are reused and edits are re-extracted before commit"""
+        index_path = tmp_path / "symbols.json"
+        builder = repo_urls.SymbolIndexBuilder(generator, workers=1)
+        builder.save(index_path)
+
+        index = repo_urls.SymbolIndexBuilder.load(index_path)
+        assert repo_urls.lookup_symbol(index, "App") == [
+            {"path": "src/App.cs", "kind": "class", "line": 1}]
+
+        (git_repo / "src" / "App.cs").write_text("class Renamed\n{\n}", encoding="utf-8")
+        rebuilt = builder.build(index)
+        assert repo_urls.lookup_symbol(rebuilt, "App") == []
+        assert repo_urls.lookup_symbol(rebuilt, "Renamed")[0]["path"] == "src/App.cs"
+
+    def test_stale_index_version_is_ignored(self, tmp_path):
+        """An index written in an older layout is rebuilt from scratch"""
+        index_path = tmp_path / "symbols.json"
+        index_path.write_text(json.dumps({"version": 0, "files": {}}), encoding="utf-8")
+        assert repo_urls.SymbolIndexBuilder.load(index_path) == {}
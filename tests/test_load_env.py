@@ -0,0 +1,310 @@
+"""
+Environment Loader Tests
+
+Tests for scripts/load-env.py including:
+- Key Vault reference parsing
+- Batched, de-duplicated and concurrent secret resolution per vault
+- Short-TTL encrypted secret cache
+- Loading an env file against an offline stub secret provider
+- Profile overlays for load and unload
+- Concurrent connectivity probes against local stand-in servers
+"""
+
+import asyncio
+import base64
+import importlib.util
+import json
+import os
+import socketserver
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+
+def _load_script():
+    """Import scripts/load-env.py as a module"""
+    script_path = project_root / "scripts" / "load-env.py"
+    spec = importlib.util.spec_from_file_location("load_env", script_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+load_env = _load_script()
+
+VAULTS = ["https://wiley-dev.vault.azure.net", "https://wiley-shared.vault.azure.net"]
+
+
+class ReversibleCipher:
+    """Stand-in cipher so cache behaviour can be tested without DPAPI or cryptography"""
+
+    def encrypt(self, data):
+        return base64.b64encode(data[::-1])
+
+    def decrypt(self, data):
+        return base64.b64decode(data)[::-1]
+
+
+@pytest.fixture
+def stub_secrets():
+    """Fixture providing 20 secrets spread across two vaults"""
+    return {f"{VAULTS[index % 2]}/secrets/Secret{index}": f"value-{index}" for index in range(20)}
+
+
+class TestKeyVaultReferences:
+    """Tests for reference parsing"""
+
+    def test_parse_reference_forms(self):
+        """Plain, versioned and SecretUri= references split into vault, name and version"""
+        assert load_env.parse_key_vault_reference("https://Wiley.vault.azure.net/secrets/Key") == (
+            "https://wiley.vault.azure.net", "Key", None)
+        assert load_env.parse_key_vault_reference("SecretUri=https://wiley.vault.azure.net/secrets/Key/abc123/") == (
+            "https://wiley.vault.azure.net", "Key", "abc123")
+        with pytest.raises(ValueError):
+            load_env.parse_key_vault_reference("wiley/Key")
+
+
+class TestKeyVaultResolver:
+    """Tests for batched resolution"""
+
+    def test_secrets_are_fetched_once_and_concurrently(self, stub_secrets):
+        """Duplicate references cost one request and latency overlaps across the pool"""
+        provider = load_env.StubSecretProvider(stub_secrets, latency=0.1)
+        resolver = load_env.KeyVaultResolver(lambda: provider, max_workers=10)
+        references = {f"KEY_{index}": url for index, url in enumerate(stub_secrets)}
+        references["DUPLICATE"] = next(iter(stub_secrets))
+
+        start = time.perf_counter()
+        values, errors = resolver.resolve(references)
+        elapsed = time.perf_counter() - start
+
+        assert errors == {}
+        assert values["KEY_3"] == "value-3" and values["DUPLICATE"] == "value-0"
+        assert len(provider.requests) == 20
+        assert elapsed < 0.6
+
+    def test_errors_are_reported_per_key(self, stub_secrets):
+        """Invalid, missing and failing references do not stop the others"""
+        class FlakyProvider(load_env.StubSecretProvider):
+            def get_secret(self, vault_url, name, version=None):
+                if name == "Secret1":
+                    raise ConnectionError("vault unreachable")
+                return super().get_secret(vault_url, name, version)
+
+        resolver = load_env.KeyVaultResolver(lambda: FlakyProvider(stub_secrets))
+        values, errors = resolver.resolve({
+            "GOOD": f"{VAULTS[0]}/secrets/Secret0",
+            "FLAKY": f"{VAULTS[1]}/secrets/Secret1",
+            "MISSING": f"{VAULTS[0]}/secrets/Nope",
+            "INVALID": "not-a-reference",
+        })
+
+        assert values == {"GOOD": "value-0"}
+        assert errors["FLAKY"] == "Key Vault resolution failed: vault unreachable"
+        assert errors["MISSING"] == "Empty secret from Key Vault"
+        assert errors["INVALID"] == "Invalid Key Vault reference format"
+
+    def test_missing_sdk_is_reported(self):
+        """Without the Azure SDK every reference fails with a clear message"""
+        def no_sdk():
+            raise ImportError("azure")
+
+        _, errors = load_env.KeyVaultResolver(no_sdk).resolve({"KEY": f"{VAULTS[0]}/secrets/Key"})
+        assert errors == {"KEY": "Azure SDK not available for Key Vault resolution"}
+
+
+class TestSecretCache:
+    """Tests for the encrypted secret cache"""
+
+    def test_cache_hits_skip_the_vault_until_expiry(self, stub_secrets, tmp_path):
+        """A second load is served from the cache, which expires after the TTL"""
+        now = [1000.0]
+        cache_path = tmp_path / "secrets.bin"
+        provider = load_env.StubSecretProvider(stub_secrets)
+        references = {"KEY": f"{VAULTS[0]}/secrets/Secret0"}
+
+        def resolver():
+            cache = load_env.SecretCache(cache_path, ttl=60, cipher=ReversibleCipher(), clock=lambda: now[0])
+            return load_env.KeyVaultResolver(lambda: provider, cache=cache)
+
+        assert resolver().resolve(references)[0] == {"KEY": "value-0"}
+        assert resolver().resolve(references)[0] == {"KEY": "value-0"}
+        assert len(provider.requests) == 1
+        assert b"value-0" not in cache_path.read_bytes()
+
+        now[0] += 61
+        resolver().resolve(references)
+        assert len(provider.requests) == 2
+
+    def test_cache_is_disabled_without_cipher(self, tmp_path):
+        """Secrets are never persisted when no encryption is available"""
+        cache = load_env.SecretCache(tmp_path / "secrets.bin", cipher=None)
+        cache.put_many({"https://wiley.vault.azure.net/secrets/Key": "value"})
+
+        assert not cache.enabled
+        assert not (tmp_path / "secrets.bin").exists()
+
+    def test_fernet_cipher_roundtrip(self, tmp_path):
+        """The Fernet cipher creates a private key file and round-trips data"""
+        pytest.importorskip("cryptography")
+        cipher = load_env.FernetCipher(tmp_path / "secrets.key")
+
+        assert cipher.decrypt(cipher.encrypt(b"secret")) == b"secret"
+        if os.name != "nt":
+            assert (tmp_path / "secrets.key").stat().st_mode & 0o077 == 0
+
+
+class TestLoadEnvironment:
+    """Tests for loading an env file with Key Vault references"""
+
+    def test_env_file_with_stub_provider(self, stub_secrets, tmp_path, monkeypatch):
+        """Plain values and resolved secrets are exported; failures are counted"""
+        for key in ("WW_PLAIN", "WW_SECRET", "WW_BROKEN"):
+            monkeypatch.setenv(key, "")
+        stub_file = tmp_path / "secrets.json"
+        stub_file.write_text(json.dumps(stub_secrets), encoding="utf-8")
+        env_file = tmp_path / ".env"
+        env_file.write_text(
+            "# comment\n"
+            "WW_PLAIN='plain value'\n"
+            f"WW_SECRET=@AzureKeyVault({VAULTS[1]}/secrets/Secret5)\n"
+            "WW_BROKEN=@AzureKeyVault(not-a-reference)\n",
+            encoding="utf-8")
+
+        resolver = load_env.default_resolver(stub_path=stub_file)
+        assert load_env.load_environment_variables(env_file, resolver) is False
+
+        assert os.environ["WW_PLAIN"] == "plain value"
+        assert os.environ["WW_SECRET"] == "value-5"
+        assert os.environ["WW_BROKEN"] == ""
+
+    def test_profile_overlay_and_unload(self, tmp_path, monkeypatch):
+        """--profile layers .env.<profile> on top and unload removes every layered key"""
+        for key in ("WW_HOST", "WW_DSN"):
+            monkeypatch.setenv(key, "")
+        env_file = tmp_path / ".env"
+        env_file.write_text("WW_HOST=prod\nWW_DSN=${WW_HOST}/db\n", encoding="utf-8")
+        (tmp_path / ".env.Development").write_text("WW_HOST=localhost\n", encoding="utf-8")
+
+        assert load_env.load_environment_variables(env_file, profile="Development") is True
+        assert os.environ["WW_DSN"] == "localhost/db"
+
+        assert load_env.unload_environment_variables(env_file, profile="Development") is True
+        assert "WW_HOST" not in os.environ and "WW_DSN" not in os.environ
+
+
+class FakeKeyVaultHandler(BaseHTTPRequestHandler):
+    """Answers like an unauthenticated Key Vault endpoint"""
+
+    def do_HEAD(self):
+        self.send_response(401)
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeSqlHandler(socketserver.BaseRequestHandler):
+    """Accepts the TCP connection a SQL client would open"""
+
+    def handle(self):
+        self.request.recv(1)
+
+
+class HangingHandler(socketserver.BaseRequestHandler):
+    """Accepts and never answers, like a firewalled endpoint"""
+
+    def handle(self):
+        self.server.release.wait(10)
+
+
+def _serve(server):
+    server.daemon_threads = True
+    server.release = threading.Event()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+@pytest.fixture
+def stand_in_servers():
+    """Fixture providing a fake SQL listener, a fake HTTP endpoint and a hanging endpoint"""
+    servers = {
+        "sql": _serve(socketserver.ThreadingTCPServer(("127.0.0.1", 0), FakeSqlHandler)),
+        "http": _serve(ThreadingHTTPServer(("127.0.0.1", 0), FakeKeyVaultHandler)),
+        "hang": _serve(socketserver.ThreadingTCPServer(("127.0.0.1", 0), HangingHandler)),
+    }
+    yield {name: server.server_address[1] for name, server in servers.items()}
+    for server in servers.values():
+        server.release.set()
+        server.shutdown()
+        server.server_close()
+
+
+class TestConnectivityProbes:
+    """Tests for concurrent endpoint probes"""
+
+    def test_probes_run_concurrently_with_deadlines(self, stand_in_servers):
+        """Two slow endpoints cost one deadline, not two, and latency is reported"""
+        ports = stand_in_servers
+        probes = [
+            load_env.Probe("sql", "fake", lambda: load_env.probe_tcp("127.0.0.1", ports["sql"])),
+            load_env.Probe("vault", "fake", lambda: load_env.probe_http(f"http://127.0.0.1:{ports['http']}/")),
+            load_env.Probe("slow-1", "fake", lambda: load_env.probe_http(f"http://127.0.0.1:{ports['hang']}/")),
+            load_env.Probe("slow-2", "fake", lambda: load_env.probe_http(f"http://127.0.0.1:{ports['hang']}/")),
+        ]
+
+        start = time.perf_counter()
+        results = asyncio.run(load_env.run_probes(probes, timeout=0.5))
+        elapsed = time.perf_counter() - start
+
+        by_name = {result.name: result for result in results}
+        assert by_name["sql"].ok and by_name["sql"].detail == "TCP connect ok"
+        assert by_name["vault"].ok and by_name["vault"].detail == "HTTP 401"
+        assert not by_name["slow-1"].ok and by_name["slow-1"].detail == "timed out after 0.5s"
+        assert by_name["slow-2"].latency_ms >= 450
+        assert elapsed < 0.9
+
+    def test_blocking_checks_do_not_outlive_the_deadline(self):
+        """An SDK call stuck in a thread does not delay the report"""
+        probe = load_env.Probe("sdk", "fake", lambda: load_env.run_blocking(time.sleep, 5))
+
+        start = time.perf_counter()
+        assert load_env.test_connections(timeout=0.2, probes=[probe]) is False
+        assert time.perf_counter() - start < 1.0
+
+    def test_probes_follow_the_environment(self, stand_in_servers, capsys):
+        """Configured endpoints become probes and each result is printed"""
+        probes = load_env.connectivity_probes({
+            "AZURE_SQL_SERVER": f"tcp:127.0.0.1,{stand_in_servers['sql']}",
+            "AZURE_KEY_VAULT_URL": "https://wiley.vault.azure.net",
+            "AZURE_TENANT_ID": "tenant",
+        })
+        assert [(probe.name, probe.target) for probe in probes][:2] == [
+            ("Azure SQL", f"127.0.0.1:{stand_in_servers['sql']}"),
+            ("Key Vault endpoint", "https://wiley.vault.azure.net")]
+        assert [probe.name for probe in probes][2:] == ["Key Vault secret", "Azure AD"]
+        assert load_env._sql_endpoint("wiley-sql") == ("wiley-sql.database.windows.net", 1433)
+
+        assert load_env.test_connections(timeout=2, probes=probes[:1]) is True
+        assert "✅ Azure SQL" in capsys.readouterr().out
+
+    def test_malformed_sql_server_fails_only_its_probe(self, stand_in_servers):
+        """A bad AZURE_SQL_SERVER port is reported as a failed probe, not a crash"""
+        probes = load_env.connectivity_probes({
+            "AZURE_SQL_SERVER": "tcp:host,abc",
+            "AZURE_KEY_VAULT_URL": f"http://127.0.0.1:{stand_in_servers['http']}/",
+        })
+
+        results = asyncio.run(load_env.run_probes(probes[:2], timeout=2))
+        assert [(result.name, result.ok) for result in results] == [("Azure SQL", False), ("Key Vault endpoint", True)]
+        assert results[0].target == "tcp:host,abc"
+        assert "invalid port 'abc'" in results[0].detail
@@ -0,0 +1,125 @@
+"""
+Process Tree Sampler Tests
+
+Tests for scripts/process_sampler.py including:
+- Aggregation of CPU, memory, threads and handles across a process tree
+- Ring buffer wrap-around in chronological order
+- Percentile summary and CSV time series output
+"""
+
+import csv
+import importlib.util
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+psutil = pytest.importorskip("psutil")
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+
+def _load_script():
+    """Import scripts/process_sampler.py as a module"""
+    script_path = project_root / "scripts" / "process_sampler.py"
+    spec = importlib.util.spec_from_file_location("process_sampler", script_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+process_sampler = _load_script()
+
+# A parent that idles while a grandchild allocates 64 MB and burns CPU
+GRANDCHILD = ("import time\n"
+              "block = bytearray(64 * 1024 * 1024)\n"
+              "end = time.perf_counter() + 1.0\n"
+              "while time.perf_counter() < end: pass\n")
+PARENT = ("import subprocess, sys\n"
+          f"subprocess.run([sys.executable, '-c', {GRANDCHILD!r}])\n")
+
+
+class TestProcessTreeSampler:
+    """Tests for tree-wide sampling"""
+
+    def test_grandchildren_are_included(self):
+        """CPU and RSS of a grandchild show up in the tree aggregate at a sub-100 ms rate"""
+        process = subprocess.Popen([sys.executable, "-c", PARENT])
+        with process_sampler.ProcessTreeSampler(process.pid, interval=0.02, tree_refresh=0.05) as sampler:
+            process.wait(30)
+        summary = sampler.summary()
+
+        assert summary["processes"]["max"] >= 2
+        assert summary["rss_mb"]["max"] >= 64
+        assert summary["cpu_percent"]["p95"] >= 50
+        assert summary["cpu_seconds"] >= 0.5
+        assert summary["threads"]["max"] >= 2 and summary["handles"]["max"] > 0
+        assert summary["samples"] >= 20
+        assert summary["interval_ms"] < 100
+
+    def test_late_found_process_does_not_spike_cpu_percent(self):
+        """CPU a process used before it was found counts towards CPU time, not the sample's rate"""
+        sampler = process_sampler.ProcessTreeSampler(os.getpid(), tree_refresh=0.5)
+        sampler.sample()
+        spin = "import time\nend = time.perf_counter() + 0.5\nwhile time.perf_counter() < end: pass\ntime.sleep(30)\n"
+        process = subprocess.Popen([sys.executable, "-c", spin])
+        try:
+            time.sleep(0.3)
+            sampler.sample()  # before the tree refresh: child not seen yet
+            time.sleep(0.4)
+            sampler.sample()  # refresh finds the child with ~0.5s of CPU already used
+        finally:
+            process.kill()
+            process.wait()
+
+        assert sampler.summary()["processes"]["max"] == 2
+        assert max(sampler.series("cpu_percent")) < 50
+        assert sampler.cpu_seconds >= 0.4
+
+    def test_ring_buffer_keeps_latest_samples(self):
+        """Wrapping overwrites the oldest samples and series stay chronological"""
+        sampler = process_sampler.ProcessTreeSampler(os.getpid(), capacity=5)
+        for _ in range(8):
+            assert sampler.sample()
+
+        elapsed = list(sampler.series("elapsed_s"))
+        assert sampler.count == 8 and sampler.dropped == 3
+        assert len(elapsed) == 5 and elapsed == sorted(elapsed)
+        assert sampler.summary()["samples"] == 8
+
+    def test_exited_tree_stops_sampling(self):
+        """Sampling reports False once the root process is gone"""
+        process = subprocess.Popen([sys.executable, "-c", "pass"])
+        process.wait()
+        assert process_sampler.ProcessTreeSampler(process.pid).sample() is False
+
+
+class TestSamplerOutput:
+    """Tests for summaries and time series files"""
+
+    def test_csv_series_and_summary_lines(self, tmp_path):
+        """The CSV holds one row per sample and the summary formats every metric"""
+        sampler = process_sampler.ProcessTreeSampler(os.getpid())
+        for _ in range(3):
+            sampler.sample()
+
+        path = sampler.write_series(tmp_path / "series" / "run.csv")
+        with open(path, newline="", encoding="utf-8") as f:
+            rows = list(csv.reader(f))
+        assert tuple(rows[0]) == process_sampler.FIELDS
+        assert len(rows) == 4
+
+        lines = process_sampler.format_summary(sampler.summary())
+        assert lines[0].startswith("Samples: 3")
+        assert any(line.startswith("rss_mb") for line in lines)
+
+    def test_percentile_interpolates(self):
+        """Percentiles interpolate between neighbouring samples"""
+        assert process_sampler.percentile([10, 20, 30, 40], 50) == 25
+        assert process_sampler.percentile([7], 99) == 7
@@ -0,0 +1,85 @@
+"""
+Pytest Phase Splitting Tests
+
+Tests for scripts/pytest_phases.py including:
+- Category matching by file and required/excluded markers
+- Streaming JUnit XML into per-category tallies
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+
+def _load_script():
+    """Import scripts/pytest_phases.py as a module"""
+    script_path = project_root / "scripts" / "pytest_phases.py"
+    spec = importlib.util.spec_from_file_location("pytest_phases", script_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+pytest_phases = _load_script()
+PytestSelection = pytest_phases.PytestSelection
+
+JUNIT_XML = """<?xml version="1.0" encoding="utf-8"?>
+<testsuites><testsuite name="pytest" tests="4">
+  <testcase classname="tests.test_db" name="test_unit">
+    <properties><property name="phases" value="unit_tests"/></properties>
+  </testcase>
+  <testcase classname="tests.test_db" name="test_unit_and_smoke">
+    <properties><property name="phases" value="unit_tests,smoke_tests"/></properties>
+    <failure message="AssertionError: boom&#10;assert 0">trace</failure>
+  </testcase>
+  <testcase classname="tests.test_db" name="test_smoke_skipped">
+    <properties><property name="phases" value="smoke_tests"/></properties>
+    <skipped message="no server"/>
+  </testcase>
+  <testcase classname="tests.test_db" name="test_untagged"/>
+</testsuite></testsuites>
+"""
+
+
+class TestPytestSelection:
+    """Tests for category selection"""
+
+    def test_required_and_excluded_markers(self):
+        """A test matches when it is in the file, has every required marker and no excluded one"""
+        selection = PytestSelection("integration_tests", "tests/test_db.py", ("integration", "database"), ("azure",))
+
+        assert selection.marker_expression == "integration and database and not azure"
+        assert selection.matches("tests/test_db.py", {"integration", "database", "slow"})
+        assert not selection.matches("tests/test_db.py", {"integration", "database", "azure"})
+        assert not selection.matches("tests/test_db.py", {"integration"})
+        assert not selection.matches("tests/test_other.py", {"integration", "database"})
+
+    def test_selections_round_trip(self):
+        """Selections survive the environment variable encoding"""
+        selections = [PytestSelection("health_check_tests", "tests/test_health.py"),
+                      PytestSelection("unit_tests", "tests/test_db.py", ("unit",))]
+        assert pytest_phases.load_selections(pytest_phases.dump_selections(selections)) == selections
+        assert selections[0].marker_expression is None
+
+
+class TestSplitJunit:
+    """Tests for splitting a shared JUnit report"""
+
+    def test_tests_count_in_every_category_they_belong_to(self, tmp_path):
+        """Tallies follow the phases property; untagged tests are ignored"""
+        path = tmp_path / "junit.xml"
+        path.write_text(JUNIT_XML, encoding="utf-8")
+
+        tallies = pytest_phases.split_junit(path, ["unit_tests", "smoke_tests", "enterprise_tests"])
+
+        unit, smoke, enterprise = tallies["unit_tests"], tallies["smoke_tests"], tallies["enterprise_tests"]
+        assert (unit.passed, unit.failed, unit.skipped) == (1, 1, 0)
+        assert (smoke.passed, smoke.failed, smoke.skipped) == (0, 1, 1)
+        assert unit.failures == ["FAILED tests.test_db::test_unit_and_smoke: AssertionError: boom"]
+        assert not unit.success and not smoke.success
+        assert not enterprise.success and enterprise.summary() == "No tests collected"
@@ -0,0 +1,127 @@
+"""
+Resource History Tests
+
+Tests for scripts/resource_history.py including:
+- Recording runs into the SQLite history
+- Rolling median baselines over successful runs only
+- Regression detection against thresholds and noise floors
+- The gate used by the monitored-test scripts
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+
+def _load_script():
+    """Import scripts/resource_history.py as a module"""
+    script_path = project_root / "scripts" / "resource_history.py"
+    spec = importlib.util.spec_from_file_location("resource_history", script_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+resource_history = _load_script()
+
+TEST_NAME = "WileyWidget.UiTests.EndToEndStartupTests.E2E_01_FullApplicationStartup_WithTiming"
+
+
+def _summary(cpu_seconds, peak_rss_mb):
+    return {"samples": 100, "cpu_seconds": cpu_seconds, "rss_mb": {"max": peak_rss_mb},
+            "cpu_percent": {"p95": 150.0}}
+
+
+def _record(history, wall_s, cpu_seconds, peak_rss_mb, exit_code=0):
+    metrics = resource_history.run_metrics(wall_s, _summary(cpu_seconds, peak_rss_mb), exit_code)
+    return history.record(TEST_NAME, metrics, source="test")
+
+
+class TestBaseline:
+    """Tests for the rolling baseline"""
+
+    def test_median_of_successful_runs(self, tmp_path):
+        """Failed runs are stored but excluded; the baseline is a per-metric median"""
+        with resource_history.ResourceHistory(tmp_path / "history.sqlite") as history:
+            _record(history, 10.0, 8.0, 400.0)
+            _record(history, 30.0, 20.0, 900.0, exit_code=1)
+            _record(history, 12.0, 9.0, 420.0)
+            assert history.baseline(TEST_NAME) == {}
+            _record(history, 11.0, 30.0, 410.0)
+
+            assert history.baseline(TEST_NAME) == {"wall_s": 11.0, "cpu_seconds": 9.0, "peak_rss_mb": 410.0}
+            assert len(history.recent(TEST_NAME)) == 3
+
+    def test_window_keeps_latest_runs(self, tmp_path):
+        """Only the newest runs inside the window form the baseline"""
+        with resource_history.ResourceHistory(tmp_path / "history.sqlite") as history:
+            for wall in (100.0, 100.0, 100.0, 10.0, 10.0, 10.0):
+                _record(history, wall, 5.0, 300.0)
+            assert history.baseline(TEST_NAME, window=3)["wall_s"] == 10.0
+
+
+class TestRegressionGate:
+    """Tests for regression detection"""
+
+    def test_threshold_and_noise_floor(self, tmp_path):
+        """A metric regresses only past both its relative threshold and its absolute floor"""
+        with resource_history.ResourceHistory(tmp_path / "history.sqlite") as history:
+            for _ in range(3):
+                _record(history, 20.0, 2.0, 500.0)
+            current = resource_history.run_metrics(30.0, _summary(2.9, 520.0), 0)
+            baseline, regressions = history.check(TEST_NAME, current)
+
+        assert baseline["wall_s"] == 20.0
+        # CPU grew 45% but by under a second; RSS grew 20 MB, below the 25 MB floor
+        assert [item.metric for item in regressions] == ["wall_s"]
+        assert regressions[0].change_pct == 50.0
+
+    def test_gate_run_compares_against_previous_runs(self, tmp_path):
+        """The gate records the run, excludes it from its own baseline and reports the table"""
+        path = tmp_path / "history.sqlite"
+        lines = []
+        for _ in range(3):
+            assert resource_history.gate_run(TEST_NAME, 20.0, _summary(10.0, 500.0), 0,
+                                             history_path=path, report=lines.append) == []
+
+        lines.clear()
+        regressions = resource_history.gate_run(TEST_NAME, 21.0, _summary(10.5, 700.0), 0,
+                                                history_path=path, report=lines.append)
+        assert [item.metric for item in regressions] == ["peak_rss_mb"]
+        assert lines[0].startswith("metric")
+        assert any("peak_rss_mb" in line and "REGRESSION" in line for line in lines)
+
+        with resource_history.ResourceHistory(path) as history:
+            assert len(history.recent(TEST_NAME)) == 4
+
+    def test_runs_without_samples_are_ignored(self, tmp_path):
+        """Unsampled or partly sampled runs are not recorded, and rows missing a metric stay out of the baseline"""
+        path = tmp_path / "history.sqlite"
+        lines = []
+        assert resource_history.gate_run(TEST_NAME, 20.0, {}, 0, history_path=path, report=lines.append) == []
+        assert lines == ["No resource samples collected; run not recorded or compared against the baseline"]
+
+        assert resource_history.gate_run(TEST_NAME, 200.0, _summary(10.0, 500.0), 0, history_path=path,
+                                         report=lines.append, complete=False) == []
+        assert lines[1] == "Run outlived the sampling window; not recorded or compared against the baseline"
+
+        with resource_history.ResourceHistory(path) as history:
+            assert history.recent(TEST_NAME) == []
+            for _ in range(3):
+                _record(history, 20.0, 10.0, 500.0)
+            _record(history, 20.0, 0.0, 0.0)
+            _record(history, 20.0, 0.0, 0.0)
+            assert history.baseline(TEST_NAME) == {"wall_s": 20.0, "cpu_seconds": 10.0, "peak_rss_mb": 500.0}
+
+    def test_failed_run_is_not_gated(self, tmp_path):
+        """A failing test run is recorded without comparison"""
+        path = tmp_path / "history.sqlite"
+        for _ in range(3):
+            resource_history.gate_run(TEST_NAME, 20.0, _summary(10.0, 500.0), 0, history_path=path, report=print)
+        assert resource_history.gate_run(TEST_NAME, 90.0, _summary(50.0, 2000.0), 1,
+                                         history_path=path, report=print) == []
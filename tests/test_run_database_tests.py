@@ -0,0 +1,239 @@
+"""
+Database Test Runner Tests
+
+Tests for scripts/run_database_tests.py including:
+- Concurrent execution of independent phases
+- Dependency ordering and skipping after a failed prerequisite
+- Cycle and unknown dependency detection
+- Prefixed output streaming and stable report ordering
+- One shared pytest run split back into per-category results
+"""
+
+import importlib.util
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+
+def _load_script():
+    """Import scripts/run_database_tests.py as a module"""
+    script_path = project_root / "scripts" / "run_database_tests.py"
+    spec = importlib.util.spec_from_file_location("run_database_tests", script_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+run_database_tests = _load_script()
+Phase = run_database_tests.Phase
+PhaseScheduler = run_database_tests.PhaseScheduler
+
+
+def _sleeper(seconds, result=True, events=None, name=None):
+    def run():
+        if events is not None:
+            events.append(("start", name))
+        time.sleep(seconds)
+        if events is not None:
+            events.append(("end", name))
+        return result
+    return run
+
+
+def _quiet(*args, **kwargs):
+    pass
+
+
+class TestPhaseScheduler:
+    """Tests for the dependency-graph scheduler"""
+
+    def test_independent_phases_run_concurrently(self):
+        """Pipeline time approaches the critical path rather than the sum of phases"""
+        phases = [Phase("Build", _sleeper(0.2))] + [
+            Phase(f"Tests {i}", _sleeper(0.3), ("Build",)) for i in range(4)
+        ]
+        scheduler = PhaseScheduler(phases, max_workers=4, log=_quiet)
+
+        started = time.perf_counter()
+        assert scheduler.run() is True
+        elapsed = time.perf_counter() - started
+
+        assert elapsed < 0.9  # sequential would take 1.4s
+        length, chain = scheduler.critical_path()
+        assert chain[0] == "Build" and len(chain) == 2
+        assert length == pytest.approx(0.5, abs=0.1)
+
+    def test_dependencies_finish_first_and_parallelism_is_bounded(self):
+        """Dependents start only after their prerequisite, never more than max_workers at once"""
+        events = []
+        running, peak = [0], [0]
+        lock = threading.Lock()
+
+        def tracked():
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.05)
+            with lock:
+                running[0] -= 1
+            return True
+
+        phases = [Phase("Build", _sleeper(0.05, events=events, name="Build"))]
+        phases += [Phase(f"Tests {i}", tracked, ("Build",)) for i in range(6)]
+        phases += [Phase("Report", _sleeper(0, events=events, name="Report"), ("Tests 0", "Tests 5"))]
+        scheduler = PhaseScheduler(phases, max_workers=2, log=_quiet)
+
+        assert scheduler.run() is True
+        assert peak[0] == 2
+        assert events[:2] == [("start", "Build"), ("end", "Build")]
+        assert events[-1] == ("end", "Report")
+
+    def test_failed_prerequisite_skips_dependents(self):
+        """A failing build skips the test phases but independent phases still run"""
+        phases = [
+            Phase("Build", _sleeper(0, result=False)),
+            Phase("Unit Tests", _sleeper(0), ("Build",)),
+            Phase("Lint", _sleeper(0)),
+        ]
+        scheduler = PhaseScheduler(phases, log=_quiet)
+
+        assert scheduler.run() is False
+        statuses = {name: outcome.status for name, outcome in scheduler.outcomes.items()}
+        assert statuses == {"Build": "failed", "Unit Tests": "skipped", "Lint": "passed"}
+
+    def test_exception_stops_new_phases(self):
+        """A phase that raises is recorded as an error and nothing new is started"""
+        def boom():
+            raise RuntimeError("boom")
+
+        phases = [Phase("Setup", boom), Phase("Later", _sleeper(0), ("Other",)), Phase("Other", _sleeper(0.1))]
+        scheduler = PhaseScheduler(phases, max_workers=1, log=_quiet)
+
+        assert scheduler.run() is False
+        assert scheduler.outcomes["Setup"].error == "boom"
+        assert scheduler.outcomes["Later"].status == "skipped"
+
+    def test_invalid_graphs_are_rejected(self):
+        """Cycles and unknown dependencies fail before anything runs"""
+        with pytest.raises(ValueError, match="cycle"):
+            PhaseScheduler([Phase("A", _sleeper(0), ("B",)), Phase("B", _sleeper(0), ("A",))])
+        with pytest.raises(ValueError, match="unknown"):
+            PhaseScheduler([Phase("A", _sleeper(0), ("Missing",))])
+
+
+class TestRunnerPhases:
+    """Tests for phases run through DatabaseTestRunner"""
+
+    def test_output_is_prefixed_and_results_keep_phase_order(self, capsys):
+        """Commands stream under their phase name and results follow the declared order"""
+        runner = run_database_tests.DatabaseTestRunner()
+
+        def slow():
+            success, output = runner.run_command(
+                [sys.executable, "-c", "import time; time.sleep(0.2); print('slow done')"], "slow")
+            runner.test_results["slow"] = {"success": success, "output": output}
+            return success
+
+        def fast():
+            success, output = runner.run_command([sys.executable, "-c", "print('fast done')"], "fast")
+            runner.test_results["fast"] = {"success": success, "output": output}
+            return success
+
+        assert runner.run_phases([Phase("Slow", slow, (), "slow"), Phase("Fast", fast, (), "fast")])
+
+        out = capsys.readouterr().out
+        assert "[Slow] slow done" in out and "[Fast] fast done" in out
+        assert list(runner.test_results) == ["slow", "fast"]
+        assert runner.test_results["slow"]["output"].strip() == "slow done"
+
+    def test_streamed_command_times_out(self):
+        """A streamed command past its timeout is killed and reported as failed"""
+        runner = run_database_tests.DatabaseTestRunner()
+        result = {}
+
+        def hang():
+            result["value"] = runner.run_command(
+                [sys.executable, "-c", "import time; print('waiting', flush=True); time.sleep(30)"],
+                "hang", timeout=1)
+            return result["value"][0]
+
+        started = time.perf_counter()
+        assert runner.run_phases([Phase("Hang", hang)]) is False
+        assert time.perf_counter() - started < 10
+        success, output = result["value"]
+        assert success is False and "waiting" in output and "Timeout after 1 seconds" in output
+
+
+SPLIT_TESTS = """import pytest
+
+@pytest.mark.unit
+def test_unit():
+    pass
+
+@pytest.mark.unit
+@pytest.mark.smoke
+def test_unit_and_smoke():
+    assert False, "smoke broke"
+
+def test_unmarked():
+    pass
+"""
+
+
+class TestSplitRuns:
+    """Tests for the shared pytest run"""
+
+    def test_one_run_split_per_category(self, tmp_path, monkeypatch):
+        """Categories share one pytest process and each gets its own result"""
+        (tmp_path / "pytest.ini").write_text("[pytest]\nmarkers =\n    unit\n    smoke\n", encoding="utf-8")
+        (tmp_path / "tests").mkdir()
+        (tmp_path / "tests" / "test_db.py").write_text(SPLIT_TESTS, encoding="utf-8")
+        monkeypatch.setattr(run_database_tests, "project_root", tmp_path)
+
+        runner = run_database_tests.DatabaseTestRunner()
+        selection = run_database_tests.PytestSelection
+        monkeypatch.setattr(runner, "pytest_selections", lambda: {
+            "unit_tests": selection("unit_tests", "tests/test_db.py", ("unit",)),
+            "smoke_tests": selection("smoke_tests", "tests/test_db.py", ("smoke",)),
+            "enterprise_tests": selection("enterprise_tests", "tests/test_db.py", ("enterprise",)),
+        })
+
+        keys = ["unit_tests", "smoke_tests", "enterprise_tests"]
+        assert runner.run_split_tests(keys) is True
+        assert [runner.record_split_result(key) for key in keys] == [False, False, False]
+
+        unit = runner.test_results["unit_tests"]["output"]
+        assert unit.startswith("1 passed, 1 failed")
+        assert "test_unit_and_smoke: AssertionError: smoke broke" in unit
+        assert runner.test_results["smoke_tests"]["output"].startswith("0 passed, 1 failed")
+        assert runner.test_results["enterprise_tests"]["output"] == "No tests collected"
+
+    def test_failed_run_marks_every_category(self, tmp_path, monkeypatch):
+        """Without a JUnit report every category fails with the run's output"""
+        monkeypatch.setattr(run_database_tests, "project_root", tmp_path)
+        runner = run_database_tests.DatabaseTestRunner()
+
+        assert runner.run_split_tests(["unit_tests", "smoke_tests"]) is False
+        assert set(runner.test_results) == {"unit_tests", "smoke_tests"}
+        assert not any(result["success"] for result in runner.test_results.values())
+
+    def test_phase_graph_modes(self):
+        """Split mode adds one shared run; separate mode runs each category after the build"""
+        split = {phase.name: phase for phase in run_database_tests.DatabaseTestRunner().test_phases()}
+        assert split["Python Tests"].depends_on == (".NET Build",)
+        assert split["Unit Tests"].depends_on == ("Python Tests",)
+
+        separate = {phase.name: phase
+                    for phase in run_database_tests.DatabaseTestRunner(separate_runs=True).test_phases()}
+        assert "Python Tests" not in separate
+        assert separate["Unit Tests"].depends_on == (".NET Build",)
+        assert [phase.result_key for phase in separate.values() if phase.result_key] == \
+               [phase.result_key for phase in split.values() if phase.result_key]
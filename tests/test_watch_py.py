@@ -0,0 +1,301 @@
+"""
+Python Watch Mode Tests
+
+Tests for scripts/watch-py.py including:
+- Compiled glob ignore patterns
+- Debounced, coalesced restarts for bursts of changes
+- Restart waiting for the previous process to exit
+- Test selection from the import-dependency map
+- Warm worker runs forked from a pre-imported interpreter
+"""
+
+import importlib.util
+import signal
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("watchfiles")
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+
+def _load_script():
+    """Import scripts/watch-py.py as a module"""
+    script_path = project_root / "scripts" / "watch-py.py"
+    spec = importlib.util.spec_from_file_location("watch_py", script_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+watch_py = _load_script()
+
+SLEEPER = [sys.executable, "-c", "import time; print('started', flush=True); time.sleep(60)"]
+
+
+def _wait_for(predicate, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+@pytest.fixture
+def running_watcher(tmp_path):
+    """Fixture providing a watcher running on a background thread over tmp_path"""
+    watcher = watch_py.PythonWatcher(SLEEPER, [str(tmp_path)], ["__pycache__", "*.pyc", "logs/"],
+                                     debounce_ms=200)
+    thread = threading.Thread(target=watcher.run, daemon=True)
+    thread.start()
+    assert _wait_for(lambda: watcher.process is not None)
+    time.sleep(0.5)  # let the native watcher register before changes are made
+    yield watcher
+    watcher.stop_event.set()
+    thread.join(timeout=15)
+    assert watcher.process.poll() is not None
+
+
+class TestIgnoreMatcher:
+    """Tests for compiled ignore patterns"""
+
+    def test_component_and_path_patterns(self, tmp_path):
+        """Name globs match any component; slash patterns match relative paths"""
+        matcher = watch_py.IgnoreMatcher(["__pycache__", "*.pyc", "logs/", "docs/build"], [tmp_path])
+
+        assert matcher.matches(tmp_path / "pkg" / "__pycache__" / "mod.cpython-311.pyc")
+        assert matcher.matches(tmp_path / "tool.pyc")
+        assert matcher.matches(tmp_path / "logs" / "app.txt")
+        assert matcher.matches(tmp_path / "docs" / "build" / "index.html")
+        assert not matcher.matches(tmp_path / "docs" / "guide.md")
+        assert not matcher.matches(tmp_path / "catalogs" / "module.py")
+
+
+class TestDebouncedRestarts:
+    """Tests for the event-driven watcher core"""
+
+    def test_burst_of_changes_restarts_once(self, running_watcher, tmp_path):
+        """Saving many files at once coalesces into a single restart"""
+        first = running_watcher.process
+        for index in range(50):
+            (tmp_path / f"module_{index}.py").write_text(f"VALUE = {index}\n", encoding="utf-8")
+
+        assert _wait_for(lambda: running_watcher.restart_count == 1)
+        time.sleep(1.0)
+        assert running_watcher.restart_count == 1
+        assert first.poll() is not None
+        assert running_watcher.process is not first
+
+    def test_ignored_changes_do_not_restart(self, running_watcher, tmp_path):
+        """Bytecode and log output never trigger a restart"""
+        (tmp_path / "__pycache__").mkdir()
+        (tmp_path / "__pycache__" / "mod.cpython-311.pyc").write_bytes(b"\0")
+        (tmp_path / "logs").mkdir()
+        (tmp_path / "logs" / "run.txt").write_text("log", encoding="utf-8")
+
+        time.sleep(1.0)
+        assert running_watcher.restart_count == 0
+
+    def test_default_ignored_directories_do_not_restart(self, running_watcher, tmp_path):
+        """Virtualenvs, node_modules, build output and editor swap files stay ignored with custom patterns"""
+        for name in ("node_modules/x.py", ".venv/lib/site.py", "bin/Debug/app.py", ".pytest_cache/v/cache/nodeids",
+                     ".module.py.swp", "module.py~"):
+            path = tmp_path / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("VALUE = 1\n", encoding="utf-8")
+
+        time.sleep(1.0)
+        assert running_watcher.restart_count == 0
+        assert running_watcher.watch_filter(watch_py.watchfiles.Change.modified, str(tmp_path / "module.py"))
+
+
+@pytest.fixture
+def impact_project(tmp_path):
+    """Fixture providing a small project with scripts, helpers and tests"""
+    files = {
+        "scripts/report-tool.py": "import json\n",
+        "scripts/shared.py": "VALUE = 1\n",
+        "scripts/cli.py": "from shared import VALUE\n",
+        "tools/python/xaml_sleuth.py": "import re\n",
+        "tools/python/clr_tests/conftest.py": "",
+        "tools/python/clr_tests/helpers/__init__.py": "",
+        "tools/python/clr_tests/helpers/dotnet_utils.py": "import os\n",
+        "tools/python/clr_tests/helpers/parity.py": "from . import dotnet_utils\n",
+        "tools/python/clr_tests/test_parity.py": "from .helpers.parity import dotnet_utils\n",
+        "tools/python/clr_tests/test_sleuth.py": "import xaml_sleuth\n",
+        "tests/test_report_tool.py": 'SCRIPT = "scripts/report-tool.py"\n',
+        "tests/test_cli.py": "import scripts.cli\n",
+        "tests/fixtures/data.json": "{}",
+    }
+    for name, content in files.items():
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+    return tmp_path
+
+
+class TestTestImpact:
+    """Tests for selecting the tests affected by a change"""
+
+    def test_transitive_and_script_path_dependencies(self, impact_project):
+        """Imports, relative imports, upward sys.path lookups and script paths all count"""
+        impact = watch_py.TestImpactMap(impact_project).refresh()
+
+        def select(*paths):
+            return impact.impacted_tests(impact_project / path for path in paths)
+
+        assert select("tools/python/clr_tests/helpers/dotnet_utils.py") == [
+            "tools/python/clr_tests/test_parity.py"]
+        assert select("tools/python/xaml_sleuth.py") == ["tools/python/clr_tests/test_sleuth.py"]
+        assert select("scripts/report-tool.py") == ["tests/test_report_tool.py"]
+        assert select("scripts/shared.py") == ["tests/test_cli.py"]
+        assert select("tests/test_cli.py", "scripts/report-tool.py") == [
+            "tests/test_cli.py", "tests/test_report_tool.py"]
+
+    def test_untraceable_changes_run_everything(self, impact_project):
+        """Fixtures, conftest files and deletions fall back to the full suite"""
+        impact = watch_py.TestImpactMap(impact_project).refresh()
+
+        assert impact.impacted_tests([impact_project / "tests" / "fixtures" / "data.json"]) is None
+        assert impact.impacted_tests([impact_project / "tools/python/clr_tests/conftest.py"]) is None
+        assert impact.impacted_tests([impact_project / "scripts" / "gone.py"]) is None
+
+    def test_cache_reparses_only_edited_files(self, impact_project, monkeypatch):
+        """A fresh map reuses cached dependencies for unchanged files"""
+        watch_py.TestImpactMap(impact_project).refresh()
+        assert (impact_project / ".pytest_cache" / "watch-py-impact.json").exists()
+
+        shared = impact_project / "scripts" / "shared.py"
+        shared.write_text("import cli\nVALUE = 2\n", encoding="utf-8")
+        parsed = []
+        original = watch_py.TestImpactMap._parse_dependencies
+        monkeypatch.setattr(watch_py.TestImpactMap, "_parse_dependencies",
+                            lambda self, path, *args: parsed.append(path.name) or original(self, path, *args))
+
+        impact = watch_py.TestImpactMap(impact_project).refresh()
+        assert parsed == ["shared.py"]
+        assert impact.files["scripts/shared.py"]["deps"] == ["scripts/cli.py"]
+
+    def test_restart_runs_only_selected_tests(self, impact_project, monkeypatch):
+        """The pytest path arguments are replaced by the impacted test files"""
+        impact = watch_py.TestImpactMap(impact_project).refresh()
+        watcher = watch_py.PythonWatcher([sys.executable, "-m", "pytest", "-q", str(impact_project / "tests")],
+                                         [str(impact_project)], test_impact=impact)
+        commands = []
+        monkeypatch.setattr(watcher, "start_process", lambda command=None: commands.append(command) or True)
+
+        watcher.restart({(watch_py.watchfiles.Change.modified, str(impact_project / "scripts" / "shared.py"))})
+        watcher.restart({(watch_py.watchfiles.Change.modified, str(impact_project / "tools" / "python" / "xaml_sleuth.py")),
+                         (watch_py.watchfiles.Change.modified, str(impact_project / "scripts" / "report-tool.py"))})
+
+        assert commands[0] == [sys.executable, "-m", "pytest", "-q", str(impact_project / "tests" / "test_cli.py")]
+        assert commands[1][4:] == [str(impact_project / "tests" / "test_report_tool.py"),
+                                   str(impact_project / "tools" / "python" / "clr_tests" / "test_sleuth.py")]
+        assert watcher.restart_count == 2
+
+    def test_cache_writes_do_not_restart(self, impact_project):
+        """Cache files written by the run and by the impact map never trigger another run"""
+        impact = watch_py.TestImpactMap(impact_project, cache_path=impact_project / "impact.json").refresh()
+        nodeids = impact_project / ".pytest_cache" / "v" / "cache" / "nodeids"
+        code = (f"import pathlib, time; path = pathlib.Path({str(nodeids)!r}); "
+                "path.parent.mkdir(parents=True, exist_ok=True); path.write_text(str(time.time())); time.sleep(60)")
+        watcher = watch_py.PythonWatcher([sys.executable, "-c", code], [str(impact_project)], debounce_ms=200,
+                                         test_impact=impact)
+        thread = threading.Thread(target=watcher.run, daemon=True)
+        thread.start()
+        try:
+            assert _wait_for(nodeids.exists)
+            time.sleep(1.0)
+            assert watcher.restart_count == 0
+
+            (impact_project / "tests" / "test_cli.py").write_text("import scripts.cli\nX = 1\n", encoding="utf-8")
+            assert _wait_for(lambda: watcher.restart_count == 1)
+            time.sleep(1.5)
+            assert watcher.restart_count == 1
+        finally:
+            watcher.stop_event.set()
+            thread.join(timeout=15)
+
+    def test_option_values_are_kept(self, impact_project):
+        """Only positional test paths are replaced; paths given as option values stay"""
+        (impact_project / "pytest.ini").write_text("[pytest]\n", encoding="utf-8")
+        impact = watch_py.TestImpactMap(impact_project).refresh()
+        watcher = watch_py.PythonWatcher(["pytest", "-c", str(impact_project / "pytest.ini"),
+                                          "--rootdir", str(impact_project / "tools"), "--cov",
+                                          str(impact_project / "scripts"), "--cov", "-q",
+                                          str(impact_project / "tests")],
+                                         [str(impact_project)], test_impact=impact)
+
+        selected = watcher.impact_command(["tests/test_cli.py"])
+        assert selected == ["pytest", "-c", str(impact_project / "pytest.ini"),
+                            "--rootdir", str(impact_project / "tools"), "--cov",
+                            str(impact_project / "scripts"), "--cov", "-q",
+                            str(impact_project / "tests" / "test_cli.py")]
+
+
+@pytest.fixture
+def warm_worker():
+    """Fixture providing a started warm worker that collects child output"""
+    if not watch_py.WarmWorker.available():
+        pytest.skip("warm worker needs os.fork")
+    lines = []
+    worker = watch_py.WarmWorker(preload=["json", "email.mime.text"], output=lines.append).start()
+    worker.lines = lines
+    yield worker
+    worker.close()
+
+
+class TestWarmWorker:
+    """Tests for forking Python commands from a warm worker"""
+
+    def test_child_sees_preloaded_modules_and_exit_code(self, warm_worker):
+        """A forked child starts with the preloaded modules and reports its exit status"""
+        assert warm_worker.loaded == ["json", "email.mime.text"]
+        code = "import sys; print(sys.argv[1:], 'email.mime.text' in sys.modules); sys.exit(3)"
+
+        run = warm_worker.run([sys.executable, "-c", code, "arg"])
+
+        assert run.wait(10) == 3
+        assert _wait_for(lambda: "['arg'] True" in warm_worker.lines)
+
+    def test_module_and_script_commands_run_in_cwd(self, warm_worker, tmp_path):
+        """-m modules resolve from the working directory and scripts run as __main__"""
+        (tmp_path / "greet.py").write_text(
+            "import sys\nif __name__ == '__main__':\n    print('hello', *sys.argv[1:])\n", encoding="utf-8")
+
+        assert warm_worker.run([sys.executable, "-m", "greet", "module"], cwd=tmp_path).wait(10) == 0
+        assert warm_worker.run([sys.executable, str(tmp_path / "greet.py"), "script"]).wait(10) == 0
+        assert _wait_for(lambda: {"hello module", "hello script"} <= set(warm_worker.lines))
+
+    def test_other_commands_fall_back_to_subprocess(self, warm_worker):
+        """Non-Python commands are not run by the worker"""
+        assert not warm_worker.can_run(["echo", "hi"])
+        assert not warm_worker.can_run([sys.executable, "--version"])
+
+        watcher = watch_py.PythonWatcher(["echo", "hi"], warm_worker=warm_worker)
+        assert watcher.start_process()
+        assert isinstance(watcher.process, subprocess.Popen)
+        watcher.process.wait(10)
+        watcher.process.stdout.close()
+
+    def test_restart_stops_forked_child(self, warm_worker):
+        """Stopping a warm run kills the forked child's process group"""
+        watcher = watch_py.PythonWatcher(SLEEPER, warm_worker=warm_worker)
+        assert watcher.start_process()
+        first = watcher.process
+        assert isinstance(first, watch_py.WarmRun)
+        assert _wait_for(lambda: "started" in warm_worker.lines)
+
+        assert watcher.start_process()
+        assert first.returncode == -signal.SIGTERM
+        watcher.stop_process()
+        assert watcher.process.returncode is not None
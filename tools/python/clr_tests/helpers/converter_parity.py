@@ -0,0 +1,175 @@
+"""Differential checks between Python converter models and compiled WPF converters."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any
+
+from System import Activator, Double, Int32, Object  # type: ignore[attr-defined]
+from System import Decimal as NetDecimal  # type: ignore[attr-defined]
+from System.Globalization import CultureInfo  # type: ignore[attr-defined]
+
+from . import dotnet_utils
+
+CONVERTER_NAMESPACE = "WileyWidget"
+
+# WPF named colors that the Python models refer to by name.
+WPF_NAMED_COLORS = {
+    "black": "#FF000000",
+    "blue": "#FF0000FF",
+    "gray": "#FF808080",
+    "green": "#FF008000",
+    "orange": "#FFFFA500",
+    "red": "#FFFF0000",
+    "white": "#FFFFFFFF",
+}
+
+_EMBEDDED_HEX = re.compile(r"\(#([0-9A-Fa-f]{6})\)")
+_BARE_HEX = re.compile(r"#([0-9A-Fa-f]{6}|[0-9A-Fa-f]{8})")
+
+
+@dataclass
+class ParityMismatch:
+    """A single input where the Python model and the .NET converter disagree."""
+
+    converter_name: str
+    value: Any
+    parameter: Any
+    model_output: Any
+    dotnet_output: Any
+
+
+def normalize_model_output(output: Any) -> Any:
+    """Map a Python model result onto the comparable form used for .NET results."""
+    if isinstance(output, bool) or not isinstance(output, str):
+        return output
+    embedded = _EMBEDDED_HEX.search(output)
+    if embedded:
+        return f"#FF{embedded.group(1).upper()}"
+    bare = _BARE_HEX.fullmatch(output.strip())
+    if bare:
+        digits = bare.group(1).upper()
+        return f"#FF{digits}" if len(digits) == 6 else f"#{digits}"
+    return WPF_NAMED_COLORS.get(output.strip().lower(), output)
+
+
+def normalize_dotnet_output(output: Any) -> Any:
+    """Reduce a boxed .NET converter result to a plain comparable Python value."""
+    if output is None or isinstance(output, (bool, int, float, str)):
+        return output
+    color = getattr(output, "Color", None)
+    if color is not None:
+        return str(color.ToString()).upper()
+    # Visibility, FontWeight and other enum-like structs render their name.
+    return str(output.ToString())
+
+
+def box_value(value: Any) -> Any:
+    """Box a Python input as the CLR type a WPF binding would hand the converter."""
+    if value is None or isinstance(value, (bool, str)):
+        # pythonnet marshals these to System.Boolean / System.String directly.
+        return value
+    if isinstance(value, int):
+        return Int32(value)
+    if isinstance(value, float):
+        return Double(value)
+    if isinstance(value, Decimal):
+        return NetDecimal.Parse(str(value), CultureInfo.InvariantCulture)
+    return Object()
+
+
+class ConverterParityChecker:
+    """Runs batched inputs through both converter implementations and collects mismatches.
+
+    Converter types and instances are resolved once per checker and cached, so a
+    long differential run pays the reflection cost only on the first batch.
+    """
+
+    def __init__(self, assemblies_dir, assembly_name: str = "WileyWidget"):
+        self.assemblies_dir = assemblies_dir
+        self.assembly_name = assembly_name
+        self._instances: dict[str, Any] = {}
+        self._target_type = Object().GetType()
+        self._culture = CultureInfo.InvariantCulture
+
+    def converter(self, converter_name: str):
+        """Return the cached IValueConverter instance for a converter class name."""
+        instance = self._instances.get(converter_name)
+        if instance is None:
+            converter_type = dotnet_utils.get_type(
+                self.assemblies_dir, self.assembly_name, f"{CONVERTER_NAMESPACE}.{converter_name}"
+            )
+            instance = Activator.CreateInstance(converter_type)
+            self._instances[converter_name] = instance
+        return instance
+
+    def convert_batch(self, converter_name: str, inputs: list[tuple[Any, Any]]) -> list[Any]:
+        """Convert a batch through the .NET converter, recording exceptions as results."""
+        converter = self.converter(converter_name)
+        target_type, culture = self._target_type, self._culture
+        boxed = [(box_value(value), parameter) for value, parameter in inputs]
+
+        outputs = []
+        for value, parameter in boxed:
+            try:
+                outputs.append(normalize_dotnet_output(converter.Convert(value, target_type, parameter, culture)))
+            except Exception as exc:
+                outputs.append(("raises", type(exc).__name__))
+        return outputs
+
+    def compare(
+        self,
+        converter_name: str,
+        inputs: Iterable[tuple[Any, Any]],
+        model_call: Callable[[Any, Any], Any],
+        batch_size: int = 1000,
+    ) -> list[ParityMismatch]:
+        """Compare the Python model against the .NET converter over all inputs."""
+        mismatches = []
+        batch: list[tuple[Any, Any]] = []
+
+        def flush():
+            dotnet_outputs = self.convert_batch(converter_name, batch)
+            for (value, parameter), dotnet_output in zip(batch, dotnet_outputs, strict=True):
+                try:
+                    model_output = normalize_model_output(model_call(value, parameter))
+                except Exception as exc:
+                    model_output = ("raises", type(exc).__name__)
+                if not _equivalent(model_output, dotnet_output):
+                    mismatches.append(
+                        ParityMismatch(converter_name, value, parameter, model_output, dotnet_output)
+                    )
+            batch.clear()
+
+        for pair in inputs:
+            batch.append(pair)
+            if len(batch) >= batch_size:
+                flush()
+        if batch:
+            flush()
+        return mismatches
+
+
+def _equivalent(model_output: Any, dotnet_output: Any) -> bool:
+    """Compare normalized outputs, allowing float rounding differences."""
+    if isinstance(model_output, float) and isinstance(dotnet_output, float):
+        return abs(model_output - dotnet_output) <= 1e-9 * max(1.0, abs(model_output))
+    if isinstance(model_output, str) and isinstance(dotnet_output, str):
+        return model_output.upper() == dotnet_output.upper()
+    return model_output == dotnet_output
+
+
+def format_mismatches(mismatches: list[ParityMismatch], limit: int = 20) -> str:
+    """Render mismatches as a readable, truncated report."""
+    lines = [f"{len(mismatches)} mismatch(es) between Python models and .NET converters:"]
+    for mismatch in mismatches[:limit]:
+        lines.append(
+            f"  {mismatch.converter_name}: value={mismatch.value!r} parameter={mismatch.parameter!r} "
+            f"model={mismatch.model_output!r} dotnet={mismatch.dotnet_output!r}"
+        )
+    if len(mismatches) > limit:
+        lines.append(f"  ... {len(mismatches) - limit} more")
+    return "\n".join(lines)